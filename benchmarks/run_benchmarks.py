@@ -0,0 +1,373 @@
+"""
+Benchmarks of EM-DAT validation
+
+Times schema validation, validation reports and the heaviest custom checks
+on EM-DAT frames of increasing size, built offline with
+`emtest.synthetic.generate_emdat` at a given error rate per check, or by
+scaling up the fake EM-DAT test file. Timings are written to a JSON results
+file, which can be compared with a stored baseline to detect regressions.
+
+Usage, from the repository root:
+
+    python benchmarks/run_benchmarks.py --sizes 1k 100k
+    python benchmarks/run_benchmarks.py --sizes 1k 100k 1M 10M --repeat 1
+    python benchmarks/run_benchmarks.py --data fake --error-rate 0
+    python benchmarks/run_benchmarks.py --save-baseline
+    python benchmarks/run_benchmarks.py --baseline benchmarks/baseline.json
+
+The process exits with status 1 if any benchmark is slower than its baseline
+timing by more than the threshold. Baselines depend on the machine and should
+be recorded on the machine that runs the comparison. 10M rows require several
+GB of memory.
+"""
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import warnings
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Optional
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent.parent
+FAKE_EMDAT_PATH = ROOT / 'data' / 'fake_emdat_test.xlsx'
+RESULTS_PATH = Path(__file__).resolve().parent / 'results.json'
+BASELINE_PATH = Path(__file__).resolve().parent / 'baseline.json'
+
+DEFAULT_SIZES = ['1k', '100k']
+DEFAULT_REPEAT = 3
+DEFAULT_DATA = 'synthetic'
+# Share of synthetic rows failing each check
+DEFAULT_ERROR_RATE = 0.01
+# Relative slowdown above which a benchmark is a regression
+DEFAULT_THRESHOLD = 0.2
+# Absolute slowdown in seconds below which timings are considered noise
+DEFAULT_MIN_DELTA = 0.01
+
+_SIZE_SUFFIXES = {'k': 1_000, 'm': 1_000_000}
+
+
+def parse_size(size: str) -> int:
+    """Parse a number of rows such as '1000', '100k' or '10M'"""
+    size = size.strip().lower()
+    factor = _SIZE_SUFFIXES.get(size[-1:], 1)
+    if factor != 1:
+        size = size[:-1]
+    return int(float(size) * factor)
+
+
+def load_fake_emdat(path: Path = FAKE_EMDAT_PATH) -> pd.DataFrame:
+    return pd.read_excel(
+        path,
+        index_col='DisNo.',
+        parse_dates=['Entry Date', 'Last Update']
+    )
+
+
+def scale_emdat(base: pd.DataFrame, n_rows: int) -> pd.DataFrame:
+    """Tile the rows of an EM-DAT frame up to `n_rows` rows
+
+    The DisNo. of repeated rows are renumbered to stay unique: their
+    sequence number is increased and, once it exceeds 9999, their year and
+    start and end years are moved back, so that the copies keep the
+    failure cases of the original rows. Invalid DisNo. are suffixed by the
+    copy number.
+    """
+    n_base = len(base)
+    positions = np.arange(n_rows) % n_base
+    copies = np.arange(n_rows) // n_base
+    df = base.iloc[positions].copy()
+
+    disno = base.index.to_series().str.extract(
+        r'^(?P<year>\d{4})-(?P<sequence>\d{4})-(?P<iso>.*)$'
+    )
+    matched = disno['year'].notna().to_numpy()
+    # Copies of base rows sharing an ISO get distinct sequence numbers modulo
+    # `stride`, a divisor of 10000, so they stay distinct after a year shift
+    rank = disno.groupby('iso', dropna=False).cumcount().to_numpy()
+    stride = min(d for d in range(1, 10_001)
+                 if 10_000 % d == 0 and d > rank.max())
+    number = copies * stride + rank[positions]
+    shift = number // 10_000
+
+    year = pd.to_numeric(disno['year']).fillna(0).to_numpy()[positions] \
+        - shift
+    new_disno = (
+        pd.Series(year.astype('int64')).astype(str)
+        + '-' + pd.Series(number % 10_000).astype(str).str.zfill(4)
+        + '-' + disno['iso'].to_numpy()[positions]
+    )
+    valid = matched[positions]
+    old_disno = base.index.to_numpy()[positions].astype(object)
+    old_disno[copies > 0] += '-' + copies[copies > 0].astype(str)
+    df.index = pd.Index(
+        np.where(valid, new_disno.to_numpy(dtype=object), old_disno),
+        name=base.index.name
+    )
+    for column in ('Start Year', 'End Year'):
+        df[column] = df[column] - np.where(valid, shift, 0)
+    return df
+
+
+def make_frame(
+        n_rows: int,
+        data: str = DEFAULT_DATA,
+        error_rate: float = DEFAULT_ERROR_RATE,
+) -> pd.DataFrame:
+    """Return a synthetic or scaled fake EM-DAT frame of `n_rows` rows"""
+    if data == 'fake':
+        return scale_emdat(load_fake_emdat(), n_rows)
+    from emtest.synthetic import INJECTED_CHECKS, generate_emdat
+
+    error_rates = dict.fromkeys(INJECTED_CHECKS, error_rate)
+    return generate_emdat(n_rows, error_rates=error_rates, seed=0)
+
+
+def get_benchmarks() -> dict[str, Callable[[pd.DataFrame], object]]:
+    """Return the benchmarked functions, keyed by name"""
+    from pandera.errors import SchemaErrors
+
+    from emtest import emdat_schema
+    from emtest.custom_checks import (
+        _convert_to_date,
+        check_external_ids,
+        check_GAUL_codes,
+        has_valid_GAUL_codes,
+        validate_external_id,
+    )
+    from emtest.utils import get_validation_report
+
+    def validate(df: pd.DataFrame) -> Optional[SchemaErrors]:
+        try:
+            emdat_schema.validate(df, lazy=True)
+        except SchemaErrors as err:
+            return err
+        return None
+
+    return {
+        'emdat_schema.validate': validate,
+        'get_validation_report': lambda df: get_validation_report(
+            df, emdat_schema, add_warnings=True
+        ),
+        'has_valid_GAUL_codes': lambda df: df['Admin Units'].map(
+            has_valid_GAUL_codes
+        ),
+        'check_GAUL_codes': lambda df: check_GAUL_codes(df['Admin Units']),
+        '_convert_to_date': lambda df: [
+            _convert_to_date(df, start_or_end, resolution)
+            for start_or_end in ('Start', 'End')
+            for resolution in ('year', 'month', 'day')
+        ],
+        'validate_external_id': lambda df: df['External IDs'].map(
+            validate_external_id
+        ),
+        'check_external_ids': lambda df: check_external_ids(
+            df['External IDs']
+        ),
+    }
+
+
+def time_function(
+        func: Callable[[pd.DataFrame], object],
+        df: pd.DataFrame,
+        repeat: int
+) -> float:
+    """Return the best wall time of `repeat` calls, in seconds"""
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func(df)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run_benchmarks(
+        sizes: list[int],
+        repeat: int = DEFAULT_REPEAT,
+        names: Optional[list[str]] = None,
+        data: str = DEFAULT_DATA,
+        error_rate: float = DEFAULT_ERROR_RATE,
+) -> dict:
+    """Run the benchmarks at each size and return the results"""
+    import emtest
+
+    benchmarks = get_benchmarks()
+    if names:
+        unknown = set(names) - set(benchmarks)
+        if unknown:
+            raise ValueError(f"Unknown benchmarks: {sorted(unknown)}")
+        benchmarks = {name: benchmarks[name] for name in names}
+    # Load the schema and reference data before timing
+    warm_up = make_frame(100, data, error_rate)
+    for func in benchmarks.values():
+        func(warm_up)
+    results = []
+    for n_rows in sizes:
+        df = make_frame(n_rows, data, error_rate)
+        for name, func in benchmarks.items():
+            seconds = time_function(func, df, repeat)
+            results.append({
+                'benchmark': name,
+                'rows': n_rows,
+                'seconds': seconds,
+                'repeat': repeat,
+            })
+            print(f"{name:<24} {n_rows:>10,} rows {seconds:>10.4f} s",
+                  flush=True)
+        del df
+    return {
+        'metadata': {
+            'date': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'emtest': emtest.__version__,
+            'python': platform.python_version(),
+            'pandas': pd.__version__,
+            'numpy': np.__version__,
+            'pandera': _version('pandera'),
+            'pyarrow': _version('pyarrow'),
+            'platform': platform.platform(),
+            'processor': platform.processor() or platform.machine(),
+            'data': data,
+            'error_rate': error_rate if data == 'synthetic' else None,
+        },
+        'results': results,
+    }
+
+
+def compare_results(
+        results: dict,
+        baseline: dict,
+        threshold: float = DEFAULT_THRESHOLD,
+        min_delta: float = DEFAULT_MIN_DELTA,
+) -> pd.DataFrame:
+    """Compare timings with a baseline
+
+    A benchmark is a regression if it is slower than its baseline by more
+    than `threshold`, relatively, and by more than `min_delta` seconds.
+
+    Returns
+    -------
+    pd.DataFrame
+        Baseline and current timings, their ratio and the regression flag,
+        for the benchmarks and sizes found in both.
+    """
+    keys = ['benchmark', 'rows']
+    current = pd.DataFrame(results['results'], columns=[*keys, 'seconds'])
+    previous = pd.DataFrame(baseline['results'], columns=[*keys, 'seconds'])
+    comparison = previous[[*keys, 'seconds']].merge(
+        current[[*keys, 'seconds']], on=keys,
+        suffixes=('_baseline', '_current')
+    )
+    comparison['ratio'] = (
+        comparison['seconds_current'] / comparison['seconds_baseline']
+    )
+    comparison['regression'] = (
+        (comparison['ratio'] > 1 + threshold)
+        & (comparison['seconds_current'] - comparison['seconds_baseline']
+           > min_delta)
+    )
+    return comparison
+
+
+def _version(package: str) -> Optional[str]:
+    try:
+        module = __import__(package)
+    except ImportError:
+        return None
+    return getattr(module, '__version__', None)
+
+
+def _write_json(data: dict, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, indent=2) + '\n', encoding='utf-8')
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description='Benchmark EM-DAT validation.'
+    )
+    parser.add_argument(
+        '--sizes', nargs='+', default=DEFAULT_SIZES,
+        help='numbers of rows, e.g., 1k 100k 1M 10M (default: %(default)s)'
+    )
+    parser.add_argument(
+        '--repeat', type=int, default=DEFAULT_REPEAT,
+        help='number of timed runs, the best is kept (default: %(default)s)'
+    )
+    parser.add_argument(
+        '--data', choices=['synthetic', 'fake'], default=DEFAULT_DATA,
+        help='synthetic data or scaled fake EM-DAT file '
+             '(default: %(default)s)'
+    )
+    parser.add_argument(
+        '--error-rate', type=float, default=DEFAULT_ERROR_RATE,
+        help='share of synthetic rows failing each check '
+             '(default: %(default)s)'
+    )
+    parser.add_argument(
+        '--benchmark', nargs='+', dest='names',
+        help='names of the benchmarks to run, by default all'
+    )
+    parser.add_argument(
+        '--output', type=Path, default=RESULTS_PATH,
+        help='results file (default: %(default)s)'
+    )
+    parser.add_argument(
+        '--baseline', type=Path, default=BASELINE_PATH,
+        help='baseline results file (default: %(default)s)'
+    )
+    parser.add_argument(
+        '--save-baseline', action='store_true',
+        help='also write the results to the baseline file'
+    )
+    parser.add_argument(
+        '--threshold', type=float, default=DEFAULT_THRESHOLD,
+        help='relative slowdown of a regression (default: %(default)s)'
+    )
+    parser.add_argument(
+        '--min-delta', type=float, default=DEFAULT_MIN_DELTA,
+        help='slowdown in seconds ignored as noise (default: %(default)s)'
+    )
+    args = parser.parse_args(argv)
+    # Benchmark the working tree, even if another emtest is installed
+    sys.path.insert(0, str(ROOT))
+
+    warnings.simplefilter('ignore')
+    sizes = [parse_size(size) for size in args.sizes]
+    results = run_benchmarks(
+        sizes, repeat=args.repeat, names=args.names, data=args.data,
+        error_rate=args.error_rate
+    )
+    _write_json(results, args.output)
+    print(f"Results written to {args.output}")
+    if args.save_baseline:
+        _write_json(results, args.baseline)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+    if not args.baseline.exists():
+        print(f"No baseline found at {args.baseline}")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text(encoding='utf-8'))
+    for key in ('data', 'error_rate'):
+        if baseline['metadata'].get(key) != results['metadata'][key]:
+            print(f"Warning: the baseline has another {key} setting")
+    comparison = compare_results(
+        results, baseline, threshold=args.threshold, min_delta=args.min_delta
+    )
+    print(comparison.to_string(index=False, float_format='{:.4f}'.format))
+    regressions = comparison[comparison['regression']]
+    if not regressions.empty:
+        print(f"{len(regressions)} regression(s) above "
+              f"{args.threshold:.0%} of the baseline")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
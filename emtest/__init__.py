@@ -1,7 +1,24 @@
 __version__ = '2026.05.0'
 __author__ = 'Damien Delforge, Valentin Wathelet'
 
-from emtest.validation_schemas import (
-    emdat_schema
-)
+# `import emtest` stays lightweight: pandera, the custom checks and the
+# reference data are only loaded when `emdat_schema` is first accessed. The
+# built schema is then cached with its module in `sys.modules`.
+_LAZY_ATTRIBUTES = {
+    'emdat_schema': 'emtest.validation_schemas',
+}
 
+
+def __getattr__(name: str):
+    if name in _LAZY_ATTRIBUTES:
+        import importlib
+
+        module = importlib.import_module(_LAZY_ATTRIBUTES[name])
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_ATTRIBUTES])
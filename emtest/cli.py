@@ -0,0 +1,261 @@
+"""Command line validation of EM-DAT files
+
+The `emtest` command validates EM-DAT xlsx files, given as paths, glob
+patterns or directories, and writes their failure cases to one report::
+
+    emtest archive/*.xlsx --add-warnings --output report.parquet
+
+Files are validated in parallel in worker processes, each loading the schema
+and reference data once. A single file is split in row partitions instead.
+The exit status is 0 if all files are valid, 1 if any has failure cases and
+2 if any cannot be read or validated.
+"""
+import argparse
+import glob
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Iterator, Optional, Sequence
+
+import pandas as pd
+
+REPORT_FORMATS = ('csv', 'parquet', 'jsonl')
+EXIT_VALID, EXIT_FAILURES, EXIT_ERROR = 0, 1, 2
+
+# Validation options of the current worker process
+_WORKER_OPTIONS: dict = {}
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Validate EM-DAT files and return the exit status"""
+    parser = _get_parser()
+    args = parser.parse_args(argv)
+    files = expand_paths(args.paths)
+    if not files:
+        parser.error("no EM-DAT file found")
+    report_format = args.format
+    if args.output is not None and report_format is None:
+        report_format = _report_format(args.output)
+        if report_format is None:
+            parser.error(
+                f"cannot infer the report format of {args.output}, "
+                "use --format"
+            )
+    if report_format == 'parquet' and not _has_pyarrow():
+        parser.error("parquet reports require pyarrow")
+    if args.summary and args.max_failures is not None:
+        parser.error("--summary and --max-failures cannot be combined")
+    if (len(files) == 1 and args.jobs is not None and args.jobs > 1
+            and (args.summary or args.max_failures is not None)):
+        parser.error(
+            "--summary and --max-failures validate a single file in one "
+            "process, --jobs requires several files"
+        )
+
+    options = {
+        'add_warnings': args.add_warnings,
+        'max_failures': args.max_failures,
+        'summary': args.summary,
+        'cache': args.cache,
+    }
+    jobs = args.jobs or os.cpu_count() or 1
+    reports, status = {}, EXIT_VALID
+    for file, report, error in validate_files(files, options, jobs):
+        if error is not None:
+            print(f"{file}: {error}", file=sys.stderr)
+            status = EXIT_ERROR
+        elif report is None:
+            print(f"{file}: valid")
+        else:
+            count = report['failure_cases'].sum() if args.summary \
+                else len(report)
+            print(f"{file}: {count} failure cases")
+            reports[file] = report
+            status = max(status, EXIT_FAILURES)
+
+    if args.output is not None:
+        # Reports in the order of the files
+        report = _concat_file_reports(
+            [reports[file] for file in files if file in reports]
+        )
+        write_report(report, args.output, report_format)
+    return status
+
+
+def expand_paths(paths: Sequence[str]) -> list[Path]:
+    """Return the xlsx files of paths, glob patterns and directories
+
+    Directories are searched recursively. Files are sorted within each
+    argument, and listed once.
+    """
+    files: dict[Path, None] = {}
+    for path in paths:
+        if Path(path).is_dir():
+            matches = sorted(Path(path).rglob('*.xlsx'))
+        elif glob.has_magic(path):
+            matches = sorted(map(Path, glob.glob(path, recursive=True)))
+        else:
+            matches = [Path(path)]
+        for match in matches:
+            # Skip Excel lock files of open workbooks
+            if not match.name.startswith('~$'):
+                files.setdefault(match, None)
+    return list(files)
+
+
+def validate_files(
+        files: Sequence[Path],
+        options: dict,
+        jobs: int = 1
+) -> Iterator[tuple[Path, Optional[pd.DataFrame], Optional[str]]]:
+    """Validate files in worker processes, yielding results as they complete
+
+    Yields
+    ------
+    tuple[Path, pd.DataFrame or None, str or None]
+        File, its report, None if valid, and the error message if it could
+        not be read or validated.
+    """
+    if len(files) == 1 or jobs == 1:
+        # Row partitions of a single file are validated in parallel instead
+        n_workers = jobs if len(files) == 1 else None
+        _init_worker(options)
+        for file in files:
+            yield (file, *_validate_file(file, n_workers))
+        return
+    with ProcessPoolExecutor(
+            min(jobs, len(files)), initializer=_init_worker,
+            initargs=(options,)
+    ) as pool:
+        futures = {pool.submit(_validate_file, file): file for file in files}
+        for future in as_completed(futures):
+            yield (futures[future], *future.result())
+
+
+def write_report(
+        report: Optional[pd.DataFrame],
+        path: Path,
+        report_format: str
+) -> None:
+    """Write a report as CSV, Parquet or JSON lines, empty if None
+
+    In Parquet reports, failure cases of mixed types are written as strings.
+    """
+    if report is None:
+        report = pd.DataFrame(columns=['file'])
+    if report_format == 'csv':
+        report.to_csv(path, index=False)
+    elif report_format == 'parquet':
+        report.astype({
+            name: str for name in report.columns
+            if report[name].dtype == object
+        }).to_parquet(path, index=False)
+    elif report_format == 'jsonl':
+        report.to_json(
+            path, orient='records', lines=True, date_format='iso'
+        )
+    else:
+        raise ValueError(f"unknown report format: {report_format}")
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='emtest',
+        description="Validate EM-DAT xlsx files against the EM-DAT schema."
+    )
+    parser.add_argument(
+        'paths', nargs='+',
+        help="EM-DAT files, glob patterns or directories"
+    )
+    parser.add_argument(
+        '-o', '--output', type=Path,
+        help="report file, in the format of its extension by default"
+    )
+    parser.add_argument(
+        '-f', '--format', choices=REPORT_FORMATS,
+        help="report format"
+    )
+    parser.add_argument(
+        '-j', '--jobs', type=int,
+        help="number of worker processes, defaults to the number of "
+             "processors. A single file is split in row partitions, "
+             "except with --summary or --max-failures"
+    )
+    parser.add_argument(
+        '-w', '--add-warnings', action='store_true',
+        help="report warnings as errors"
+    )
+    parser.add_argument(
+        '--max-failures', type=int,
+        help="stop each check after its first failing rows"
+    )
+    parser.add_argument(
+        '--summary', action='store_true',
+        help="report failure counts by check and column only"
+    )
+    parser.add_argument(
+        '--cache', action='store_true',
+        help="use and write Arrow caches next to the files, which must be "
+             "writable"
+    )
+    return parser
+
+
+def _report_format(path: Path) -> Optional[str]:
+    suffix = path.suffix.lower().lstrip('.')
+    if suffix == 'json':
+        suffix = 'jsonl'
+    return suffix if suffix in REPORT_FORMATS else None
+
+
+def _has_pyarrow() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _concat_file_reports(
+        reports: list[pd.DataFrame]
+) -> Optional[pd.DataFrame]:
+    if reports:
+        return pd.concat(reports, ignore_index=True)
+
+
+def _init_worker(options: dict) -> None:
+    """Load the schema and reference data once per worker process"""
+    from . import emdat_schema
+
+    _WORKER_OPTIONS.update(options, schema=emdat_schema)
+
+
+def _validate_file(
+        file: Path,
+        n_workers: Optional[int] = None
+) -> tuple[Optional[pd.DataFrame], Optional[str]]:
+    """Return the report of a file, and the error message if it failed"""
+    from .readers import read_emdat
+    from .utils import get_validation_report
+
+    options = _WORKER_OPTIONS
+    if options['summary'] or options['max_failures'] is not None:
+        # These modes validate in one process, see `main`
+        n_workers = None
+    try:
+        df = read_emdat(file, options['schema'], cache=options['cache'])
+        report = get_validation_report(
+            df, options['schema'], add_warnings=options['add_warnings'],
+            n_workers=n_workers, max_failures=options['max_failures'],
+            summary=options['summary']
+        )
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}"
+    if report is not None:
+        report.insert(0, 'file', str(file))
+    return report, None
+
+
+if __name__ == '__main__':
+    sys.exit(main())
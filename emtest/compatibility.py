@@ -0,0 +1,382 @@
+"""Compatibility sketches of EM-DAT releases
+
+A sketch summarizes each column of an EM-DAT file in a bounded amount of
+memory: its data types, null rate, minimum and maximum, distinct values, and
+values outside the reference lists of `validation_data`. Distinct values are
+kept exactly up to `max_distinct` values, and estimated with a HyperLogLog
+counter beyond. Files are sketched one chunk at a time, in a single pass, so
+that comparing releases never holds two files in memory:
+
+>>> diff = compare_emdat_files(['emdat_2023.xlsx', 'emdat_2024.xlsx'])
+>>> diff[diff['property'] == 'unknown_values']
+"""
+import importlib
+import math
+from pathlib import Path
+from typing import Any, Iterable, Mapping, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from .readers import DEFAULT_CHUNK_SIZE, read_emdat_excel_chunks
+
+# Distinct values kept exactly per column, and values outside reference lists
+MAX_DISTINCT = 1_000
+
+# Number of HyperLogLog registers, as a power of 2, for a relative standard
+# error of about 1.04 / sqrt(2 ** 12), i.e., 1.6%
+HLL_PRECISION = 12
+
+# Reference lists by column, as module and attribute of `validation_data`
+# or `custom_checks`
+REFERENCE_LISTS: dict[str, tuple[str, str]] = {
+    'Historic': ('custom_checks', 'YES_NO_INDEX'),
+    'Classification Key': ('validation_data.classification', 'KEY_INDEX'),
+    'Disaster Group': ('validation_data.classification', 'GROUP_INDEX'),
+    'Disaster Subgroup': ('validation_data.classification', 'SUBGROUP_INDEX'),
+    'Disaster Type': ('validation_data.classification', 'TYPE_INDEX'),
+    'Disaster Subtype': ('validation_data.classification', 'SUBTYPE_INDEX'),
+    'ISO': ('validation_data.areas', 'ISO3_INDEX'),
+    'Country': ('validation_data.areas', 'COUNTRY_INDEX'),
+    'Subregion': ('validation_data.areas', 'SUBREGION_INDEX'),
+    'Region': ('validation_data.areas', 'REGION_INDEX'),
+    'OFDA/BHA Response': ('custom_checks', 'YES_NO_INDEX'),
+    'Appeal': ('custom_checks', 'YES_NO_INDEX'),
+    'Declaration': ('custom_checks', 'YES_NO_INDEX'),
+    'Magnitude Scale': ('custom_checks', 'MAG_UNIT_INDEX'),
+}
+
+SKETCH_COLUMNS = [
+    'column', 'dtype', 'rows', 'null_rate', 'min', 'max', 'distinct',
+    'distinct_exact', 'unknown_rows', 'unknown_values'
+]
+
+DIFF_COLUMNS = [
+    'previous', 'release', 'column', 'property', 'previous_value', 'value'
+]
+
+
+class ColumnSketch:
+    """Bounded summary of the values of a column, updated by chunk
+
+    Parameters
+    ----------
+    name : str
+        Column name.
+    reference : pd.Index, optional
+        Reference values of the column.
+    max_distinct : int
+        Maximum number of distinct values, and of values outside the
+        reference, kept exactly.
+    """
+
+    def __init__(
+            self,
+            name: str,
+            reference: Optional[pd.Index] = None,
+            max_distinct: int = MAX_DISTINCT
+    ):
+        self.name = name
+        self.reference = reference
+        self.max_distinct = max_distinct
+        self.dtypes: list[str] = []
+        self.rows = 0
+        self.nulls = 0
+        self.min: Any = None
+        self.max: Any = None
+        self._comparable = True
+        # Exact distinct values, None once more than `max_distinct`
+        self.values: Optional[set] = set()
+        self.registers = np.zeros(2 ** HLL_PRECISION, dtype=np.uint8)
+        self.unknown_rows = 0
+        self.unknown_values: dict = {}
+
+    def update(self, values: Union[pd.Series, pd.Index]) -> None:
+        """Add the values of a chunk"""
+        dtype = str(values.dtype)
+        if dtype not in self.dtypes:
+            self.dtypes.append(dtype)
+        values = pd.Series(values, copy=False).reset_index(drop=True)
+        self.rows += len(values)
+        present = values.notna()
+        self.nulls += int((~present).sum())
+        values = values[present]
+        if values.empty:
+            return
+        uniques = pd.Series(values.unique())
+        self._update_range(uniques)
+        _hll_update(self.registers, pd.util.hash_pandas_object(
+            uniques, index=False
+        ).to_numpy())
+        if self.values is not None:
+            self.values.update(uniques.tolist())
+            if len(self.values) > self.max_distinct:
+                self.values = None
+        if self.reference is not None:
+            unknown = self.reference.get_indexer(uniques) == -1
+            if unknown.any():
+                self.unknown_rows += int(
+                    (~values.isin(self.reference)).sum()
+                )
+                for value in uniques[unknown].tolist():
+                    if len(self.unknown_values) >= self.max_distinct:
+                        break
+                    self.unknown_values.setdefault(value, None)
+
+    @property
+    def null_rate(self) -> float:
+        return self.nulls / self.rows if self.rows else np.nan
+
+    @property
+    def distinct(self) -> int:
+        """Number of distinct values, estimated beyond `max_distinct`"""
+        if self.values is not None:
+            return len(self.values)
+        return round(_hll_estimate(self.registers))
+
+    def to_dict(self) -> dict:
+        return {
+            'column': self.name,
+            'dtype': ' | '.join(self.dtypes),
+            'rows': self.rows,
+            'null_rate': self.null_rate,
+            'min': self.min,
+            'max': self.max,
+            'distinct': self.distinct,
+            'distinct_exact': self.values is not None,
+            'unknown_rows': self.unknown_rows if self.reference is not None
+            else None,
+            'unknown_values': list(self.unknown_values)
+            if self.reference is not None else None,
+        }
+
+    def _update_range(self, uniques: pd.Series) -> None:
+        """Update the minimum and maximum, unless values are not ordered"""
+        if not self._comparable:
+            return
+        try:
+            low, high = uniques.min(), uniques.max()
+            if self.min is not None:
+                low, high = min(self.min, low), max(self.max, high)
+        except TypeError:
+            # Mixed types, e.g., numbers and strings in an untyped column
+            self._comparable = False
+            self.min = self.max = None
+            return
+        self.min, self.max = low, high
+
+
+class EmdatSketch:
+    """Sketches of the index and columns of an EM-DAT file
+
+    Parameters
+    ----------
+    max_distinct : int
+        Maximum number of distinct values kept exactly per column.
+    """
+
+    def __init__(self, max_distinct: int = MAX_DISTINCT):
+        self.max_distinct = max_distinct
+        self.rows = 0
+        self.columns: dict[str, ColumnSketch] = {}
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        """Add the rows of a chunk"""
+        self.rows += len(chunk)
+        if chunk.index.name is not None:
+            self._column(chunk.index.name).update(chunk.index)
+        for name in chunk.columns:
+            self._column(name).update(chunk[name])
+
+    def to_frame(self) -> pd.DataFrame:
+        """Return one row per column, the index first"""
+        return pd.DataFrame(
+            [sketch.to_dict() for sketch in self.columns.values()],
+            columns=SKETCH_COLUMNS
+        ).astype({'unknown_rows': 'Int64'})
+
+    def _column(self, name: str) -> ColumnSketch:
+        if name not in self.columns:
+            self.columns[name] = ColumnSketch(
+                name, _reference_index(name), self.max_distinct
+            )
+        return self.columns[name]
+
+
+def sketch_emdat(
+        source: Union[str, Path, pd.DataFrame, Iterable[pd.DataFrame]],
+        max_distinct: int = MAX_DISTINCT,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> EmdatSketch:
+    """Sketch an EM-DAT file, dataframe or stream of chunks in one pass
+
+    Parameters
+    ----------
+    source : str, pd.DataFrame or Iterable[pd.DataFrame]
+        Path to an EM-DAT xlsx file, read by chunks with
+        `readers.read_emdat_excel_chunks`, dataframe, or dataframe chunks.
+    max_distinct : int
+        Maximum number of distinct values kept exactly per column.
+    chunk_size : int
+        Number of rows per chunk read from a file.
+
+    Returns
+    -------
+    EmdatSketch
+        Sketches of the index and columns.
+    """
+    if isinstance(source, (str, Path)):
+        source = read_emdat_excel_chunks(source, chunk_size=chunk_size)
+    elif isinstance(source, pd.DataFrame):
+        source = [source]
+    sketch = EmdatSketch(max_distinct)
+    for chunk in source:
+        sketch.update(chunk)
+    return sketch
+
+
+def diff_sketches(
+        sketches: Mapping[str, EmdatSketch],
+        tolerance: float = 0.05,
+) -> pd.DataFrame:
+    """Return the differences between successive releases
+
+    Each release is compared to the previous one, in the order of
+    `sketches`. Reported properties are the presence and data type of
+    columns, null rates differing by more than `tolerance`, the minimum and
+    maximum, added and removed values of columns whose distinct values are
+    both exact, estimated distinct counts differing relatively by more than
+    `tolerance` otherwise, and new values outside the reference lists.
+
+    Parameters
+    ----------
+    sketches : Mapping[str, EmdatSketch]
+        Sketches by release name, in release order.
+    tolerance : float
+        Tolerance of null rates and of estimated distinct counts.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per changed property of a column between two releases.
+    """
+    rows = []
+    releases = list(sketches.items())
+    for (previous, old), (release, new) in zip(releases, releases[1:]):
+        names = [*old.columns,
+                 *(name for name in new.columns if name not in old.columns)]
+        for name in names:
+            changes = _diff_columns(
+                old.columns.get(name), new.columns.get(name), tolerance
+            )
+            rows.extend(
+                (previous, release, name, *change) for change in changes
+            )
+    return pd.DataFrame(rows, columns=DIFF_COLUMNS)
+
+
+def compare_emdat_files(
+        paths: Sequence[Union[str, Path]],
+        max_distinct: int = MAX_DISTINCT,
+        tolerance: float = 0.05,
+) -> pd.DataFrame:
+    """Sketch EM-DAT files in turn and return their differences
+
+    Files are compared in the given order, see `diff_sketches`. Each file is
+    read once, by chunks, and only its sketch is kept.
+    """
+    sketches = {
+        str(path): sketch_emdat(path, max_distinct) for path in paths
+    }
+    return diff_sketches(sketches, tolerance)
+
+
+def _diff_columns(
+        old: Optional[ColumnSketch],
+        new: Optional[ColumnSketch],
+        tolerance: float
+) -> list[tuple]:
+    """Return the changed properties of a column, with old and new values"""
+    if old is None or new is None:
+        return [('present', old is not None, new is not None)]
+    changes = []
+    old_dtype, new_dtype = ' | '.join(old.dtypes), ' | '.join(new.dtypes)
+    if old_dtype != new_dtype:
+        changes.append(('dtype', old_dtype, new_dtype))
+    if abs(new.null_rate - old.null_rate) > tolerance:
+        changes.append(('null_rate', old.null_rate, new.null_rate))
+    for bound in ('min', 'max'):
+        old_value, new_value = getattr(old, bound), getattr(new, bound)
+        if not _same_value(old_value, new_value):
+            changes.append((bound, old_value, new_value))
+    if old.values is not None and new.values is not None:
+        added = _sorted(new.values - old.values)
+        removed = _sorted(old.values - new.values)
+        if added:
+            changes.append(('added_values', None, added))
+        if removed:
+            changes.append(('removed_values', removed, None))
+    elif abs(new.distinct - old.distinct) > tolerance * max(old.distinct, 1):
+        changes.append(('distinct', old.distinct, new.distinct))
+    if new.reference is not None:
+        unknown = [value for value in new.unknown_values
+                   if value not in old.unknown_values]
+        if unknown:
+            changes.append(
+                ('unknown_values', list(old.unknown_values), unknown)
+            )
+    return changes
+
+
+def _same_value(a, b) -> bool:
+    try:
+        return bool(a == b) or (pd.isna(a) and pd.isna(b))
+    except (TypeError, ValueError):
+        return False
+
+
+def _sorted(values: set) -> list:
+    try:
+        return sorted(values)
+    except TypeError:
+        return list(values)
+
+
+def _reference_index(column: str) -> Optional[pd.Index]:
+    if column not in REFERENCE_LISTS:
+        return None
+    module, name = REFERENCE_LISTS[column]
+    return getattr(importlib.import_module(f'.{module}', __package__), name)
+
+
+def _hll_update(registers: np.ndarray, hashes: np.ndarray) -> None:
+    """Add 64-bit hashes to HyperLogLog registers, in place"""
+    hashes = hashes.astype(np.uint64, copy=False)
+    width = 64 - HLL_PRECISION
+    bucket = (hashes >> np.uint64(width)).astype(np.intp)
+    rest = hashes & np.uint64((1 << width) - 1)
+    # Position of the leftmost 1-bit of the remaining bits
+    rank = width + 1 - _bit_length(rest)
+    np.maximum.at(registers, bucket, rank.astype(np.uint8))
+
+
+def _hll_estimate(registers: np.ndarray) -> float:
+    m = len(registers)
+    alpha = 0.7213 / (1 + 1.079 / m)
+    estimate = alpha * m * m / np.sum(2.0 ** -registers.astype(np.float64))
+    zeros = int((registers == 0).sum())
+    if estimate <= 2.5 * m and zeros:
+        # Linear counting for small cardinalities
+        estimate = m * math.log(m / zeros)
+    return estimate
+
+
+def _bit_length(values: np.ndarray) -> np.ndarray:
+    """Return the number of bits of unsigned 64-bit integers"""
+    values = values.copy()
+    length = np.zeros(len(values), dtype=np.int64)
+    for shift in (32, 16, 8, 4, 2, 1):
+        large = values >= (np.uint64(1) << np.uint64(shift))
+        length[large] += shift
+        values[large] >>= np.uint64(shift)
+    return length + (values > 0)
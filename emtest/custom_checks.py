@@ -3,92 +3,181 @@
 
 import json
 import re
-from typing import Any, Literal, Optional, Union
+from functools import lru_cache
+from typing import Any, Callable, Literal, Optional, Union
 
+import numpy as np
 import pandas as pd
 from pandera.typing import Series
 
-from .validation_data.areas import ADM1_GAUL_LIST, ADM2_GAUL_LIST, \
-    SUBREGION_LIST, REGION_LIST, COUNTRY_LIST, ISO3_LIST
-from .validation_data.classification import KEY_LIST, GROUP_LIST, TYPE_LIST, \
-    SUBTYPE_LIST, SUBGROUP_LIST
+from .derived import cached, data_of
+# Reference data modules are loaded lazily, on first attribute access
+from .validation_data import areas, classification
 from .validation_data.magnitude import MAG_UNIT_LIST
 
 
 # Single Checks
 # -------------
 
+# Maximum number of cached results of element-wise checks
+DISTINCT_CACHE_SIZE = 2 ** 14
+
+YES_NO_INDEX = pd.Index(['Yes', 'No'])
+MAG_UNIT_INDEX = pd.Index(MAG_UNIT_LIST)
+
+DISNO_PATTERN = r"^(?P<year>\d{4})-(?P<sequence>\d{4})-(?P<ISO>[A-Z]{3})$"
+
+
 def check_disno(disno: Series[str]) -> Series[bool]:
-    """Check that disno is in the correct format."""
-    return disno.str.match(
-        r"^\d{4}-\d{4}-[A-Z]{3}$", na=False
-    )
+    """Check that disno is in the correct format.
+
+    Uses the components of `parse_disno`, so that DisNo. values are parsed
+    once per validation run.
+    """
+    return _valid_disno(parse_disno(pd.Index(disno, copy=False)), disno.index)
+
+
+def check_disno_index(disno: Series[str]) -> Series[bool]:
+    """Check that the DisNo. index is in the correct format.
+
+    Index checks get the index as a Series indexed by the index itself,
+    whose components are parsed once and shared with the other DisNo. checks.
+    """
+    return _valid_disno(parse_disno(disno.index), disno.index)
+
+
+def _valid_disno(parts: pd.DataFrame, index: pd.Index) -> Series[bool]:
+    return pd.Series(parts['sequence'].notna().to_numpy(), index=index)
 
 def check_yes_no(yes_no: Series[str]) -> Series[bool]:
     """Check that yes_no is in the correct format."""
-    return yes_no.isin(['Yes', 'No'])
+    return isin_reference(yes_no, YES_NO_INDEX)
 
 def check_classification_key(classification_key: Series[str]) -> Series[bool]:
     """Check that classification key is in the correct format."""
-    return classification_key.isin(KEY_LIST)
+    return isin_reference(classification_key, classification.KEY_INDEX)
 
 def check_group(group: Series[str]) -> Series[bool]:
     """Check that group is in the correct format."""
-    return group.isin(GROUP_LIST)
+    return isin_reference(group, classification.GROUP_INDEX)
 
 def check_subgroup(subgroup: Series[str]) -> Series[bool]:
     """Check that subgroup is in the correct format."""
-    return subgroup.isin(SUBGROUP_LIST)
+    return isin_reference(subgroup, classification.SUBGROUP_INDEX)
 
 def check_type(dis_type: Series[str]) -> Series[bool]:
     """Check that dis_type is in the correct format."""
-    return dis_type.isin(TYPE_LIST)
+    return isin_reference(dis_type, classification.TYPE_INDEX)
 
 def check_subtype(subtype: Series[str]) -> Series[bool]:
     """Check that subtype is in the correct format."""
-    return subtype.isin(SUBTYPE_LIST)
+    return isin_reference(subtype, classification.SUBTYPE_INDEX)
 
 def check_disno_vs_start_year(start_year: Series[int]) -> Series[bool]:
     """Check that disno year is the same as start year."""
+    disno_year = parse_disno(start_year.index)['year'].fillna(0)
+    return pd.Series(
+        disno_year.to_numpy() == start_year.to_numpy(), index=start_year.index
+    )
+
+
+def parse_disno(disno: pd.Index) -> pd.DataFrame:
+    """Parse DisNo. values into year, sequence and ISO columns.
+
+    The result is shared by all checks of a validation run (see
+    `emtest.derived`). Values that do not match the DisNo. pattern have
+    missing sequence and ISO, and a missing year unless their first four
+    characters are digits.
+
+    Parameters
+    ----------
+    disno : pd.Index
+        DisNo. values, typically the index of the validated dataframe.
+
+    Returns
+    -------
+    pd.DataFrame
+        Columns 'year' and 'sequence' (Int64) and 'ISO', indexed by `disno`.
+
+    Example
+    -------
+
+    >>> parse_disno(pd.Index(['2019-0275-SRB', 'wrong_disno']))
+                   year  sequence  ISO
+    2019-0275-SRB  2019       275  SRB
+    wrong_disno    <NA>      <NA>  NaN
+    """
+    def parse() -> pd.DataFrame:
+        values = pd.Series(disno.astype(str), index=disno)
+        parts = values.str.extract(DISNO_PATTERN)
+        year = values.str[:4]
+        parts['year'] = year.where(year.str.fullmatch(r'\d{4}'))
+        return parts.astype(
+            {'year': 'Int64', 'sequence': 'Int64', 'ISO': object}
+        )
+
+    return cached('disno', data_of(disno), parse)
 
-    def disno_to_year(disno: str) -> int:
-        try:
-            disno_year = int(disno[:4])
-        except ValueError:
-            disno_year = 0
-        return disno_year
 
-    disno = pd.Series(start_year.index)
-    disno_year = disno.apply(lambda x: disno_to_year(x))
-    disno_year.index = disno
-    return disno_year == start_year
+# Patterns of the external ID sources, matched at the start of each ID
+EXTERNAL_ID_PATTERNS: dict[str, str] = {
+    'GLIDE': r"GLIDE:[A-Z]{2}-\d{4}-\d{6}",
+    'USGS': r"USGS:[0-9a-zA-Z]{10}",
+    'DFO': r"DFO:\d{4}",
+    'HANZE': r"HANZE:\d{1,5}",
+}
+# IDs are pipe-separated, so each one starts a value or follows a pipe
+_ID_START = r"(?:^|\|)"
+EXTERNAL_ID_REGEX = re.compile(
+    _ID_START + "(?:" + "|".join(EXTERNAL_ID_PATTERNS.values()) + ")"
+)
 
 
 def validate_external_id(external_id: Optional[str]) -> bool:
     """Validates external ID regex patterns.
     """
-    glide_pattern = r"GLIDE:[A-Z]{2}-\d{4}-\d{6}"
-    usgs_pattern = r"USGS:[0-9a-zA-Z]{10}"
-    dfo_pattern = r"DFO:\d{4}"
-    hanze_pattern = r"HANZE:\d{1,5}"
     if external_id != external_id:  # Skip NaN
         return True
-    ids = external_id.split("|")
-    valid = False
-    for id_ in ids:
-        if (
-                re.match(glide_pattern, id_) or
-                re.match(usgs_pattern, id_) or
-                re.match(dfo_pattern, id_) or
-                re.match(hanze_pattern, id_)
-        ):
-            valid |= bool(
-                re.match(glide_pattern, id_) or
-                re.match(usgs_pattern, id_) or
-                re.match(dfo_pattern, id_) or
-                re.match(hanze_pattern, id_)
-            )
-    return valid
+    return EXTERNAL_ID_REGEX.search(external_id) is not None
+
+
+def check_external_ids(external_ids: Series[str]) -> Series[bool]:
+    """Validate pipe-separated external IDs using regular expressions.
+
+    Column-level counterpart of `validate_external_id`: a value is valid if
+    at least one of its IDs matches a known source pattern. A single
+    compiled alternation of all patterns, anchored at the start of each ID,
+    is searched in every value, so that values need not be split.
+    """
+    return external_ids.str.contains(EXTERNAL_ID_REGEX, na=True)
+
+
+def count_external_ids(external_ids: Series[str]) -> pd.DataFrame:
+    """Count the valid external IDs of each source in each value.
+
+    Parameters
+    ----------
+    external_ids : Series[str]
+        Pipe-separated external IDs, indexed by DisNo.
+
+    Returns
+    -------
+    pd.DataFrame
+        Number of valid IDs per source, with one column per source in
+        EXTERNAL_ID_PATTERNS and the index of `external_ids`.
+
+    Example
+    -------
+
+    >>> count_external_ids(pd.Series(['GLIDE:FL-2019-000052|DFO:4384']))
+       GLIDE  USGS  DFO  HANZE
+    0      1     0    1      0
+    """
+    return pd.DataFrame({
+        source: external_ids.str.count(_ID_START + pattern)
+        .fillna(0).astype(int)
+        for source, pattern in EXTERNAL_ID_PATTERNS.items()
+    }, index=external_ids.index)
 
 
 def is_valid_json(json_data: Any) -> bool:
@@ -134,33 +223,129 @@ def has_valid_GAUL_codes(json_data: Any) -> bool:
         return False
 
 
+def check_GAUL_codes(admin_units: Series[str]) -> Series[bool]:
+    """Check that all GAUL codes of an Admin Units column are valid.
+
+    Column-level counterpart of `has_valid_GAUL_codes`. The JSON strings are
+    parsed once into a long table (see `explode_admin_units`) and every code
+    is tested at once against the sorted GAUL code arrays. A row fails if its
+    JSON cannot be read or if any of its codes is unknown at its level.
+    Missing values pass.
+    """
+    units = explode_admin_units(admin_units)
+    level = units['level'].to_numpy(dtype='float64', na_value=np.nan)
+    code = units['code'].to_numpy(dtype='float64', na_value=np.nan)
+    unit_valid = np.zeros(len(units), dtype=bool)
+    for adm_level, adm_codes in (
+            (1, areas.ADM1_GAUL_CODES), (2, areas.ADM2_GAUL_CODES)
+    ):
+        at_level = level == adm_level
+        unit_valid[at_level] = _isin_sorted(code[at_level], adm_codes)
+    valid = np.ones(len(admin_units), dtype=bool)
+    valid[units['row'].to_numpy()[~unit_valid]] = False
+    return pd.Series(valid, index=admin_units.index) | admin_units.isna()
+
+
+def explode_admin_units(admin_units: Series[str]) -> pd.DataFrame:
+    """Parse Admin Units JSON strings into a long table of GAUL units.
+
+    Each distinct JSON string is decoded once. Every administrative unit
+    becomes a row holding its DisNo., GAUL level, GAUL code and name, and the
+    `row` column gives the position of the unit's record in `admin_units`.
+    Records that are missing, not valid JSON, or contain an unreadable unit
+    are kept as a single row with missing level, code and name.
+
+    The result is shared by all checks of a validation run (see
+    `emtest.derived`).
+
+    Parameters
+    ----------
+    admin_units : Series[str]
+        Admin Units JSON strings, indexed by DisNo.
+
+    Returns
+    -------
+    pd.DataFrame
+        Long table with columns 'row', 'DisNo.', 'level', 'code' and 'name'.
+
+    Example
+    -------
+
+    >>> admin_units = pd.Series(
+    ...     ['[{"adm1_code":1599,"adm1_name":"Monaghan"}]', 'wrong_json'],
+    ...     index=['2015-0525-IRL', '1999-0673-IND']
+    ... )
+    >>> explode_admin_units(admin_units)
+       row         DisNo.  level  code      name
+    0    0  2015-0525-IRL      1  1599  Monaghan
+    1    1  1999-0673-IND   <NA>  <NA>       NaN
+    """
+    return cached(
+        'admin_units',
+        data_of(admin_units),
+        lambda: _explode_admin_units(admin_units)
+    )
+
+
+def _explode_admin_units(admin_units: Series[str]) -> pd.DataFrame:
+    codes, uniques = pd.factorize(admin_units.to_numpy(dtype=object))
+    parsed = [_parse_admin_units(value) for value in uniques]
+    # Unreadable records are represented by a single missing unit
+    parsed.append(None)
+    codes[codes == -1] = len(parsed) - 1
+    unique_units = [[(None, None, None)] if p is None else p for p in parsed]
+    unique_lengths = np.array([len(p) for p in unique_units], dtype=np.int64)
+    unique_offsets = np.concatenate([[0], np.cumsum(unique_lengths)[:-1]])
+    flat_units = [unit for units in unique_units for unit in units]
+
+    # Ragged gather of each row's units from the flat per-value table
+    row_lengths = unique_lengths[codes]
+    n_units = int(row_lengths.sum())
+    row = np.repeat(np.arange(len(codes)), row_lengths)
+    row_starts = np.concatenate([[0], np.cumsum(row_lengths)[:-1]])
+    take = (
+        np.repeat(unique_offsets[codes] - row_starts, row_lengths)
+        + np.arange(n_units)
+    )
+    flat = pd.DataFrame(
+        flat_units or None, columns=['level', 'code', 'name']
+    ).astype({'level': 'Int8', 'code': 'Int64', 'name': object})
+    units = flat.iloc[take].reset_index(drop=True)
+    units.insert(0, 'DisNo.', admin_units.index.to_numpy()[row])
+    units.insert(0, 'row', row)
+    return units
+
 def validate_iso3_code(iso3_country_code: Series[str]) -> Series[bool]:
     """Validate ISO3 code using regular expression.
     """
-    return iso3_country_code.str.match(r'^[A-Z]{3}$')
+    # Distinct values are shared with `check_iso3_code`
+    return map_distinct(
+        iso3_country_code,
+        lambda uniques: uniques.str.match(r'^[A-Z]{3}$')
+    )
 
 def check_iso3_code(iso3_country_code: Series[str]) -> Series[bool]:
     """Check that country is in the correct format."""
-    return iso3_country_code.isin(ISO3_LIST)
+    return isin_reference(iso3_country_code, areas.ISO3_INDEX)
 
 
 def check_country(country: Series[str]) -> Series[bool]:
     """Check that country is in the correct format."""
-    return country.isin(COUNTRY_LIST)
+    return isin_reference(country, areas.COUNTRY_INDEX)
 
 
 def check_subregion(subregion: Series[str]) -> Series[bool]:
     """Check that subregion is in the correct format."""
-    return subregion.isin(SUBREGION_LIST)
+    return isin_reference(subregion, areas.SUBREGION_INDEX)
 
 
 def check_region(region: Series[str]) -> Series[bool]:
     """Check that region is in the correct format."""
-    return region.isin(REGION_LIST)
+    return isin_reference(region, areas.REGION_INDEX)
 
 def check_magnitude_unit(magnitude_unit: Series[str]) -> Series[bool]:
     """Check that magnitude unit is in the correct format."""
-    return magnitude_unit.isin(MAG_UNIT_LIST)
+    return isin_reference(magnitude_unit, MAG_UNIT_INDEX)
 
 def check_day(day: Series[int]) -> Series[bool]:
     """Check that day is in the correct range (1-31)."""
@@ -209,6 +394,58 @@ def check_other_magnitude(df: pd.DataFrame) -> Series[bool]:
     return ~is_other | df['Magnitude'] > 0
 
 
+def check_GAUL_hierarchy(
+        df: pd.DataFrame,
+        hierarchy: pd.DataFrame,
+) -> Series[bool]:
+    """Check that admin units belong to the row's country and match names.
+
+    Admin Units entries are joined to the GAUL hierarchy lookup table (see
+    `load_GAUL_hierarchy`) on their level and code. A row fails if one of its
+    units lies in another country than the row's ISO code, if one of its
+    Admin. 2 units lies in another Admin. 1 unit than those of the row, when
+    the row lists any, or if a stored unit name differs from the GAUL name
+    (case-insensitive). Unknown codes and invalid JSON strings are left to
+    `check_GAUL_codes` and `is_valid_json`.
+    """
+    units = explode_admin_units(df['Admin Units'])
+    units = units.dropna(subset=['code']).astype(
+        {'level': 'int64', 'code': 'int64'}
+    )
+    units = units.join(hierarchy, on=['level', 'code'], rsuffix='_gaul')
+    df_row = units['row'].to_numpy()
+    row_iso = df['ISO'].to_numpy(dtype=object)[df_row]
+
+    known = units['ISO'].notna().to_numpy()
+    other_country = units['ISO'].to_numpy(dtype=object) != row_iso
+    name = units['name'].str.strip().str.casefold()
+    gaul_name = units['name_gaul'].str.strip().str.casefold()
+    other_name = (name.notna() & (name != gaul_name)).to_numpy()
+
+    # Parent Admin. 1 units of Admin. 2 units, among the row's Admin. 1 units
+    level = units['level'].to_numpy()
+    adm1 = pd.MultiIndex.from_arrays(
+        [df_row[level == 1], units['code'].to_numpy()[level == 1]]
+    )
+    parent = units['adm1_code'].fillna(-1).to_numpy(dtype='int64')
+    listed_parent = pd.MultiIndex.from_arrays([df_row, parent]).isin(adm1)
+    other_parent = (
+        (level == 2) & (parent >= 0) & np.isin(df_row, adm1.levels[0])
+        & ~listed_parent
+    )
+
+    valid = np.ones(len(df), dtype=bool)
+    valid[df_row[known & (other_country | other_parent | other_name)]] = False
+    return pd.Series(valid, index=df.index)
+
+
+def check_disno_vs_iso(df: pd.DataFrame) -> Series[bool]:
+    """Check that the DisNo. ISO suffix is the ISO code of the row"""
+    disno_iso = parse_disno(df.index)['ISO'].to_numpy()
+    same_iso = disno_iso == df['ISO'].to_numpy(dtype=object)
+    return pd.Series(same_iso | pd.isna(disno_iso), index=df.index)
+
+
 def check_no_day_if_no_month(
         df: pd.DataFrame,
         start_or_end: Literal['Start', 'End'],
@@ -226,9 +463,92 @@ def check_start_end_consistency(
         resolution: Literal['year', 'month', 'day'],
 ) -> Series[bool]:
     """Check start and end dates correct chronology"""
-    date_start = _convert_to_date(df, 'Start', resolution)
-    date_end = _convert_to_date(df, 'End', resolution)
-    return (date_start <= date_end) | pd.isna(date_start) | pd.isna(date_end)
+    keys = _date_keys(df)
+    date_start = keys[f'Start {resolution}']
+    date_end = keys[f'End {resolution}']
+    return pd.Series(
+        (date_start <= date_end) | np.isnan(date_start) | np.isnan(date_end),
+        index=df.index
+    )
+
+
+def check_calendar_date(
+        df: pd.DataFrame,
+        start_or_end: Literal['Start', 'End'],
+) -> Series[bool]:
+    """Check that the day exists in the month and year (e.g., no Feb. 30)
+
+    Days outside the 1-31 range are left to `check_day`.
+    """
+    year, month, day = _date_parts(df, start_or_end)
+    month_defined = (month >= 1) & (month <= 12)
+    exceeds_month = (
+        month_defined & (day <= 31) & (day > _days_in_month(year, month))
+    )
+    return pd.Series(~exceeds_month, index=df.index)
+
+
+_DAYS_IN_MONTH = np.array([31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])
+
+
+def _days_in_month(year: np.ndarray, month: np.ndarray) -> np.ndarray:
+    """Return the number of days of each month, or NaN if month is invalid."""
+    valid_month = (month >= 1) & (month <= 12)
+    month_ix = np.where(valid_month, month, 1).astype(np.int64) - 1
+    is_leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+    days = _DAYS_IN_MONTH[month_ix] + ((month_ix == 1) & is_leap)
+    return np.where(valid_month, days, np.nan)
+
+
+def _date_parts(
+        df: pd.DataFrame,
+        start_or_end: Literal['Start', 'End'],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return year, month and day as float arrays, NaN if undefined."""
+    return tuple(
+        np.trunc(df[f'{start_or_end} {part}'].to_numpy(
+            dtype='float64', na_value=np.nan
+        ))
+        for part in ('Year', 'Month', 'Day')
+    )
+
+
+def _date_keys(df: pd.DataFrame) -> dict[str, np.ndarray]:
+    """Compute integer date keys of start and end dates at all resolutions.
+
+    The result is shared by all checks of a validation run (see
+    `emtest.derived`).
+
+    Keys are ordinal numbers, `year`, `year * 100 + month` and
+    `(year * 100 + month) * 100 + day`, such that dates compare correctly
+    at the month and day resolutions. Keys are NaN when the date is
+    undefined or invalid at the resolution, e.g., for a missing month or for
+    February 30.
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        Float arrays keyed by '{Start|End} {year|month|day}'.
+    """
+    return cached('date_keys', df, lambda: _compute_date_keys(df))
+
+
+def _compute_date_keys(df: pd.DataFrame) -> dict[str, np.ndarray]:
+    keys = {}
+    for start_or_end in ('Start', 'End'):
+        year, month, day = _date_parts(df, start_or_end)
+        month_key = np.where(
+            (month >= 1) & (month <= 12), year * 100 + month, np.nan
+        )
+        day_key = np.where(
+            (day >= 1) & (day <= _days_in_month(year, month)),
+            month_key * 100 + day,
+            np.nan
+        )
+        keys[f'{start_or_end} year'] = year
+        keys[f'{start_or_end} month'] = month_key
+        keys[f'{start_or_end} day'] = day_key
+    return keys
 
 
 def _convert_to_date(
@@ -236,33 +556,24 @@ def _convert_to_date(
         start_or_end: Literal['Start', 'End'],
         resolution: Literal['year', 'month', 'day']
 ) -> Series:
-    def float_to_string(x):
-        if x != x:
-            return '00'
-        else:
-            return str(int(x)).zfill(2)
-
-    year = df[f'{start_or_end} Year'].apply(
-        lambda x: None if pd.isna(x) else str(int(x))
-    )
+    """Convert start or end date columns to timestamps at a resolution.
 
+    Dates that are undefined or invalid at the resolution are NaT.
+    """
+    key = _date_keys(df)[f'{start_or_end} {resolution}']
+    first = np.where(np.isnan(key), np.nan, 1.)
     if resolution == 'day':
-        return pd.to_datetime(
-            year +
-            df[f'{start_or_end} Month'].apply(float_to_string) +
-            df[f'{start_or_end} Day'].apply(float_to_string),
-            format='%Y%m%d',
-            errors='coerce'
-        )
+        year, month, day = key // 10000, key // 100 % 100, key % 100
     elif resolution == 'month':
-        return pd.to_datetime(
-            year +
-            df[f'{start_or_end} Month'].apply(float_to_string),
-            format='%Y%m',
-            errors='coerce'
-        )
+        year, month, day = key // 100, key % 100, first
     elif resolution == 'year':
-        return pd.to_datetime(year, format='%Y', errors='coerce')
+        year, month, day = key, first, first
+    dates = pd.to_datetime(
+        pd.DataFrame({'year': year, 'month': month, 'day': day}),
+        errors='coerce'
+    )
+    dates.index = df.index
+    return dates
 
 
 def _extract_GAUL_code(d: dict) -> tuple[int, int]:
@@ -273,9 +584,148 @@ def _extract_GAUL_code(d: dict) -> tuple[int, int]:
     return level, code_value
 
 
+def _parse_admin_units(
+        json_data: Any
+) -> Optional[list[tuple[int, int, Optional[str]]]]:
+    """Return the (level, code, name) units of an Admin Units JSON string.
+
+    Returns None if the value is not a JSON list of readable GAUL units.
+    """
+    if not isinstance(json_data, (str, bytes, bytearray)):
+        return None
+    try:
+        admin_units = json.loads(json_data)
+        units = []
+        for d in admin_units:
+            level, code = _extract_GAUL_code(d)
+            units.append((level, code, d.get(f"adm{level}_name")))
+        return units
+    except (json.JSONDecodeError, AttributeError, IndexError, KeyError,
+            TypeError, ValueError):
+        return None
+
+
+def distinct_values(values: Series) -> tuple[np.ndarray, pd.Index]:
+    """Return the integer codes and the distinct values of a column
+
+    Missing values have code -1. The codes of categorical columns are used
+    as is. Otherwise, the column is factorized once per validation run and
+    shared by the checks of the column (see `derived.derived_cache`).
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return values.cat.codes.to_numpy(), values.cat.categories
+    return cached('distinct', data_of(values), lambda: pd.factorize(values))
+
+
+def isin_reference(values: Series, reference: pd.Index) -> Series[bool]:
+    """Test membership in reference values, once per distinct value
+
+    Equivalent to `values.isin(reference)`. The column is factorized once
+    per validation run (see `distinct_values`), so the cost of the lookup
+    depends on the number of distinct values rather than on the row count.
+    """
+    return map_distinct(
+        values, lambda uniques: reference.get_indexer(uniques) >= 0
+    )
+
+
+def map_distinct(
+        values: Series,
+        func: Callable[[pd.Index], np.ndarray]
+) -> Series[bool]:
+    """Evaluate a vectorized check once per distinct value of a column
+
+    Missing values fail, the check is broadcast to the other rows.
+    """
+    codes, uniques = distinct_values(values)
+    return _broadcast((codes, uniques), np.asarray(func(uniques), dtype=bool),
+                      values.index)
+
+
+def element_wise_on_distinct(
+        func: Callable[[Any], bool],
+        maxsize: Optional[int] = DISTINCT_CACHE_SIZE
+) -> Callable[[Series], Series[bool]]:
+    """Turn an element-wise check into a check of the distinct values
+
+    The returned check function takes a column, calls `func` once per
+    distinct value, and maps the results back to the rows. Results are
+    kept in a least-recently-used cache of `maxsize` values, shared by all
+    columns and validation runs using the returned function. Use it in a
+    `Check` without `element_wise=True`, failure cases are reported as for
+    the element-wise check.
+
+    Parameters
+    ----------
+    func : Callable
+        Element-wise check function of a hashable value.
+    maxsize : int, optional
+        Maximum number of cached results, unbounded if None.
+
+    Example
+    -------
+
+    >>> check_json = element_wise_on_distinct(is_valid_json)
+    >>> check_json(pd.Series(['[]', 'wrong_json', '[]'])).tolist()
+    [True, False, True]
+    """
+    return _DistinctCheck(func, maxsize)
+
+
+class _DistinctCheck:
+    """Check function returned by `element_wise_on_distinct`
+
+    Pickled without its cache, e.g., to be sent to worker processes.
+    """
+
+    def __init__(self, func: Callable[[Any], bool], maxsize: Optional[int]):
+        self.func = func
+        self.maxsize = maxsize
+        self.__name__ = f"{func.__name__}_on_distinct"
+        self.__doc__ = func.__doc__
+        self._cached_func = lru_cache(maxsize=maxsize)(func)
+        self.cache_info = self._cached_func.cache_info
+        self.cache_clear = self._cached_func.cache_clear
+
+    def __call__(self, values: Series) -> Series[bool]:
+        codes, uniques = distinct_values(values)
+        unique_valid = np.array(
+            [self._cached_func(value) for value in uniques], dtype=bool
+        )
+        valid = _broadcast((codes, uniques), unique_valid, values.index)
+        if (codes < 0).any():
+            valid[codes < 0] = bool(self.func(np.nan))
+        return valid
+
+    def __reduce__(self):
+        return _DistinctCheck, (self.func, self.maxsize)
+
+
+# Shared by the JSON columns, so that their results are cached together
+check_json_strings = element_wise_on_distinct(is_valid_json)
+
+
+def _broadcast(
+        distinct: tuple[np.ndarray, pd.Index],
+        unique_valid: np.ndarray,
+        index: pd.Index
+) -> Series[bool]:
+    codes = distinct[0]
+    return pd.Series(
+        np.where(codes >= 0, unique_valid[codes], False), index=index
+    )
+
+
+def _isin_sorted(values: np.ndarray, sorted_codes: np.ndarray) -> np.ndarray:
+    """Vectorized membership test of values in a sorted array of codes."""
+    position = np.searchsorted(sorted_codes, values)
+    position[position == len(sorted_codes)] = 0
+    return sorted_codes[position] == values
+
+
 def _is_valid_GAUL_code(code: int, level=Literal[1, 2]) -> bool:
     """Check if code is a valid GAUL code."""
     if level == 1:
-        return code in ADM1_GAUL_LIST
+        return bool(_isin_sorted(np.array([code]), areas.ADM1_GAUL_CODES)[0])
     elif level == 2:
-        return code in ADM2_GAUL_LIST
+        return bool(_isin_sorted(np.array([code]), areas.ADM2_GAUL_CODES)[0])
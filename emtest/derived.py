@@ -0,0 +1,82 @@
+"""Derived columns shared across checks within a validation run.
+
+Several checks need the same intermediate data, e.g., the year, sequence and
+ISO parts of DisNo., the parsed Admin Units, or the start and end date keys.
+Within a `derived_cache()` context, as opened by `get_validation_report`,
+each derived column is computed once per source data and then read by every
+check. Outside of it, derived columns are computed on each call.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, Optional, TypeVar, Union
+
+import pandas as pd
+
+T = TypeVar('T')
+
+_CACHE: ContextVar[Optional[dict]] = ContextVar(
+    'emtest_derived_cache', default=None
+)
+
+
+@contextmanager
+def derived_cache() -> Iterator[dict]:
+    """Share derived columns between checks until the context exits.
+
+    Nested contexts reuse the outermost cache.
+    """
+    cache = _CACHE.get()
+    if cache is not None:
+        yield cache
+        return
+    token = _CACHE.set({})
+    try:
+        yield _CACHE.get()
+    finally:
+        _CACHE.reset(token)
+
+
+def cached(name: str, source: Any, compute: Callable[[], T]) -> T:
+    """Return the derived column `name` of `source`, computing it if needed.
+
+    Parameters
+    ----------
+    name : str
+        Name of the derived column.
+    source : Any
+        Object the derived column is computed from. Entries are matched by
+        identity and hold a reference to their source, so that an identifier
+        is never reused within the context.
+    compute : Callable
+        Function computing the derived column.
+    """
+    cache = _CACHE.get()
+    if cache is None:
+        return compute()
+    key = (name, id(source))
+    entry = cache.get(key)
+    if entry is not None and entry[0] is source:
+        return entry[1]
+    value = compute()
+    cache[key] = (source, value)
+    return value
+
+
+def lookup(name: str, source: Any) -> Optional[Any]:
+    """Return the derived column `name` of `source` if computed, else None."""
+    cache = _CACHE.get()
+    entry = None if cache is None else cache.get((name, id(source)))
+    if entry is not None and entry[0] is source:
+        return entry[1]
+    return None
+
+
+def data_of(obj: Union[pd.Index, pd.Series]) -> Any:
+    """Return the object holding the values of an Index or a Series.
+
+    pandera passes a new Series or Index object to each check, but these
+    share the same underlying array, which identifies the source data.
+    """
+    values = obj.array
+    # NumPy-backed extension arrays are wrapped anew on each access
+    return getattr(values, '_ndarray', values)
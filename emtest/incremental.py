@@ -0,0 +1,297 @@
+"""Incremental validation of successive EM-DAT exports
+
+All checks of `emdat_schema` depend on a single row, except the uniqueness
+of DisNo. Rows whose 'Last Update' did not change since the previous run
+keep their previous failure cases, and only new or updated rows are
+validated again. Uniqueness is checked on the whole index on every run.
+
+The state of the previous run is kept in a Parquet file of failure cases and
+'Last Update' values, next to a JSON file holding its fingerprint. Keeping
+state requires the optional `pyarrow` dependency, without which every run is
+a full validation.
+"""
+import functools
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Optional, Union
+
+import pandas as pd
+import pandera
+from pandera import DataFrameSchema
+
+from . import __version__
+from .readers import _import_feather, has_trusted_types
+from .utils import (
+    _concat_reports,
+    _deduplicate_wide_errors,
+    _get_duplicates,
+    _get_failure_cases,
+    _has_unique_index,
+    schema_variant,
+)
+from .validation_data.data_loader import gaul_hierarchy_file, \
+    reference_checksum
+
+LAST_UPDATE = 'Last Update'
+
+REPORT_COLUMNS = [
+    'schema_context', 'column', 'check', 'check_number', 'failure_case',
+    'index'
+]
+
+
+def get_incremental_validation_report(
+        df: pd.DataFrame,
+        schema: DataFrameSchema,
+        state_file: Union[str, Path],
+        add_warnings: bool = False,
+        deduplicate_wide: bool = True,
+        trusted_types: Optional[bool] = None,
+) -> Optional[pd.DataFrame]:
+    """Return schema errors as a report, revalidating changed rows only
+
+    The state file holds the 'Last Update' of each DisNo. and its failure
+    cases at the previous run. Rows are validated again if their DisNo. is
+    new or repeated, or if their 'Last Update' differs or is missing. The
+    report merges the previous failure cases of the other rows with the new
+    ones, and holds the same failure cases as `get_validation_report`. The
+    state is discarded if the schema, the options, the reference data or
+    the check implementations change, and is then rebuilt by a full
+    validation.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        EM-DAT dataframe, indexed by DisNo.
+    schema : DataFrameSchema
+        Validation schema.
+    state_file : str
+        Path of the Parquet state file, created or updated by the run,
+        with its fingerprint in the JSON file `{state_file}.json`.
+    add_warnings : bool
+        Whether to report warnings as errors.
+    deduplicate_wide : bool
+        Whether to keep only relevant columns of wide check failures.
+    trusted_types : bool, optional
+        Whether to check data types without coercion, by default for frames
+        flagged by `readers.read_emdat`.
+
+    Returns
+    -------
+    pd.DataFrame or None
+        Failure cases of all rows, None if the dataframe is valid.
+    """
+    fingerprint = schema_fingerprint(schema, add_warnings, deduplicate_wide)
+    state = _load_state(state_file, fingerprint)
+    if trusted_types is None:
+        trusted_types = has_trusted_types(df)
+    unique_index = _has_unique_index(schema)
+    schema = schema_variant(
+        schema, add_warnings=add_warnings, trusted_types=trusted_types,
+        unique_index=False
+    )
+
+    last_update = df[LAST_UPDATE] if LAST_UPDATE in df.columns else \
+        pd.Series(pd.NaT, index=df.index)
+    repeated = df.index.duplicated(keep=False)
+    unchanged = ~repeated & last_update.notna().to_numpy()
+    if state is not None:
+        previous = state['last_update'].reindex(df.index)
+        unchanged &= (previous == last_update).fillna(False).to_numpy()
+    else:
+        unchanged[:] = False
+
+    # Schema-level failure cases, e.g., missing columns, are found on any
+    # subset of rows, even empty
+    report = _get_failure_cases(df[~unchanged], schema)
+    if report is not None and deduplicate_wide:
+        report = _deduplicate_wide_errors(report, schema)
+    reports = [report]
+    if state is not None:
+        kept = state['report']
+        reports.insert(0, kept[kept['index'].isin(df.index[unchanged])])
+    if unique_index:
+        reports.append(_get_duplicates(df.index, {}))
+    merged = _concat_reports([r for r in reports if r is not None])
+
+    _save_state(state_file, fingerprint, {
+        'last_update': last_update[~repeated],
+        'report': _row_failure_cases(merged),
+    })
+    return merged
+
+
+def schema_fingerprint(
+        schema: DataFrameSchema,
+        add_warnings: bool = False,
+        deduplicate_wide: bool = True,
+) -> str:
+    """Return a checksum of the schema, options and reference data
+
+    The schema is described by the data type, nullability, uniqueness and
+    checks of its index and columns, and by its dataframe-level checks.
+    Check implementations are described by the source files of the package
+    and of the modules defining the check functions, and by the pandas and
+    pandera versions for built-in checks.
+    """
+    components = [('index', schema.index), *schema.columns.items()]
+    lines = [__version__, pd.__version__, pandera.__version__,
+             reference_checksum(),
+             f"{add_warnings} {deduplicate_wide} {schema.coerce}"]
+    hierarchy_file = gaul_hierarchy_file()
+    if hierarchy_file is not None:
+        lines.append(hashlib.blake2b(
+            hierarchy_file.read_bytes(), digest_size=16
+        ).hexdigest())
+    for name, component in components:
+        if component is None:
+            continue
+        lines.append(
+            f"{name} {component.dtype} {component.nullable} "
+            f"{component.unique}"
+        )
+        lines.extend(_describe_check(check) for check in component.checks)
+    lines.extend(_describe_check(check) for check in schema.checks)
+    checks = [
+        *(check for _, component in components if component is not None
+          for check in component.checks),
+        *schema.checks,
+    ]
+    for source in _source_files(checks):
+        lines.append(hashlib.blake2b(
+            source.read_bytes(), digest_size=16
+        ).hexdigest())
+    return hashlib.blake2b(
+        '\n'.join(lines).encode('utf-8'), digest_size=16
+    ).hexdigest()
+
+
+def _describe_check(check) -> str:
+    return (
+        f"{check.name} {check.error} {check.raise_warning} "
+        f"{check.ignore_na} {check.statistics}"
+    )
+
+
+def _source_files(checks: list) -> list[Path]:
+    """Return the source files of the package and of custom check functions
+
+    Built-in checks of pandera are described by its version instead.
+    """
+    files = set(Path(__file__).parent.rglob('*.py'))
+    for check in checks:
+        check_fn = check._check_fn
+        while isinstance(check_fn, functools.partial):
+            check_fn = check_fn.func
+        module_name = getattr(check_fn, '__module__', None) \
+            or type(check_fn).__module__
+        if module_name.split('.')[0] == 'pandera':
+            continue
+        module_file = getattr(sys.modules.get(module_name), '__file__', None)
+        if module_file is not None and Path(module_file).is_file():
+            files.add(Path(module_file))
+    return sorted(files)
+
+
+def _row_failure_cases(report: Optional[pd.DataFrame]) -> pd.DataFrame:
+    """Return the failure cases of single rows, to be kept between runs"""
+    if report is None:
+        return pd.DataFrame(columns=REPORT_COLUMNS)
+    return report[
+        report['index'].notna()
+        & (report['check'] != 'field_uniqueness')
+    ]
+
+
+def _load_state(state_file: Union[str, Path], fingerprint: str) -> \
+        Optional[dict]:
+    feather = _import_feather()
+    if feather is None:
+        return None
+    try:
+        with open(_fingerprint_file(state_file), encoding='utf-8') as f:
+            if json.load(f).get('fingerprint') != fingerprint:
+                return None
+        table = pd.read_parquet(state_file)
+    except (OSError, ValueError, AttributeError):
+        # Missing, corrupt or incompatible state
+        return None
+    if not {'last_update', *REPORT_COLUMNS} <= set(table.columns):
+        return None
+    rows = table.drop_duplicates('index').set_index('index')
+    report = table[table['check'].notna()][REPORT_COLUMNS]
+    report = report.assign(
+        failure_case=report['failure_case'].map(_decode_failure_case)
+    ).reset_index(drop=True)
+    return {'last_update': rows['last_update'], 'report': report}
+
+
+def _save_state(
+        state_file: Union[str, Path],
+        fingerprint: str,
+        state: dict
+) -> None:
+    if _import_feather() is None:
+        return
+    state_file = Path(state_file)
+    state_file.parent.mkdir(parents=True, exist_ok=True)
+    report = state['report'][REPORT_COLUMNS]
+    report = report.assign(
+        failure_case=report['failure_case'].map(_encode_failure_case)
+    )
+    # One row per failure case, and per DisNo. without failure cases
+    last_update = state['last_update']
+    last_update = pd.DataFrame({
+        'index': last_update.index.astype(object),
+        'last_update': last_update.to_numpy(),
+    })
+    table = last_update.merge(
+        report.astype({'index': object}), on='index', how='left'
+    ).astype({'check_number': 'Int64'})
+
+    fingerprint_file = _fingerprint_file(state_file)
+    # The fingerprint is removed until the new state is in place, so that an
+    # interrupted run does not pair the previous fingerprint with new state
+    fingerprint_file.unlink(missing_ok=True)
+    _write_atomic(state_file, lambda path: table.to_parquet(path, index=False))
+    _write_atomic(fingerprint_file, lambda path: path.write_text(
+        json.dumps({'fingerprint': fingerprint}), encoding='utf-8'
+    ))
+
+
+def _fingerprint_file(state_file: Union[str, Path]) -> Path:
+    return Path(f"{state_file}.json")
+
+
+def _write_atomic(path: Path, write) -> None:
+    """Write a file through a temporary file replacing it once complete"""
+    with tempfile.NamedTemporaryFile(
+            dir=path.parent, suffix=path.suffix, delete=False
+    ) as tmp:
+        tmp_path = Path(tmp.name)
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def _encode_failure_case(value: Any) -> str:
+    """Return a failure case as JSON, keeping its type"""
+    if isinstance(value, pd.Timestamp):
+        return json.dumps({'Timestamp': value.isoformat()})
+    if hasattr(value, 'item'):
+        # NumPy scalars
+        value = value.item()
+    return json.dumps(value, default=str)
+
+
+def _decode_failure_case(text: str) -> Any:
+    value = json.loads(text)
+    if isinstance(value, dict) and list(value) == ['Timestamp']:
+        return pd.Timestamp(value['Timestamp'])
+    return value
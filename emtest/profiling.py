@@ -0,0 +1,223 @@
+"""Per-check profiling of schema validation
+
+A `CheckProfiler` records, for each check of a schema, its wall time, the
+number of rows it checked, its failures and, optionally, the peak memory
+allocated while it ran. Pass it to `utils.get_validation_report`:
+
+>>> profiler = CheckProfiler(trace_memory=True)
+>>> report = get_validation_report(emdat, emdat_schema, profiler=profiler)
+>>> profiler.to_frame().head()
+
+A callback receives a `CheckEvent` after each check, e.g., to show the
+progress of long runs.
+"""
+import copy
+import inspect
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, NamedTuple, Optional
+
+import numpy as np
+import pandas as pd
+from pandera import Check, DataFrameSchema
+
+_PROFILER: ContextVar[Optional['CheckProfiler']] = ContextVar(
+    'emtest_check_profiler', default=None
+)
+
+
+class CheckKey(NamedTuple):
+    """Identifies a check within a schema"""
+    schema_context: str
+    column: Optional[str]
+    check: str
+    error: Optional[str]
+
+
+class CheckEvent(NamedTuple):
+    """Measures of one check call, passed to the profiler callback"""
+    key: CheckKey
+    wall_time: float
+    rows: int
+    failures: int
+    peak_memory: Optional[int]
+    completed: int
+    total: int
+
+
+class CheckProfiler:
+    """Collect per-check measures during validation
+
+    Parameters
+    ----------
+    callback : Callable, optional
+        Called with a `CheckEvent` after each check.
+    trace_memory : bool
+        Whether to measure the peak memory allocated by each check with
+        `tracemalloc`, which slows down validation. Peaks are not separated
+        between checks running concurrently in threads.
+    """
+
+    def __init__(
+            self,
+            callback: Optional[Callable[[CheckEvent], Any]] = None,
+            trace_memory: bool = False,
+    ):
+        self.callback = callback
+        self.trace_memory = trace_memory
+        self.events: list[CheckEvent] = []
+        self.total = 0
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def activate(self, schema: DataFrameSchema) -> Iterator['CheckProfiler']:
+        """Profile the instrumented checks run until the context exits"""
+        self.total += count_checks(schema)
+        started_tracing = self.trace_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        token = _PROFILER.set(self)
+        try:
+            yield self
+        finally:
+            _PROFILER.reset(token)
+            if started_tracing:
+                tracemalloc.stop()
+
+    def to_frame(self) -> pd.DataFrame:
+        """Return the measures aggregated by check, in order of first run
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per check, with the number of calls, the wall time in
+            seconds, the number of rows checked, including missing values
+            skipped by the check, the rows checked per second, the number of
+            failures and the peak allocated memory in bytes.
+        """
+        columns = ['calls', 'wall_time', 'rows', 'failures', 'peak_memory']
+        if not self.events:
+            index = pd.MultiIndex.from_tuples([], names=CheckKey._fields)
+            return pd.DataFrame(columns=columns, index=index)
+        events = pd.DataFrame(
+            [(*event.key, 1, event.wall_time, event.rows, event.failures,
+              event.peak_memory) for event in self.events],
+            columns=[*CheckKey._fields, *columns]
+        )
+        profile = events.groupby(
+            list(CheckKey._fields), sort=False, dropna=False
+        ).agg({'calls': 'sum', 'wall_time': 'sum', 'rows': 'sum',
+               'failures': 'sum', 'peak_memory': 'max'})
+        profile.insert(
+            3, 'rows_per_second',
+            profile['rows'] / profile['wall_time'].replace(0, np.nan)
+        )
+        return profile
+
+    def _run(self, key: CheckKey, check: Callable, args: tuple) -> Any:
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        result = check(*args)
+        wall_time = time.perf_counter() - start
+        peak_memory = None
+        if self.trace_memory:
+            peak = tracemalloc.get_traced_memory()[1]
+            peak_memory = max(peak - baseline, 0)
+        rows = _count_rows(args)
+        failures = _count_failures(result.check_output)
+        with self._lock:
+            event = CheckEvent(
+                key, wall_time, rows, failures, peak_memory,
+                len(self.events) + 1, self.total
+            )
+            self.events.append(event)
+        if self.callback is not None:
+            self.callback(event)
+        return result
+
+
+# Options of `Check`, also its attributes, which vary by pandera version
+_CHECK_OPTIONS = [
+    name for name in inspect.signature(Check.__init__).parameters
+    if name not in ('self', 'check_fn', 'check_kwargs')
+]
+
+
+class _ProfiledCheck(Check):
+    """Check reporting each call to the active profiler, if any"""
+
+    _profile_key: CheckKey
+
+    @classmethod
+    def get_backend(cls, check_obj: Any):
+        # Backends are registered for `Check`, not its subclasses
+        return Check.get_backend(check_obj)
+
+    def __call__(self, check_obj: Any, column: Optional[str] = None) -> Any:
+        profiler = _PROFILER.get()
+        if profiler is None:
+            return super().__call__(check_obj, column)
+        return profiler._run(
+            self._profile_key, super().__call__, (check_obj, column)
+        )
+
+
+def instrument_checks(schema: DataFrameSchema) -> DataFrameSchema:
+    """Return a copy of the schema whose checks report to the profiler
+
+    Checks are timed through `Check.__call__`, including element-wise and
+    built-in checks. They run as usual when no profiler is active.
+    """
+    schema_copy = copy.deepcopy(schema)
+    if schema_copy.index is not None:
+        _instrument(schema_copy.index.checks, 'Index', schema_copy.index.name)
+    for name, column in schema_copy.columns.items():
+        _instrument(column.checks, 'Column', name)
+    _instrument(schema_copy.checks, 'DataFrameSchema', None)
+    return schema_copy
+
+
+def count_checks(schema: DataFrameSchema) -> int:
+    """Return the number of checks of the schema"""
+    components = [*schema.columns.values(), schema.index]
+    checks = [c for comp in components if comp is not None
+              for c in comp.checks]
+    return len(checks) + len(schema.checks)
+
+
+def _instrument(checks: list[Check], context: str, column: Optional[str]):
+    # Checks of the copied schema are replaced
+    checks[:] = [_profiled_check(check, CheckKey(
+        context, column, check.name, check.error
+    )) for check in checks]
+
+
+def _profiled_check(check: Check, key: CheckKey) -> '_ProfiledCheck':
+    """Return a profiled check with the function and options of a check"""
+    options = {
+        name: getattr(check, name) for name in _CHECK_OPTIONS
+        if hasattr(check, name)
+    }
+    profiled = _ProfiledCheck(
+        check._check_fn, **options, **check._check_kwargs
+    )
+    profiled._profile_key = key
+    return profiled
+
+
+def _count_rows(args: tuple) -> int:
+    return len(args[0]) if args and hasattr(args[0], '__len__') else 1
+
+
+def _count_failures(result: Any) -> int:
+    """Return the number of failing rows, or 1 for a failing scalar check"""
+    if isinstance(result, pd.DataFrame):
+        result = result.fillna(True).all(axis=1)
+    if isinstance(result, pd.Series):
+        return int(result.size - np.count_nonzero(result.fillna(True)))
+    return int(not result)
@@ -0,0 +1,256 @@
+"""Readers of EM-DAT files
+
+EM-DAT files are read in fixed-size chunks of rows, typed according to the
+validation schema, so that validation can start before the whole file is
+parsed, e.g., with `utils.get_streaming_validation_report`.
+
+With the optional `pyarrow` dependency, `read_emdat` caches the typed data in
+an Arrow IPC file next to the source, which is memory-mapped on later reads
+of the same file. Frames whose types match the schema are flagged, so that
+validation can skip coercion (see `utils.get_validation_report`).
+"""
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Iterator, Optional, Union
+
+import pandas as pd
+from pandera import DataFrameSchema
+from pandera.engines import pandas_engine
+
+DEFAULT_CHUNK_SIZE = 10_000
+TRUSTED_TYPES_ATTR = 'emtest_trusted_types'
+
+
+def get_schema_dtypes(schema: Optional[DataFrameSchema] = None) -> dict:
+    """Return the pandera data types of the index and columns of a schema
+
+    Parameters
+    ----------
+    schema : DataFrameSchema, optional
+        Validation schema, defaults to `emdat_schema`.
+
+    Returns
+    -------
+    dict[str, pandera.dtypes.DataType]
+        Data types keyed by index and column names.
+    """
+    if schema is None:
+        from .validation_schemas import emdat_schema as schema
+    dtypes = {}
+    if schema.index is not None and schema.index.name is not None:
+        dtypes[schema.index.name] = schema.index.dtype
+    for name, column in schema.columns.items():
+        dtypes[name] = column.dtype
+    return dtypes
+
+
+def read_emdat_excel_chunks(
+        path: Union[str, Path],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        schema: Optional[DataFrameSchema] = None,
+        sheet_name: Optional[str] = None,
+) -> Iterator[pd.DataFrame]:
+    """Stream an EM-DAT xlsx file as typed dataframe chunks
+
+    The workbook is opened in read-only mode and its rows are parsed lazily,
+    one chunk at a time. Each chunk is indexed by 'DisNo.' and its columns
+    are coerced to the data types of the schema, including the 'Entry Date'
+    and 'Last Update' timestamps. Empty cells are missing values. Columns
+    that cannot be coerced are left as read, to be reported by validation.
+
+    Parameters
+    ----------
+    path : str
+        file path to xlsx file
+    chunk_size : int
+        number of rows per chunk
+    schema : DataFrameSchema, optional
+        schema defining the data types, defaults to `emdat_schema`
+    sheet_name : str, optional
+        name of the data sheet, defaults to the first sheet
+
+    Yields
+    ------
+    pd.DataFrame
+        Chunks of at most `chunk_size` rows.
+
+    Example
+    -------
+
+    >>> from emtest import emdat_schema
+    >>> from emtest.utils import get_streaming_validation_report
+    >>> chunks = read_emdat_excel_chunks('emdat.xlsx')
+    >>> report = get_streaming_validation_report(chunks, emdat_schema)
+    """
+    import openpyxl
+
+    dtypes = get_schema_dtypes(schema)
+    index_name = 'DisNo.' if schema is None else schema.index.name
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        sheet = (
+            workbook[sheet_name] if sheet_name is not None
+            else workbook.worksheets[0]
+        )
+        rows = sheet.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        records = []
+        for row in rows:
+            records.append(row)
+            if len(records) == chunk_size:
+                yield _to_typed_frame(records, header, dtypes, index_name)
+                records = []
+        if records:
+            yield _to_typed_frame(records, header, dtypes, index_name)
+    finally:
+        workbook.close()
+
+
+def _to_typed_frame(
+        records: list[tuple],
+        header: tuple,
+        dtypes: dict,
+        index_name: Optional[str],
+) -> pd.DataFrame:
+    df = pd.DataFrame.from_records(records, columns=list(header))
+    for name in df.columns:
+        column = df[name]
+        column = column.where(column != '')
+        if name in dtypes:
+            column = _try_coerce(column, dtypes[name])
+        df[name] = column
+    if index_name in df.columns:
+        df = df.set_index(index_name)
+    return df
+
+
+def _try_coerce(column: pd.Series, dtype: Any) -> pd.Series:
+    try:
+        return dtype.coerce(column)
+    except (TypeError, ValueError):
+        return column
+
+
+def read_emdat(
+        path: Union[str, Path],
+        schema: Optional[DataFrameSchema] = None,
+        cache: bool = True,
+) -> pd.DataFrame:
+    """Read an EM-DAT xlsx file into a dataframe typed by the schema
+
+    If `pyarrow` is installed and `cache` is True, the typed data is cached
+    in an uncompressed Arrow IPC file next to the source, named after the
+    checksum of the source file, e.g., 'emdat.xlsx.<checksum>.arrow'. Later
+    reads of the unchanged file memory-map the cache instead of parsing the
+    workbook. Stale caches of the same source are removed. If the cache
+    cannot be written, the data is returned without caching.
+
+    The returned dataframe is flagged as having trusted types if all its
+    data types match the schema, see `has_trusted_types`.
+
+    Parameters
+    ----------
+    path : str
+        file path to xlsx file
+    schema : DataFrameSchema, optional
+        schema defining the data types, defaults to `emdat_schema`
+    cache : bool
+        whether to use the Arrow IPC cache
+
+    Returns
+    -------
+    pd.DataFrame
+        EM-DAT data indexed by 'DisNo.'.
+    """
+    path = Path(path)
+    feather = _import_feather() if cache else None
+    if feather is None:
+        df = _read_excel_typed(path, schema)
+    else:
+        cache_file = path.with_name(f"{path.name}.{file_checksum(path)}.arrow")
+        try:
+            df = feather.read_table(cache_file, memory_map=True).to_pandas()
+        except (OSError, ValueError):
+            df = _read_excel_typed(path, schema)
+            _write_cache(df, path, cache_file, feather)
+    df.attrs[TRUSTED_TYPES_ATTR] = matches_schema_dtypes(df, schema)
+    return df
+
+
+def has_trusted_types(df: pd.DataFrame) -> bool:
+    """Return whether the data types of a dataframe are flagged as trusted
+
+    Frames returned by `read_emdat` are flagged if their data types match the
+    schema. The flag is carried along by pandas operations that propagate
+    `DataFrame.attrs`, such as row selection.
+    """
+    return bool(df.attrs.get(TRUSTED_TYPES_ATTR, False))
+
+
+def matches_schema_dtypes(
+        df: pd.DataFrame,
+        schema: Optional[DataFrameSchema] = None
+) -> bool:
+    """Return whether the index and columns have the schema data types"""
+    dtypes = get_schema_dtypes(schema)
+    series = {name: df[name] for name in df.columns if name in dtypes}
+    if df.index.name in dtypes:
+        series[df.index.name] = df.index
+    return all(
+        dtypes[name].check(pandas_engine.Engine.dtype(values.dtype))
+        for name, values in series.items()
+    )
+
+
+def file_checksum(path: Union[str, Path]) -> str:
+    """Return a checksum of the content of a file"""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as file:
+        for block in iter(lambda: file.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _read_excel_typed(
+        path: Path,
+        schema: Optional[DataFrameSchema]
+) -> pd.DataFrame:
+    chunks = list(read_emdat_excel_chunks(path, schema=schema))
+    if len(chunks) == 1:
+        return chunks[0]
+    return pd.concat(chunks)
+
+
+def _write_cache(
+        df: pd.DataFrame,
+        source: Path,
+        cache_file: Path,
+        feather: Any
+) -> None:
+    tmp = None
+    try:
+        # Atomic write, as several processes may read the same source
+        with tempfile.NamedTemporaryFile(
+                dir=cache_file.parent, suffix='.arrow', delete=False
+        ) as tmp:
+            feather.write_feather(df, tmp, compression='uncompressed')
+        os.replace(tmp.name, cache_file)
+        for stale in source.parent.glob(f"{source.name}.*.arrow"):
+            if stale != cache_file:
+                stale.unlink(missing_ok=True)
+    except (OSError, TypeError, ValueError):
+        # Unwritable directory, or columns left untyped, e.g., mixed types
+        if tmp is not None:
+            Path(tmp.name).unlink(missing_ok=True)
+
+
+def _import_feather() -> Any:
+    try:
+        from pyarrow import feather
+    except ImportError:
+        return None
+    return feather
@@ -0,0 +1,209 @@
+"""Estimated failure rates from a stratified sample of rows
+
+To decide quickly whether a large EM-DAT file is badly broken, a fraction of
+its rows is validated, sampled in each stratum of disaster type and start
+year, and the failure rate of each check is estimated with a confidence
+interval:
+
+>>> estimates = estimate_failure_rates(emdat, emdat_schema, 0.01, seed=0)
+>>> passes_gate(estimates, max_failure_rate=0.05)
+"""
+import math
+from statistics import NormalDist
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from pandera import DataFrameSchema
+
+from .utils import get_validation_report
+
+STRATA = ('Disaster Type', 'Start Year')
+
+ESTIMATE_COLUMNS = [
+    'schema_context', 'column', 'check', 'sampled_rows', 'failing_rows',
+    'failure_rate', 'ci_low', 'ci_high', 'estimated_failures'
+]
+
+
+def estimate_failure_rates(
+        df: pd.DataFrame,
+        schema: DataFrameSchema,
+        fraction: float,
+        strata: Sequence[str] = STRATA,
+        confidence: float = 0.95,
+        seed: Optional[int] = None,
+        add_warnings: bool = False,
+        trusted_types: Optional[bool] = None,
+) -> pd.DataFrame:
+    """Estimate the failure rate of each check from a stratified sample
+
+    Rows are sampled with `stratified_sample`, validated, and the share of
+    failing rows of each check is estimated with stratum weights. The
+    confidence interval is the Wilson score interval for the effective
+    sample size of the weighted sample. Wide check failures are counted
+    once per row. Schema-level failures, e.g., a missing column, have a
+    failure rate of 1. Duplicated DisNo. are only found within the sample,
+    so that index uniqueness is underestimated.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        EM-DAT dataframe.
+    schema : DataFrameSchema
+        Validation schema.
+    fraction : float
+        Share of rows sampled in each stratum, between 0 and 1.
+    strata : Sequence[str]
+        Columns defining the strata, ignored if missing.
+    confidence : float
+        Confidence level of the intervals.
+    seed : int, optional
+        Seed of the random sample.
+    add_warnings : bool
+        Whether to report warnings as errors.
+    trusted_types : bool, optional
+        Whether to check data types without coercion, by default for frames
+        flagged by `readers.read_emdat`.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per check, with the number of sampled and failing rows, the
+        estimated failure rate, its confidence interval and the estimated
+        number of failing rows in `df`, by decreasing failure rate.
+    """
+    positions, weights = stratified_sample(df, fraction, strata, seed)
+    sample = df.iloc[positions]
+    report = get_validation_report(
+        sample, schema, add_warnings=add_warnings, trusted_types=trusted_types
+    )
+    checks = _schema_checks(schema)
+    if report is not None:
+        report = report.assign(column=report['column'].where(
+            report['schema_context'] != 'DataFrameSchema'
+        ))
+        found = report[['schema_context', 'column', 'check']]
+        checks = pd.concat([checks, found]).drop_duplicates(ignore_index=True)
+
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    n_effective = weights.sum() ** 2 / (weights ** 2).sum() \
+        if len(weights) else 0.
+    rows = []
+    for context, column, check in checks.itertuples(index=False):
+        failing = np.zeros(len(sample), dtype=bool)
+        schema_level = False
+        if report is not None:
+            cases = report[
+                (report['schema_context'] == context)
+                & (report['check'] == check)
+                & ((report['column'] == column) if pd.notna(column)
+                   else report['column'].isna())
+            ]
+            schema_level = cases['index'].isna().any()
+            failing = sample.index.isin(cases['index'].dropna())
+        if schema_level:
+            rate, low, high = 1., 1., 1.
+        elif len(weights):
+            rate = float(weights[failing].sum() / weights.sum())
+            low, high = wilson_interval(rate, n_effective, z)
+        else:
+            rate, low, high = np.nan, 0., 1.
+        rows.append((context, column, check, len(sample),
+                     int(failing.sum()), rate, low, high, rate * len(df)))
+    estimates = pd.DataFrame(rows, columns=ESTIMATE_COLUMNS)
+    return estimates.sort_values(
+        'failure_rate', ascending=False, kind='stable'
+    ).reset_index(drop=True)
+
+
+def stratified_sample(
+        df: pd.DataFrame,
+        fraction: float,
+        strata: Sequence[str] = STRATA,
+        seed: Optional[int] = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Sample a fraction of the rows of each stratum
+
+    Each stratum contributes `ceil(fraction * size)` rows, at least one.
+    Missing values form their own stratum.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        Positions of the sampled rows in `df`, in increasing order, and their
+        weights, the number of rows of their stratum per sampled row.
+    """
+    if not 0 < fraction <= 1:
+        raise ValueError("fraction must be in (0, 1]")
+    rng = np.random.default_rng(seed)
+    keys = [name for name in strata if name in df.columns]
+    if keys and len(df):
+        codes = df.groupby(keys, dropna=False, sort=False).ngroup() \
+            .to_numpy()
+    else:
+        codes = np.zeros(len(df), dtype=np.int64)
+    sizes = np.bincount(codes) if len(df) else np.zeros(0, dtype=np.int64)
+    n_sampled = np.minimum(np.ceil(sizes * fraction), sizes).astype(np.int64)
+
+    # Random order within each stratum, strata in a row
+    order = np.lexsort((rng.random(len(df)), codes))
+    starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    rank = np.arange(len(df)) - starts[codes[order]]
+    selected = order[rank < n_sampled[codes[order]]]
+    positions = np.sort(selected)
+    stratum = codes[positions]
+    weights = sizes[stratum] / n_sampled[stratum]
+    return positions, weights
+
+
+def wilson_interval(
+        rate: float,
+        n: float,
+        z: float = 1.96
+) -> tuple[float, float]:
+    """Return the Wilson score interval of a proportion
+
+    Parameters
+    ----------
+    rate : float
+        Observed proportion.
+    n : float
+        Sample size, possibly effective, i.e., not an integer.
+    z : float
+        Standard normal quantile of the confidence level.
+    """
+    if n <= 0:
+        return 0., 1.
+    denominator = 1 + z ** 2 / n
+    center = (rate + z ** 2 / (2 * n)) / denominator
+    margin = z * math.sqrt(
+        rate * (1 - rate) / n + z ** 2 / (4 * n ** 2)
+    ) / denominator
+    return max(center - margin, 0.), min(center + margin, 1.)
+
+
+def passes_gate(
+        estimates: pd.DataFrame,
+        max_failure_rate: float = 0.,
+) -> bool:
+    """Return whether no check fails more often than allowed, confidently
+
+    A dataframe is rejected if the lower bound of the failure rate of any
+    check exceeds `max_failure_rate`.
+    """
+    return not (estimates['ci_low'] > max_failure_rate).any()
+
+
+def _schema_checks(schema: DataFrameSchema) -> pd.DataFrame:
+    """Return the schema context, column and report label of each check"""
+    rows = []
+    if schema.index is not None:
+        rows.extend(('Index', schema.index.name, check.error or check.name)
+                    for check in schema.index.checks)
+    for name, column in schema.columns.items():
+        rows.extend(('Column', name, check.error or check.name)
+                    for check in column.checks)
+    rows.extend(('DataFrameSchema', None, check.error or check.name)
+                for check in schema.checks)
+    return pd.DataFrame(rows, columns=['schema_context', 'column', 'check'])
@@ -0,0 +1,136 @@
+"""Summary validation reports with failure counts only
+
+When a reference check fails on most rows of a large archive, the failure
+cases of a full report take millions of rows. A summary report only keeps,
+for each check and column, the number of failure cases and failing rows, and
+a bounded sample of distinct failure cases and DisNo. `ReportSummary`
+aggregates the reports of chunks validated one at a time by
+`utils.get_summary_report`, so that the failure cases of all rows are never
+held at once:
+
+>>> summary = get_summary_report(emdat, emdat_schema, max_samples=5)
+>>> summary.groupby('check')['failing_rows'].sum()
+"""
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+KEY_COLUMNS = ['schema_context', 'column', 'check']
+
+SUMMARY_COLUMNS = [
+    *KEY_COLUMNS, 'failure_cases', 'failing_rows', 'sample_failure_cases',
+    'sample_index'
+]
+
+
+class ReportSummary:
+    """Failure counts and samples of validation reports, updated by chunk
+
+    Parameters
+    ----------
+    max_samples : int
+        Maximum number of distinct failure cases and DisNo. kept per check
+        and column.
+    """
+
+    def __init__(self, max_samples: int = 10):
+        if max_samples < 0:
+            raise ValueError("max_samples must be non-negative")
+        self.max_samples = max_samples
+        self._counts: dict[tuple, list[int]] = {}
+        self._cases: dict[tuple, dict] = {}
+        self._index: dict[tuple, dict] = {}
+        # Schema-level failure cases, repeated in every chunk
+        self._schema_level: set = set()
+
+    def update(self, report: Optional[pd.DataFrame]) -> None:
+        """Add the failure cases of a chunk report"""
+        if report is None or report.empty:
+            return
+        report = report[[*KEY_COLUMNS, 'failure_case', 'index']]
+        no_index = report['index'].isna().to_numpy()
+        if no_index.any():
+            repeated = np.zeros(len(report), dtype=bool)
+            repeated[no_index] = [
+                self._seen_schema_level(row)
+                for row in report[no_index].itertuples(index=False)
+            ]
+            if repeated.any():
+                report = report[~repeated]
+
+        groups = report.groupby(KEY_COLUMNS, dropna=False, sort=False)
+        counts = pd.DataFrame({
+            'failure_cases': groups.size(),
+            'failing_rows': groups['index'].nunique(),
+        })
+        for key, cases, rows in counts.itertuples():
+            totals = self._counts.setdefault(key, [0, 0])
+            totals[0] += cases
+            totals[1] += rows
+        if self.max_samples:
+            self._add_samples(report, 'failure_case', self._cases)
+            self._add_samples(report.dropna(subset='index'), 'index',
+                              self._index)
+
+    def to_frame(self) -> Optional[pd.DataFrame]:
+        """Return the summary by check and column, None without failures
+
+        Sampled failure cases and DisNo. are lists in order of appearance.
+        """
+        if not self._counts:
+            return None
+        rows = [
+            (*key, cases, failing_rows,
+             list(self._cases.get(key, {}).values()),
+             list(self._index.get(key, {}).values()))
+            for key, (cases, failing_rows) in self._counts.items()
+        ]
+        summary = pd.DataFrame(rows, columns=SUMMARY_COLUMNS)
+        return summary.astype({
+            'failure_cases': np.int64, 'failing_rows': np.int64
+        })
+
+    def _seen_schema_level(self, row: tuple) -> bool:
+        key = tuple(str(value) for value in row)
+        if key in self._schema_level:
+            return True
+        self._schema_level.add(key)
+        return False
+
+    def _add_samples(
+            self,
+            report: pd.DataFrame,
+            column: str,
+            samples: dict[tuple, dict]
+    ) -> None:
+        """Add the first distinct values of `column` of unfilled samples"""
+        full = {key for key, values in samples.items()
+                if len(values) >= self.max_samples}
+        values = report[[*KEY_COLUMNS, column]].drop_duplicates()
+        if full:
+            keys = pd.MultiIndex.from_frame(values[KEY_COLUMNS])
+            values = values[~keys.isin(list(full))]
+        # At most `max_samples` new values per key are needed
+        rank = values.groupby(KEY_COLUMNS, dropna=False, sort=False) \
+            .cumcount()
+        values = values[rank.to_numpy() < self.max_samples]
+        for *key, value in values.itertuples(index=False):
+            key = tuple(key)
+            sample = samples.setdefault(key, {})
+            if len(sample) < self.max_samples:
+                value = None if _is_missing(value) else value
+                sample.setdefault(_sample_key(value), value)
+
+
+def _is_missing(value) -> bool:
+    return not isinstance(value, (list, tuple)) and bool(pd.isna(value))
+
+
+def _sample_key(value):
+    """Return a hashable key of a failure case"""
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        return repr(value)
@@ -0,0 +1,529 @@
+"""Synthetic EM-DAT data for load tests
+
+`generate_emdat` builds EM-DAT frames of any size that pass `emdat_schema`,
+drawing classification and area tuples, GAUL codes and external IDs from the
+reference data. Values are drawn column by column from random arrays and
+small pools of strings, so that millions of rows are generated in seconds.
+
+Errors are injected at a given rate per check, e.g., to measure how
+validation time and report size grow with the failure rate:
+
+>>> df = generate_emdat(1_000_000, error_rates={'check_country': 0.01},
+...                     seed=0)
+"""
+from datetime import datetime
+from typing import Callable, Optional
+
+import numpy as np
+import pandas as pd
+
+from .validation_data import areas, classification
+
+EMDAT_START_DATE = np.datetime64('1988-01-01')
+FIRST_YEAR = 1900
+
+# Share of rows with a defined value, by column
+DEFINED_SHARES: dict[str, float] = {
+    'External IDs': 0.3,
+    'Event Name': 0.2,
+    'Location': 0.9,
+    'Origin': 0.3,
+    'Associated Types': 0.2,
+    'AID Contribution': 0.05,
+    'Coordinates': 0.2,
+    'River Basin': 0.1,
+    'Month': 0.95,
+    'Day': 0.85,
+    'Total Deaths': 0.7,
+    'No. Injured': 0.3,
+    'No. Affected': 0.5,
+    'No. Homeless': 0.1,
+    'Costs': 0.05,
+    'Insured Damage': 0.05,
+    'Total Damage': 0.3,
+    'Admin Units': 0.6,
+    'GADM Admin Units': 0.2,
+}
+
+_EVENT_NAMES = ['Alpha', 'Bravo', 'Charlie', 'Delta', 'Echo', 'Foxtrot']
+_ORIGINS = ['Heavy rains', 'Monsoon rains', 'Tropical depression',
+            'Cold front', 'Short circuit', 'Brakes failure']
+_ASSOCIATED_TYPES = ['Flood', 'Slide (land, mud, snow, rock)',
+                     'Power Outage|Flood', 'Fire', 'Cold wave']
+_RIVER_BASINS = ['Danube', 'Mekong', 'Niger', 'Amazon', 'Meuse']
+_GLIDE_HAZARDS = ['FL', 'EQ', 'TC', 'DR', 'EP', 'ST']
+_GADM_UNITS = ['[{"gid_1": "BEL.1_1"}]', '[{"gid_2": "FRA.11.75_1"}]']
+_MAGNITUDE_UNITS = {
+    'Earthquake': 'Moment Magnitude',
+    'Extreme temperature': '°C',
+    'Storm': 'Kph',
+    'Epidemic': 'Vaccinated',
+    'Oil spill': 'm3',
+    'Chemical spill': 'm3',
+}
+_POOL_SIZE = 1_000
+
+Injection = Callable[[pd.DataFrame, np.ndarray, np.random.Generator], None]
+
+
+def generate_emdat(
+        n_rows: int,
+        error_rates: Optional[dict[str, float]] = None,
+        seed: Optional[int] = None,
+) -> pd.DataFrame:
+    """Generate a synthetic EM-DAT dataframe
+
+    Without errors, every row passes `emdat_schema`: DisNo. are unique and
+    match the start year and ISO code, classifications and areas are
+    reference tuples, dates are consistent and magnitudes are realistic for
+    their disaster type. The optional GAUL hierarchy is not followed.
+
+    Parameters
+    ----------
+    n_rows : int
+        Number of rows.
+    error_rates : dict[str, float], optional
+        Share of rows failing each check, keyed by check name, see
+        `INJECTED_CHECKS`. A check applied to several columns fails at this
+        rate in each column. Rows are drawn independently for each check,
+        and injected errors may also fail related checks, e.g., a lowercase
+        ISO code also differs from the DisNo. ISO.
+    seed : int, optional
+        Seed of the random generator, for reproducible frames.
+
+    Returns
+    -------
+    pd.DataFrame
+        EM-DAT data indexed by 'DisNo.', with the columns and data types of
+        `emdat_schema`.
+    """
+    error_rates = error_rates or {}
+    unknown = set(error_rates) - set(INJECTED_CHECKS)
+    if unknown:
+        raise ValueError(f"Unknown checks: {sorted(unknown)}")
+    if any(not 0 <= rate <= 1 for rate in error_rates.values()):
+        raise ValueError("Error rates must be between 0 and 1")
+
+    rng = np.random.default_rng(seed)
+    df = _generate_valid(n_rows, rng)
+    for name, rate in error_rates.items():
+        rows = rng.random(n_rows) < rate
+        if rows.any():
+            INJECTED_CHECKS[name](df, rows, rng)
+    return df
+
+
+def _generate_valid(n: int, rng: np.random.Generator) -> pd.DataFrame:
+    today = np.datetime64(datetime.now().date(), 'D')
+
+    tree = classification.classification
+    classif = rng.integers(0, len(tree), n)
+    area_table = areas.areas.dropna(subset=['Region Name'])
+    area = rng.integers(0, len(area_table), n)
+    iso = _take(area_table['ISO-alpha3 Code'], area)
+
+    # Events last up to 60 days and end before today. They start after the
+    # first year, which leaves room to inject earlier years.
+    first_day = np.datetime64(f'{FIRST_YEAR + 1}-01-01', 'D')
+    n_days = int((today - first_day) // np.timedelta64(1, 'D')) - 60
+    start = first_day + rng.integers(0, n_days, n).astype('timedelta64[D]')
+    end = start + rng.integers(0, 60, n).astype('timedelta64[D]')
+    start_year, start_month, start_day = _date_parts(start)
+    end_year, end_month, end_day = _date_parts(end)
+    month_defined = rng.random(n) < DEFINED_SHARES['Month']
+    day_defined = month_defined & (rng.random(n) < DEFINED_SHARES['Day'])
+
+    entry = np.maximum(start, EMDAT_START_DATE) \
+        + rng.integers(0, 365, n).astype('timedelta64[D]')
+    entry = np.minimum(entry, today - np.timedelta64(1, 'D'))
+    update = entry + (
+        rng.random(n) * ((today - entry) // np.timedelta64(1, 'D'))
+    ).astype('timedelta64[D]')
+
+    cpi = rng.uniform(5., 100., n)
+    magnitude, magnitude_scale = _magnitudes(tree, classif, rng)
+    coordinates = _defined(rng, n, 'Coordinates')
+    injured = _counts(rng, n, 'No. Injured')
+    affected = _counts(rng, n, 'No. Affected')
+    homeless = _counts(rng, n, 'No. Homeless')
+    affected_parts = np.stack([injured, affected, homeless])
+    total_affected = np.where(
+        np.isnan(affected_parts).all(axis=0), np.nan,
+        np.nansum(affected_parts, axis=0)
+    )
+    costs = _amounts(rng, n, 'Costs')
+    insured = _amounts(rng, n, 'Insured Damage')
+    damage = _amounts(rng, n, 'Total Damage')
+
+    columns = {
+        'Historic': _choice(['No', 'Yes'], (start_year < 2000).astype(int)),
+        'Classification Key': _take(tree['classif_key'], classif),
+        'Disaster Group': _take(tree['group'], classif),
+        'Disaster Subgroup': _take(tree['subgroup'], classif),
+        'Disaster Type': _take(tree['type'], classif),
+        'Disaster Subtype': _take(tree['subtype'], classif),
+        'External IDs': _pick(_external_ids(rng), rng, n, 'External IDs'),
+        'Event Name': _pick(_EVENT_NAMES, rng, n, 'Event Name'),
+        'ISO': iso,
+        'Country': _take(area_table['Country or Area'], area),
+        'Subregion': _take(area_table['Sub-region Name'], area),
+        'Region': _take(area_table['Region Name'], area),
+        'Location': _take(area_table['Country or Area'], np.where(
+            _defined(rng, n, 'Location'), area, -1
+        )),
+        'Origin': _pick(_ORIGINS, rng, n, 'Origin'),
+        'Associated Types': _pick(
+            _ASSOCIATED_TYPES, rng, n, 'Associated Types'
+        ),
+        'OFDA/BHA Response': _choice(['No', 'Yes'], rng.integers(0, 2, n)),
+        'Appeal': _choice(['No', 'Yes'], rng.integers(0, 2, n)),
+        'Declaration': _choice(['No', 'Yes'], rng.integers(0, 2, n)),
+        "AID Contribution ('000 US$)": _amounts(rng, n, 'AID Contribution'),
+        'Magnitude': magnitude,
+        'Magnitude Scale': magnitude_scale,
+        'Latitude': np.where(coordinates, rng.uniform(-90, 90, n), np.nan),
+        'Longitude': np.where(coordinates, rng.uniform(-180, 180, n),
+                              np.nan),
+        'River Basin': _pick(_RIVER_BASINS, rng, n, 'River Basin'),
+        'Start Year': start_year,
+        'Start Month': np.where(month_defined, start_month, np.nan),
+        'Start Day': np.where(day_defined, start_day, np.nan),
+        'End Year': end_year,
+        'End Month': np.where(month_defined, end_month, np.nan),
+        'End Day': np.where(day_defined, end_day, np.nan),
+        'Total Deaths': _counts(rng, n, 'Total Deaths'),
+        'No. Injured': injured,
+        'No. Affected': affected,
+        'No. Homeless': homeless,
+        'Total Affected': total_affected,
+        "Reconstruction Costs ('000 US$)": costs,
+        "Reconstruction Costs, Adjusted ('000 US$)": costs * 100 / cpi,
+        "Insured Damage ('000 US$)": insured,
+        "Insured Damage, Adjusted ('000 US$)": insured * 100 / cpi,
+        "Total Damage ('000 US$)": damage,
+        "Total Damage, Adjusted ('000 US$)": damage * 100 / cpi,
+        'CPI': cpi,
+        'Admin Units': _pick(_admin_units(rng), rng, n, 'Admin Units'),
+        'GADM Admin Units': _pick(_GADM_UNITS, rng, n, 'GADM Admin Units'),
+        'Entry Date': entry.astype('datetime64[ns]'),
+        'Last Update': update.astype('datetime64[ns]'),
+    }
+    df = pd.DataFrame(columns)
+    df.index = _disno(start_year, iso)
+    return df
+
+
+def _disno(year: np.ndarray, iso: pd.Series) -> pd.Index:
+    """Return unique DisNo. numbered by year and ISO in row order"""
+    sequence = pd.DataFrame({'year': year, 'iso': iso}).groupby(
+        ['year', 'iso'], sort=False
+    ).cumcount().to_numpy()
+    if sequence.max(initial=0) > 9999:
+        raise ValueError("More than 10000 events in a year and country")
+    years = np.arange(FIRST_YEAR, year.max(initial=FIRST_YEAR) + 1)
+    disno = (
+        _choice(years.astype(str), year - FIRST_YEAR) + '-'
+        + _choice([f'{i:04d}' for i in range(10_000)], sequence) + '-'
+        + iso
+    )
+    return pd.Index(disno, name='DisNo.')
+
+
+def _date_parts(dates: np.ndarray) -> tuple[np.ndarray, ...]:
+    months = dates.astype('datetime64[M]')
+    year = months.astype('datetime64[Y]').astype(np.int64) + 1970
+    month = months.astype(np.int64) % 12 + 1
+    day = (dates - months).astype(np.int64) + 1
+    return year, month.astype(float), day.astype(float)
+
+
+def _magnitudes(
+        tree: pd.DataFrame,
+        classif: np.ndarray,
+        rng: np.random.Generator
+) -> tuple[np.ndarray, pd.Series]:
+    """Draw magnitudes in the realistic range of each disaster type"""
+    n = len(classif)
+    subtype = tree['subtype'].to_numpy()[classif]
+    dis_type = tree['type'].to_numpy()[classif]
+    magnitude = rng.lognormal(8, 2, n)
+    magnitude = np.where(dis_type == 'Earthquake',
+                         rng.uniform(3, 9, n), magnitude)
+    magnitude = np.where(subtype == 'Cold wave',
+                         rng.uniform(-40, 5, n), magnitude)
+    magnitude = np.where(subtype == 'Heat wave',
+                         rng.uniform(30, 50, n), magnitude)
+    units = tree['type'].map(_MAGNITUDE_UNITS).fillna('Km2')
+    return magnitude, _take(units, classif)
+
+
+def _external_ids(rng: np.random.Generator) -> list[str]:
+    """Return a pool of valid external IDs, some of them pipe-separated"""
+    glide = [
+        f"GLIDE:{hazard}-{year}-{number:06d}"
+        for hazard, year, number in zip(
+            rng.choice(_GLIDE_HAZARDS, _POOL_SIZE),
+            rng.integers(FIRST_YEAR, 2025, _POOL_SIZE),
+            rng.integers(0, 1_000_000, _POOL_SIZE),
+        )
+    ]
+    usgs = [
+        'USGS:' + ''.join(chars) for chars in
+        rng.choice(list('0123456789abcdefghijklmnopqrstuvwxyz'),
+                   (_POOL_SIZE, 10))
+    ]
+    dfo = [f"DFO:{number}" for number in rng.integers(1000, 9999, _POOL_SIZE)]
+    hanze = [f"HANZE:{number}" for number in rng.integers(1, 99999,
+                                                          _POOL_SIZE)]
+    ids = glide + usgs + dfo + hanze
+    return ids + [f"{a}|{b}" for a, b in zip(glide, usgs)]
+
+
+def _admin_units(rng: np.random.Generator) -> list[str]:
+    """Return a pool of Admin Units JSON strings of one or two GAUL units"""
+    units = [
+        f'{{"adm{level}_code": {code}}}'
+        for level, codes in ((1, areas.ADM1_GAUL_CODES),
+                             (2, areas.ADM2_GAUL_CODES))
+        for code in rng.choice(codes, _POOL_SIZE)
+    ]
+    first, second = rng.choice(units, (2, _POOL_SIZE))
+    return [f"[{unit}]" for unit in units] \
+        + [f"[{a}, {b}]" for a, b in zip(first, second)]
+
+
+def _defined(rng: np.random.Generator, n: int, name: str) -> np.ndarray:
+    return rng.random(n) < DEFINED_SHARES[name]
+
+
+def _pick(
+        pool: list[str],
+        rng: np.random.Generator,
+        n: int,
+        name: str
+) -> pd.Series:
+    """Draw values from a pool, missing in the undefined share of rows"""
+    codes = np.where(_defined(rng, n, name),
+                     rng.integers(0, len(pool), n), -1)
+    return _choice(pool, codes)
+
+
+def _counts(rng: np.random.Generator, n: int, name: str) -> np.ndarray:
+    counts = np.ceil(rng.lognormal(3, 2, n))
+    return np.where(_defined(rng, n, name), counts, np.nan)
+
+
+def _amounts(rng: np.random.Generator, n: int, name: str) -> np.ndarray:
+    amounts = rng.lognormal(8, 2, n)
+    return np.where(_defined(rng, n, name), amounts, np.nan)
+
+
+def _take(values: pd.Series, codes: np.ndarray) -> pd.Series:
+    return _choice(values.tolist(), codes)
+
+
+def _choice(pool, codes: np.ndarray) -> pd.Series:
+    """Return pool strings by position, missing for negative codes
+
+    Strings are taken from a string array of the pool, without creating
+    one Python string per row.
+    """
+    array = pd.array(list(pool), dtype='str')
+    return pd.Series(array.take(codes, allow_fill=True))
+
+
+# Error injections
+# ----------------
+# Each function modifies the selected rows of a valid frame in place, so
+# that they fail the check.
+
+def _set(df: pd.DataFrame, rows: np.ndarray, column: str, value) -> None:
+    df.loc[rows, column] = value
+
+
+def _inject_disno(df, rows, rng):
+    disno = df.index.to_series()
+    disno[rows] = disno[rows].str.replace('-', '_')
+    df.index = pd.Index(disno, name=df.index.name)
+
+
+def _inject_duplicate_disno(df, rows, rng):
+    # Duplicate records of the previous rows
+    positions = np.flatnonzero(rows)
+    positions = positions[positions > 0]
+    df.iloc[positions] = df.iloc[positions - 1].to_numpy()
+    disno = df.index.to_numpy(dtype=object).copy()
+    disno[positions] = disno[positions - 1]
+    df.index = pd.Index(disno, dtype='str', name=df.index.name)
+
+
+def _inject_value(columns: list[str], value) -> Injection:
+    def inject(df, rows, rng):
+        for column in columns:
+            _set(df, _redraw(rows, rng) if len(columns) > 1 else rows,
+                 column, value)
+    return inject
+
+
+def _inject_in_range(df, rows, rng):
+    out_of_range = {
+        'Latitude': 91., 'Longitude': 181.,
+        'Start Year': FIRST_YEAR - 1, 'End Year': 2100, 'CPI': 150.,
+        'Entry Date': pd.Timestamp('1987-01-01'),
+        'Last Update': pd.Timestamp('2100-01-01'),
+    }
+    for column, value in out_of_range.items():
+        column_rows = _redraw(rows, rng)
+        _set(df, column_rows, column, value)
+        if column in ('Latitude', 'Longitude'):
+            # Both coordinates stay defined
+            other = 'Longitude' if column == 'Latitude' else 'Latitude'
+            _set(df, column_rows & df[other].isna().to_numpy(), other, 0.)
+
+
+def _inject_greater_than(df, rows, rng):
+    for column in _POSITIVE_COLUMNS:
+        _set(df, _redraw(rows, rng), column, -10.)
+
+
+def _inject_lowercase_iso(df, rows, rng):
+    df.loc[rows, 'ISO'] = df.loc[rows, 'ISO'].str.lower()
+
+
+def _inject_both_coordinates(df, rows, rng):
+    _set(df, rows, 'Latitude', 45.)
+    _set(df, rows, 'Longitude', np.nan)
+
+
+def _inject_day_without_month(start_or_end: str) -> Injection:
+    def inject(df, rows, rng):
+        _set(df, rows, f'{start_or_end} Month', np.nan)
+        _set(df, rows, f'{start_or_end} Day', 1.)
+    return inject
+
+
+def _inject_start_after_end(resolution: str) -> Injection:
+    def inject(df, rows, rng):
+        if resolution == 'year':
+            df.loc[rows, 'End Year'] = df.loc[rows, 'Start Year'] - 1
+            return
+        df.loc[rows, 'End Year'] = df.loc[rows, 'Start Year']
+        if resolution == 'month':
+            _set(df, rows, 'Start Month', 12.)
+            _set(df, rows, 'End Month', 1.)
+        else:
+            month = df.loc[rows, 'Start Month'].fillna(1.)
+            _set(df, rows, 'Start Month', month)
+            _set(df, rows, 'End Month', month)
+            _set(df, rows, 'Start Day', 28.)
+            _set(df, rows, 'End Day', 1.)
+    return inject
+
+
+def _inject_calendar_date(start_or_end: str) -> Injection:
+    def inject(df, rows, rng):
+        # February 30, within a chronological start and end
+        df.loc[rows, 'End Year'] = df.loc[rows, 'Start Year']
+        if start_or_end == 'Start':
+            dates = {'Start Month': 2., 'Start Day': 30.,
+                     'End Month': 3., 'End Day': 1.}
+        else:
+            dates = {'Start Month': 2., 'Start Day': 1.,
+                     'End Month': 2., 'End Day': 30.}
+        for column, value in dates.items():
+            _set(df, rows, column, value)
+    return inject
+
+
+def _inject_disno_vs_iso(df, rows, rng):
+    iso = df['ISO'].to_numpy(dtype=object)
+    other = np.where(iso == 'BEL', 'FRA', 'BEL')
+    df.loc[rows, 'ISO'] = other[rows]
+
+
+def _inject_day(df, rows, rng):
+    for start_or_end in ('Start', 'End'):
+        day_rows = _redraw(rows, rng)
+        _set(df, day_rows, f'{start_or_end} Day', 32.)
+        month = df.loc[day_rows, f'{start_or_end} Month']
+        _set(df, day_rows, f'{start_or_end} Month', month.fillna(1.))
+
+
+def _inject_disno_vs_start_year(df, rows, rng):
+    df.loc[rows, 'Start Year'] = df.loc[rows, 'Start Year'] - 1
+
+
+def _inject_magnitude(classif_key: str, value: float) -> Injection:
+    def inject(df, rows, rng):
+        tree = classification.classification.set_index('classif_key')
+        row = tree.loc[classif_key]
+        df.loc[rows, 'Classification Key'] = classif_key
+        for column, field in (('Disaster Group', 'group'),
+                              ('Disaster Subgroup', 'subgroup'),
+                              ('Disaster Type', 'type'),
+                              ('Disaster Subtype', 'subtype')):
+            df.loc[rows, column] = row[field]
+        _set(df, rows, 'Magnitude', value)
+    return inject
+
+
+def _redraw(rows: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """Draw rows at the same rate, for checks applied to several columns"""
+    return rng.random(len(rows)) < rows.mean()
+
+
+_POSITIVE_COLUMNS = [
+    "AID Contribution ('000 US$)", 'Total Deaths', 'No. Injured',
+    'No. Affected', 'No. Homeless', 'Total Affected',
+    "Reconstruction Costs ('000 US$)",
+    "Reconstruction Costs, Adjusted ('000 US$)",
+    "Insured Damage ('000 US$)", "Insured Damage, Adjusted ('000 US$)",
+    "Total Damage ('000 US$)", "Total Damage, Adjusted ('000 US$)",
+]
+
+# Error injections keyed by the name of the check they fail
+INJECTED_CHECKS: dict[str, Injection] = {
+    'check_disno': _inject_disno,
+    'field_uniqueness': _inject_duplicate_disno,
+    'check_yes_no': _inject_value(
+        ['Historic', 'OFDA/BHA Response', 'Appeal', 'Declaration'], 'Maybe'
+    ),
+    'check_classification_key': _inject_value(
+        ['Classification Key'], 'nat-xxx-xxx-xxx'
+    ),
+    'check_goup': _inject_value(['Disaster Group'], 'Supernatural'),
+    'check_subgroup': _inject_value(['Disaster Subgroup'], 'Cosmic'),
+    'check_type': _inject_value(['Disaster Type'], 'Alien invasion'),
+    'check_subtype': _inject_value(['Disaster Subtype'], 'Martian'),
+    'check_external_ids': _inject_value(['External IDs'], 'FOO:123'),
+    'validate_iso3_code': _inject_lowercase_iso,
+    'check_iso3_code': _inject_value(['ISO'], 'XXX'),
+    'check_country': _inject_value(['Country'], 'Atlantis'),
+    'check_subregion': _inject_value(['Subregion'], 'Middle-earth'),
+    'check_region': _inject_value(['Region'], 'Gondwana'),
+    'check_magnitude_unit': _inject_value(['Magnitude Scale'], 'Richter'),
+    'in_range': _inject_in_range,
+    'greater_than': _inject_greater_than,
+    'check_disno_vs_start_year': _inject_disno_vs_start_year,
+    'check_month': _inject_value(['Start Month', 'End Month'], 13.),
+    'check_day': _inject_day,
+    'check_json_strings': _inject_value(
+        ['Admin Units', 'GADM Admin Units'], '[{"adm1_code": '
+    ),
+    'check_GAUL_codes': _inject_value(
+        ['Admin Units'], '[{"adm1_code": 999999999}]'
+    ),
+    'check_both_lat_lon_coordinates': _inject_both_coordinates,
+    'check_no_start_day_if_no_month': _inject_day_without_month('Start'),
+    'check_no_end_day_if_no_month': _inject_day_without_month('End'),
+    'check_start_end_year_consistency': _inject_start_after_end('year'),
+    'check_start_end_month_consistency': _inject_start_after_end('month'),
+    'check_start_end_day_consistency': _inject_start_after_end('day'),
+    'check_start_calendar_date': _inject_calendar_date('Start'),
+    'check_end_calendar_date': _inject_calendar_date('End'),
+    'check_disno_vs_iso': _inject_disno_vs_iso,
+    'check_coldwave_magnitude': _inject_magnitude('nat-met-ext-col', 20.),
+    'check_earthquake_magnitude': _inject_magnitude('nat-geo-ear-gro', 12.),
+    'check_heatwave_magnitude': _inject_magnitude('nat-met-ext-hea', 10.),
+    'check_other_magnitude': _inject_magnitude('nat-hyd-flo-flo', 0.),
+}
@@ -1,21 +1,51 @@
 import copy
-from typing import Optional
+from collections import OrderedDict
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
+from contextvars import copy_context
+from itertools import repeat
+from typing import Iterable, Iterator, Optional, Union
 
+import numpy as np
 import pandas as pd
-from pandera import DataFrameSchema, Check
+from pandera import DataFrameSchema, Check, Column, Index
 from pandera.errors import SchemaErrors
 
+from .derived import derived_cache
+from .profiling import CheckProfiler, instrument_checks
+from .readers import get_schema_dtypes, has_trusted_types
+
+# Maximum number of schema variants kept by `schema_variant`
+SCHEMA_VARIANTS_SIZE = 32
+
+# Rows of the first chunk of fail-fast validation, doubled for each chunk
+FAIL_FAST_CHUNK_SIZE = 10_000
+# Rows validated at once by `get_summary_report` without chunk bounds
+SUMMARY_CHUNK_SIZE = 100_000
+
+# Report attribute of fail-fast reports, False if rows were left unvalidated
+COMPLETE_ATTR = 'emtest_complete'
+
+_SCHEMA_VARIANTS: OrderedDict = OrderedDict()
+
+# Columns kept in the failure cases of wide checks, by check name
 WIDE_CHECKS_TO_KEEP: dict[str, list[str]] = {
-    'Missing latitude or longitude coordinates': ['Latitude', 'Longitude'],
-    'Invalid coldwave magnitude': ['Magnitude'],
-    'Invalid earthquake magnitude': ['Magnitude'],
-    'Invalid heatwave magnitude': ['Magnitude'],
-    'Invalid magnitude': ['Magnitude'],
-    'Missing start month value': ['Start Month', 'Start Day'],
-    'Missing end month value': ['End Month', 'End Day'],
-    'Start date inconsistency at the year resolution': ['Start Year'],
-    'Start date inconsistency at the month resolution': ['Start Month'],
-    'Start date inconsistency at the day resolution': ['Start Day']
+    'check_both_lat_lon_coordinates': ['Latitude', 'Longitude'],
+    'check_coldwave_magnitude': ['Magnitude'],
+    'check_earthquake_magnitude': ['Magnitude'],
+    'check_heatwave_magnitude': ['Magnitude'],
+    'check_other_magnitude': ['Magnitude'],
+    'check_no_start_day_if_no_month': ['Start Month', 'Start Day'],
+    'check_no_end_day_if_no_month': ['End Month', 'End Day'],
+    'check_start_end_year_consistency': ['Start Year'],
+    'check_start_end_month_consistency': ['Start Month'],
+    'check_start_end_day_consistency': ['Start Day'],
+    'check_start_calendar_date': ['Start Day'],
+    'check_end_calendar_date': ['End Day'],
+    'check_disno_vs_iso': ['ISO'],
+    'check_GAUL_hierarchy': ['Admin Units'],
 }
 
 
@@ -24,22 +54,460 @@ def get_validation_report(
         schema: DataFrameSchema,
         add_warnings: bool = False,
         deduplicate_wide: bool = True,
+        trusted_types: Optional[bool] = None,
+        n_workers: Optional[int] = None,
+        n_threads: Optional[int] = None,
+        profiler: Optional[CheckProfiler] = None,
+        max_failures: Optional[int] = None,
+        sample_fraction: Optional[float] = None,
+        summary: bool = False,
 ) -> Optional[pd.DataFrame]:
-    """Return schema errors as a dataframe report"""
-    if add_warnings:
-        schema = set_warnings_to_errors(schema)
-    try:
-        schema.validate(df, lazy=True)
-    except SchemaErrors as e:
-        report = e.failure_cases
-        if deduplicate_wide:
-            for error, column_to_keep in WIDE_CHECKS_TO_KEEP.items():
-                report = deduplicate_errors(
-                    report,
-                    error_message=error,
-                    keep_columns=column_to_keep
-                )
-        return report
+    """Return schema errors as a dataframe report
+
+    With `trusted_types`, data types are checked but not coerced, which
+    saves converting every column. By default, types are trusted for frames
+    flagged by `readers.read_emdat`.
+
+    With `n_workers` greater than 1, the dataframe is split into row
+    partitions validated in parallel by as many worker processes, see
+    `get_parallel_validation_report`. With `n_threads` greater than 1, the
+    checks of the index and columns run concurrently in a pool of threads,
+    followed by the dataframe-level checks. Both report the same failure
+    cases as the sequential validation, though not in the same order.
+
+    With a `profiler.CheckProfiler`, the wall time, rows, failures and
+    memory of each check are recorded, which is not supported with worker
+    processes.
+
+    For quick gating, `max_failures` stops each check after its first
+    failing rows, trimming the report, see `get_fail_fast_validation_report`,
+    and `sample_fraction` validates a stratified sample of rows and returns
+    estimated failure rates instead of failure cases, see
+    `sampling.estimate_failure_rates`. With `summary`, only failure counts
+    and samples by check and column are returned, see
+    `get_summary_report`. These modes return reports of different
+    shapes, so a `ValueError` is raised if more than one is given, or if one
+    is combined with `n_workers`, `n_threads` or `profiler`.
+    """
+    modes = [name for name, given in (
+        ('summary', summary),
+        ('sample_fraction', sample_fraction is not None),
+        ('max_failures', max_failures is not None),
+    ) if given]
+    if len(modes) > 1:
+        raise ValueError(f"{' and '.join(modes)} cannot be combined")
+    options = [name for name, given in (
+        ('n_workers', n_workers is not None and n_workers > 1),
+        ('n_threads', n_threads is not None and n_threads > 1),
+        ('profiler', profiler is not None),
+    ) if given]
+    if modes and options:
+        raise ValueError(
+            f"{modes[0]} cannot be combined with {' and '.join(options)}"
+        )
+    if summary:
+        return get_summary_report(
+            df, schema, add_warnings, deduplicate_wide,
+            trusted_types=trusted_types
+        )
+    if sample_fraction is not None:
+        from .sampling import estimate_failure_rates
+
+        return estimate_failure_rates(
+            df, schema, sample_fraction, add_warnings=add_warnings,
+            trusted_types=trusted_types
+        )
+    if max_failures is not None:
+        return get_fail_fast_validation_report(
+            df, schema, max_failures, add_warnings, deduplicate_wide,
+            trusted_types
+        )
+    if n_workers is not None and n_workers > 1:
+        if profiler is not None:
+            raise ValueError("profiler requires n_workers of 1 or None")
+        return get_parallel_validation_report(
+            df, schema, add_warnings, deduplicate_wide, trusted_types,
+            n_workers=n_workers
+        )
+    if trusted_types is None:
+        trusted_types = has_trusted_types(df)
+    schema = schema_variant(
+        schema, add_warnings=add_warnings, trusted_types=trusted_types,
+        instrumented=profiler is not None
+    )
+    with (profiler.activate(schema) if profiler is not None
+          else nullcontext()):
+        if n_threads is not None and n_threads > 1:
+            report = _get_threaded_failure_cases(df, schema, n_threads)
+        else:
+            report = _get_failure_cases(df, schema)
+    if report is not None and deduplicate_wide:
+        report = _deduplicate_wide_errors(report, schema)
+    return report
+
+
+def get_parallel_validation_report(
+        df: pd.DataFrame,
+        schema: DataFrameSchema,
+        add_warnings: bool = False,
+        deduplicate_wide: bool = True,
+        trusted_types: Optional[bool] = None,
+        n_workers: Optional[int] = None,
+        partitions_per_worker: int = 4,
+) -> Optional[pd.DataFrame]:
+    """Return schema errors as a report, validating row partitions in parallel
+
+    The dataframe is split into `n_workers * partitions_per_worker` row
+    partitions, validated in a pool of worker processes. The schema is sent
+    once to each worker, which loads the reference data on its first
+    partition. The partition reports are merged in row order, holding the
+    DisNo. of each failure case in the 'index' column, and index uniqueness
+    is enforced across partitions as in `get_streaming_validation_report`.
+    Failure cases are the same as with `get_validation_report`, though not
+    in the same order.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        EM-DAT dataframe.
+    schema : DataFrameSchema
+        Validation schema.
+    add_warnings : bool
+        Whether to report warnings as errors.
+    deduplicate_wide : bool
+        Whether to keep only relevant columns of wide check failures.
+    trusted_types : bool, optional
+        Whether to check data types without coercion, by default for frames
+        flagged by `readers.read_emdat`.
+    n_workers : int, optional
+        Number of worker processes, defaults to the number of processors.
+    partitions_per_worker : int
+        Number of row partitions per worker, to balance the workload.
+
+    Returns
+    -------
+    pd.DataFrame or None
+        Failure cases of all partitions, None if the dataframe is valid.
+    """
+    if trusted_types is None:
+        trusted_types = has_trusted_types(df)
+    # Uniqueness is enforced across partitions below
+    unique_index = _has_unique_index(schema)
+    schema = schema_variant(
+        schema, add_warnings=add_warnings, trusted_types=trusted_types,
+        unique_index=False
+    )
+
+    n_workers = n_workers or os.cpu_count() or 1
+    n_partitions = n_workers * partitions_per_worker
+    partitions = list(
+        rechunk(df, chunk_size=math.ceil(len(df) / n_partitions))
+    ) or [df]
+    with ProcessPoolExecutor(
+            n_workers, initializer=_init_worker, initargs=(schema,)
+    ) as pool:
+        reports = pool.map(
+            _validate_partition, partitions, repeat(deduplicate_wide)
+        )
+        seen: dict = {}
+        merged = []
+        for partition, report in zip(partitions, reports):
+            if unique_index:
+                report = _add_duplicates(report, partition.index, seen)
+            if report is not None:
+                merged.append(report)
+    return _concat_reports(merged)
+
+
+def get_streaming_validation_report(
+        chunks: Union[Iterable[pd.DataFrame], pd.DataFrame],
+        schema: DataFrameSchema,
+        add_warnings: bool = False,
+        deduplicate_wide: bool = True,
+        chunk_size: Optional[int] = None,
+        memory_budget: Optional[int] = None,
+        trusted_types: Optional[bool] = None,
+) -> Optional[pd.DataFrame]:
+    """Return schema errors of a stream of dataframe chunks as one report
+
+    Chunks are validated one at a time, so that only one chunk and its
+    failure cases are in memory besides the merged report. The chunk size
+    can be bounded in rows with `chunk_size`, or in bytes of data with
+    `memory_budget` (see `rechunk`). The report 'index' column holds the
+    DisNo. of each failure case, and index uniqueness is enforced across
+    chunks: all occurrences of a repeated DisNo. are reported.
+
+    Parameters
+    ----------
+    chunks : Iterable[pd.DataFrame]
+        EM-DAT dataframe chunks, e.g., successive archives or file chunks.
+    schema : DataFrameSchema
+        Validation schema.
+    add_warnings : bool
+        Whether to report warnings as errors.
+    deduplicate_wide : bool
+        Whether to keep only relevant columns of wide check failures.
+    chunk_size : int, optional
+        Maximum number of rows validated at once.
+    memory_budget : int, optional
+        Maximum number of bytes of data validated at once.
+    trusted_types : bool, optional
+        Whether to check data types without coercion, by default for chunks
+        flagged by `readers.read_emdat`.
+
+    Returns
+    -------
+    pd.DataFrame or None
+        Failure cases of all chunks, None if all chunks are valid.
+    """
+    reports = _chunk_reports(
+        rechunk(chunks, chunk_size, memory_budget), schema, add_warnings,
+        deduplicate_wide, trusted_types
+    )
+    return _concat_reports([r for r in reports if r is not None])
+
+
+def get_summary_report(
+        chunks: Union[Iterable[pd.DataFrame], pd.DataFrame],
+        schema: DataFrameSchema,
+        add_warnings: bool = False,
+        deduplicate_wide: bool = True,
+        max_samples: int = 10,
+        chunk_size: Optional[int] = None,
+        memory_budget: Optional[int] = None,
+        trusted_types: Optional[bool] = None,
+) -> Optional[pd.DataFrame]:
+    """Return failure counts by check and column, without failure cases
+
+    Chunks are validated one at a time, as with
+    `get_streaming_validation_report`, and their failure cases are
+    aggregated by a `summary.ReportSummary` then discarded. A dataframe is
+    split in chunks of `SUMMARY_CHUNK_SIZE` rows unless `chunk_size` or
+    `memory_budget` is given. Counts are those of the streaming report.
+
+    Parameters
+    ----------
+    chunks : Iterable[pd.DataFrame]
+        EM-DAT dataframe, or dataframe chunks.
+    schema : DataFrameSchema
+        Validation schema.
+    add_warnings : bool
+        Whether to report warnings as errors.
+    deduplicate_wide : bool
+        Whether to keep only relevant columns of wide check failures.
+    max_samples : int
+        Maximum number of distinct failure cases and DisNo. kept per check
+        and column.
+    chunk_size : int, optional
+        Maximum number of rows validated at once.
+    memory_budget : int, optional
+        Maximum number of bytes of data validated at once.
+    trusted_types : bool, optional
+        Whether to check data types without coercion, by default for chunks
+        flagged by `readers.read_emdat`.
+
+    Returns
+    -------
+    pd.DataFrame or None
+        Number of failure cases and failing rows, and samples of distinct
+        failure cases and DisNo., by check and column. None if all chunks
+        are valid.
+    """
+    from .summary import ReportSummary
+
+    if chunk_size is None and memory_budget is None:
+        chunk_size = SUMMARY_CHUNK_SIZE
+    summary = ReportSummary(max_samples)
+    for report in _chunk_reports(
+            rechunk(chunks, chunk_size, memory_budget), schema, add_warnings,
+            deduplicate_wide, trusted_types
+    ):
+        summary.update(report)
+    return summary.to_frame()
+
+
+def get_fail_fast_validation_report(
+        df: pd.DataFrame,
+        schema: DataFrameSchema,
+        max_failures: int,
+        add_warnings: bool = False,
+        deduplicate_wide: bool = True,
+        trusted_types: Optional[bool] = None,
+        first_chunk_size: int = FAIL_FAST_CHUNK_SIZE,
+        stop_early: bool = False,
+) -> Optional[pd.DataFrame]:
+    """Return schema errors as a report, stopping checks after K failures
+
+    Rows are validated in chunks of growing size, starting with
+    `first_chunk_size` rows and doubling for each chunk. A check is dropped
+    from the next chunks once all its instances, e.g., `check_yes_no` on
+    every Yes/No column, have `max_failures` failing rows. Data types,
+    nullability and uniqueness are checked on every chunk.
+
+    Checks that do not fail are evaluated on every row, so that by default
+    the report is trimmed but the run saves only the time of the dropped
+    checks. For a quick go/no-go decision, `stop_early` stops as soon as
+    every check that failed has `max_failures` failing rows, leaving the
+    other checks unevaluated on the remaining rows. A report is then
+    returned as soon as the dataframe is known to be invalid, and its
+    `attrs[COMPLETE_ATTR]` is False if rows were not validated.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        EM-DAT dataframe.
+    schema : DataFrameSchema
+        Validation schema.
+    max_failures : int
+        Number of failing rows reported per check.
+    add_warnings : bool
+        Whether to report warnings as errors.
+    deduplicate_wide : bool
+        Whether to keep only relevant columns of wide check failures.
+    trusted_types : bool, optional
+        Whether to check data types without coercion, by default for frames
+        flagged by `readers.read_emdat`.
+    first_chunk_size : int
+        Number of rows of the first chunk.
+    stop_early : bool
+        Whether to stop once every failing check has `max_failures` failing
+        rows, rather than once all checks have.
+
+    Returns
+    -------
+    pd.DataFrame or None
+        Failure cases of at most `max_failures` rows per check, None if the
+        dataframe is valid.
+    """
+    if max_failures < 1:
+        raise ValueError("max_failures must be at least 1")
+    if trusted_types is None:
+        trusted_types = has_trusted_types(df)
+    # Uniqueness is enforced across chunks below
+    unique_index = _has_unique_index(schema)
+    full_schema = schema_variant(
+        schema, add_warnings=add_warnings, trusted_types=trusted_types,
+        unique_index=False
+    )
+    labels = _check_labels(full_schema)
+    remaining = frozenset(labels)
+
+    failing: dict[str, int] = {}
+    seen: dict = {}
+    reports = []
+    validated = 0
+    for chunk in _growing_chunks(df, first_chunk_size):
+        validated += len(chunk)
+        chunk_schema = full_schema if remaining == set(labels) else \
+            schema_variant(full_schema, checks=remaining)
+        report = _get_failure_cases(chunk, chunk_schema)
+        if report is not None and deduplicate_wide:
+            report = _deduplicate_wide_errors(report, chunk_schema)
+        if unique_index:
+            report = _add_duplicates(report, chunk.index, seen)
+        if report is not None:
+            reports.append(_first_failures(report, failing, max_failures))
+        remaining = frozenset(
+            name for name in remaining
+            if any(failing.get(label, 0) < max_failures
+                   for label in labels[name])
+        )
+        if not remaining:
+            break
+        if stop_early and reports and not any(
+                failing.get(label, 0) for name in remaining
+                for label in labels[name]
+        ):
+            # All failing checks are exhausted
+            break
+    report = _concat_reports(reports)
+    if report is not None:
+        report.attrs[COMPLETE_ATTR] = validated >= len(df)
+    return report
+
+
+def rechunk(
+        chunks: Union[Iterable[pd.DataFrame], pd.DataFrame],
+        chunk_size: Optional[int] = None,
+        memory_budget: Optional[int] = None,
+) -> Iterator[pd.DataFrame]:
+    """Split dataframe chunks by number of rows or by size in memory
+
+    Parameters
+    ----------
+    chunks : Iterable[pd.DataFrame]
+        Dataframe chunks, or a single dataframe.
+    chunk_size : int, optional
+        Maximum number of rows per chunk.
+    memory_budget : int, optional
+        Maximum number of bytes per chunk, estimated from the mean deep
+        memory usage of the rows of each input chunk.
+    """
+    if isinstance(chunks, pd.DataFrame):
+        chunks = [chunks]
+    for chunk in chunks:
+        n_rows = len(chunk) if chunk_size is None else chunk_size
+        if memory_budget is not None and len(chunk) > 0:
+            row_bytes = chunk.memory_usage(deep=True).sum() / len(chunk)
+            n_rows = min(n_rows, int(memory_budget // row_bytes))
+        n_rows = max(n_rows, 1)
+        for start in range(0, len(chunk), n_rows):
+            yield chunk.iloc[start:start + n_rows]
+
+
+def compact_emdat(
+        df: pd.DataFrame,
+        schema: Optional[DataFrameSchema] = None
+) -> pd.DataFrame:
+    """Return a copy of an EM-DAT dataframe with compact string columns
+
+    String columns and index held as Python objects are converted to Arrow
+    strings with missing values as NaN, i.e., the string data type of the
+    schema on pandas 3 and 'string[pyarrow_numpy]' on pandas 2. Arrow
+    strings take a fraction of the memory of Python strings and are accepted
+    by the schema, with or without coercion. Without `pyarrow`, strings are
+    left as they are. Categorical data types are not used, as the schema
+    rejects them with coercion.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        EM-DAT dataframe.
+    schema : DataFrameSchema, optional
+        Validation schema, defaults to `emdat_schema`.
+
+    Returns
+    -------
+    pd.DataFrame
+        Dataframe with the same values and attributes.
+    """
+    dtypes = get_schema_dtypes(schema)
+    compact = df.copy(deep=False)
+    for name in df.columns:
+        if _is_string_dtype(dtypes.get(name)):
+            compact[name] = _to_compact_strings(df[name], dtypes[name])
+    if _is_string_dtype(dtypes.get(df.index.name)):
+        compact.index = _to_compact_strings(df.index, dtypes[df.index.name])
+    return compact
+
+
+def memory_report(df: pd.DataFrame) -> pd.DataFrame:
+    """Return the memory footprint of the index and each column
+
+    Returns
+    -------
+    pd.DataFrame
+        Data type, number of distinct values, and deep memory usage in bytes
+        and as a share of the total, by decreasing memory usage.
+    """
+    usage = df.memory_usage(deep=True)
+    report = pd.DataFrame({
+        'dtype': [str(df.index.dtype)] + [str(t) for t in df.dtypes],
+        'n_unique': [df.index.nunique()] + [df[c].nunique() for c in df],
+        'bytes': usage.to_numpy(),
+    }, index=usage.index)
+    report['share'] = report['bytes'] / report['bytes'].sum()
+    return report.sort_values('bytes', ascending=False)
 
 
 def update_column_checks(
@@ -61,6 +529,117 @@ def set_warnings_to_errors(schema: DataFrameSchema) -> DataFrameSchema:
     return schema_copy
 
 
+def without_coercion(schema: DataFrameSchema) -> DataFrameSchema:
+    """Return a copy of the schema checking data types without coercion"""
+    # Shallow copies share their state with the schema on older pandera
+    schema_copy = copy.deepcopy(schema)
+    schema_copy.coerce = False
+    return schema_copy
+
+
+def select_checks(
+        schema: DataFrameSchema,
+        names: Iterable[str]
+) -> DataFrameSchema:
+    """Return a copy of the schema with only the checks of the given names
+
+    Index and column checks, and dataframe-level checks, are selected by
+    their `name`. Data types, nullability and uniqueness are still checked.
+    """
+    names = set(names)
+
+    def selected(checks: list[Check]) -> list[Check]:
+        return [check for check in checks if check.name in names]
+
+    schema_copy = schema.update_columns({
+        name: {'checks': selected(column.checks)}
+        for name, column in schema.columns.items()
+    })
+    if schema.index is not None:
+        schema_copy = schema_copy.update_index(
+            schema.index.name, checks=selected(schema.index.checks)
+        )
+    schema_copy.checks = selected(schema.checks)
+    return schema_copy
+
+
+def schema_variant(
+        schema: DataFrameSchema,
+        add_warnings: bool = False,
+        trusted_types: bool = False,
+        unique_index: bool = True,
+        strict: Optional[Union[bool, str]] = None,
+        checks: Optional[Iterable[str]] = None,
+        instrumented: bool = False,
+) -> DataFrameSchema:
+    """Return a variant of a schema, built once and then reused
+
+    Variants are kept in a registry keyed by the identity of `schema` and
+    the options, so that repeated reports do not copy the schema again.
+    The registry holds the last `SCHEMA_VARIANTS_SIZE` variants. A schema
+    modified in place after building its variants requires
+    `clear_schema_variants()`.
+
+    Parameters
+    ----------
+    schema : DataFrameSchema
+        Validation schema.
+    add_warnings : bool
+        Whether to raise warnings as errors, see `set_warnings_to_errors`.
+    trusted_types : bool
+        Whether to check data types without coercion, see
+        `without_coercion`.
+    unique_index : bool
+        Whether to check index uniqueness, if required by the schema.
+    strict : bool or 'filter', optional
+        Overrides the `strict` option of the schema on extra columns.
+    checks : Iterable[str], optional
+        Names of the checks to keep, see `select_checks`.
+    instrumented : bool
+        Whether checks report to the active profiler, see
+        `profiling.instrument_checks`.
+
+    Returns
+    -------
+    DataFrameSchema
+        The variant, or `schema` itself without options.
+    """
+    if checks is not None:
+        checks = frozenset(checks)
+    key = (id(schema), add_warnings, trusted_types, unique_index, strict,
+           checks, instrumented)
+    entry = _SCHEMA_VARIANTS.get(key)
+    if entry is not None and entry[0] is schema:
+        _SCHEMA_VARIANTS.move_to_end(key)
+        return entry[1]
+
+    variant = schema
+    if checks is not None:
+        variant = select_checks(variant, checks)
+    if add_warnings:
+        variant = set_warnings_to_errors(variant)
+    if trusted_types:
+        variant = without_coercion(variant)
+    if not unique_index and _has_unique_index(variant):
+        variant = variant.update_index(variant.index.name, unique=False)
+    if strict is not None and strict != variant.strict:
+        variant = copy.deepcopy(variant)
+        variant.strict = strict
+    if instrumented:
+        variant = instrument_checks(variant)
+
+    # Holding `schema` prevents the reuse of its identifier
+    _SCHEMA_VARIANTS[key] = (schema, variant)
+    if len(_SCHEMA_VARIANTS) > SCHEMA_VARIANTS_SIZE:
+        _SCHEMA_VARIANTS.popitem(last=False)
+    return variant
+
+
+def clear_schema_variants() -> None:
+    """Empty the registry of schema variants"""
+    _SCHEMA_VARIANTS.clear()
+
+
 def deduplicate_errors(
         report: pd.DataFrame,
         error_message: str,
@@ -72,3 +651,286 @@ def deduplicate_errors(
         ].index
     return report.drop(index_to_drop)
 
+
+def _get_failure_cases(
+        df: pd.DataFrame,
+        schema: Union[DataFrameSchema, Column, Index],
+        inplace: bool = False
+) -> Optional[pd.DataFrame]:
+    """Return schema failure cases, None if the dataframe is valid"""
+    return _validate(df, schema, inplace)[1]
+
+
+def _validate(
+        df: pd.DataFrame,
+        schema: Union[DataFrameSchema, Column, Index],
+        inplace: bool = False
+) -> tuple[pd.DataFrame, Optional[pd.DataFrame]]:
+    """Return the validated dataframe and its failure cases, if any"""
+    try:
+        # Checks share derived columns, e.g., parsed DisNo. or Admin Units
+        with derived_cache():
+            return schema.validate(df, lazy=True, inplace=inplace), None
+    except SchemaErrors as e:
+        return e.data, e.failure_cases
+
+
+def _get_threaded_failure_cases(
+        df: pd.DataFrame,
+        schema: DataFrameSchema,
+        n_threads: int
+) -> Optional[pd.DataFrame]:
+    """Return schema failure cases, running component checks in threads
+
+    Validation runs in three stages: the schema without checks coerces the
+    data and checks its structure, data types, nullability and uniqueness,
+    then the checks of the index and of each column run concurrently on the
+    coerced data, and finally the dataframe-level checks.
+    """
+    structure = schema_variant(schema, checks=())
+
+    with derived_cache():
+        coerced, report = _validate(df, structure)
+        reports = [report]
+
+        # Components without data type, only checked, in place
+        components: list[Union[Column, Index]] = [
+            Column(checks=column.checks, nullable=True, name=name)
+            for name, column in schema.columns.items()
+            if column.checks and name in coerced.columns
+        ]
+        if schema.index is not None and schema.index.checks:
+            components.insert(0, Index(
+                checks=schema.index.checks, nullable=True,
+                name=schema.index.name
+            ))
+        # Threads share the derived columns of the current context
+        context = copy_context()
+        with ThreadPoolExecutor(n_threads) as pool:
+            reports.extend(pool.map(
+                lambda component: context.copy().run(
+                    _get_failure_cases, coerced, component, True
+                ),
+                components
+            ))
+        reports.append(_get_failure_cases(
+            coerced, DataFrameSchema(checks=schema.checks), inplace=True
+        ))
+
+    reports = [report for report in reports if report is not None]
+    if reports:
+        return pd.concat(reports, ignore_index=True)
+
+
+def _deduplicate_wide_errors(
+        report: pd.DataFrame,
+        schema: DataFrameSchema
+) -> pd.DataFrame:
+    """Keep the relevant columns of wide check failure cases, in one pass
+
+    Failure cases of the dataframe-level checks of `schema` named in
+    `WIDE_CHECKS_TO_KEEP` are identified by their check number, and only
+    kept for the listed columns.
+    """
+    kept_columns = [WIDE_CHECKS_TO_KEEP.get(c.name) for c in schema.checks]
+    if report.empty or all(kept is None for kept in kept_columns):
+        return report
+    column_codes, columns = pd.factorize(report['column'])
+    # Whether to keep failure cases by check number and column code, the
+    # last row and column standing for other checks and missing columns
+    keep = np.ones((len(kept_columns) + 1, len(columns) + 1), dtype=bool)
+    for check_number, kept in enumerate(kept_columns):
+        if kept is not None:
+            keep[check_number, :-1] = columns.isin(kept)
+            keep[check_number, -1] = False
+    check_number = pd.to_numeric(report['check_number'], errors='coerce')
+    is_wide = (
+        (report['schema_context'] == 'DataFrameSchema').to_numpy()
+        & check_number.notna().to_numpy()
+    )
+    check_codes = np.where(
+        is_wide, check_number.fillna(-1).to_numpy(dtype=np.int64), -1
+    )
+    mask = keep[check_codes, column_codes]
+    return report if mask.all() else report[mask]
+
+
+def _chunk_reports(
+        chunks: Iterable[pd.DataFrame],
+        schema: DataFrameSchema,
+        add_warnings: bool,
+        deduplicate_wide: bool,
+        trusted_types: Optional[bool],
+) -> Iterator[Optional[pd.DataFrame]]:
+    """Validate chunks one at a time, yielding the report of each chunk
+
+    Index uniqueness is enforced across chunks: all occurrences of a
+    repeated DisNo. are reported.
+    """
+    unique_index = _has_unique_index(schema)
+    seen: dict = {}
+    for chunk in chunks:
+        chunk_schema = schema_variant(
+            schema, add_warnings=add_warnings,
+            trusted_types=bool(trusted_types) or (
+                trusted_types is None and has_trusted_types(chunk)
+            ),
+            unique_index=False
+        )
+        report = _get_failure_cases(chunk, chunk_schema)
+        if report is not None and deduplicate_wide:
+            report = _deduplicate_wide_errors(report, chunk_schema)
+        if unique_index:
+            report = _add_duplicates(report, chunk.index, seen)
+        yield report
+
+
+def _check_labels(schema: DataFrameSchema) -> dict[str, set[str]]:
+    """Return the report labels of the checks of a schema, by check name"""
+    components = [*schema.columns.values(), schema.index]
+    checks = [check for component in components if component is not None
+              for check in component.checks]
+    labels: dict[str, set[str]] = {}
+    for check in [*checks, *schema.checks]:
+        labels.setdefault(check.name, set()).add(check.error or check.name)
+    return labels
+
+
+def _first_failures(
+        report: pd.DataFrame,
+        failing: dict[str, int],
+        max_failures: int
+) -> pd.DataFrame:
+    """Keep the failure cases of the first failing rows of each check
+
+    `failing` holds the number of failing rows reported so far by check
+    label, and is updated. Failure cases without index are kept.
+    """
+    rows = report[['check', 'index']].dropna().drop_duplicates()
+    rank = rows.groupby('check', sort=False).cumcount().to_numpy() \
+        + rows['check'].map(failing).fillna(0).to_numpy(dtype=np.int64)
+    kept = rows[rank < max_failures]
+    for label, count in kept['check'].value_counts().items():
+        failing[label] = failing.get(label, 0) + count
+    keep = report['index'].isna() | pd.MultiIndex.from_frame(
+        report[['check', 'index']]
+    ).isin(pd.MultiIndex.from_frame(kept))
+    return report if keep.all() else report[keep]
+
+
+def _growing_chunks(
+        df: pd.DataFrame,
+        first_chunk_size: int
+) -> Iterator[pd.DataFrame]:
+    """Split a dataframe in chunks of doubling size, at least one chunk"""
+    start, size = 0, max(first_chunk_size, 1)
+    while True:
+        yield df.iloc[start:start + size]
+        start += size
+        size *= 2
+        if start >= len(df):
+            return
+
+
+def _has_unique_index(schema: DataFrameSchema) -> bool:
+    return schema.index is not None and bool(schema.index.unique)
+
+
+def _add_duplicates(
+        report: Optional[pd.DataFrame],
+        index: pd.Index,
+        seen: dict
+) -> Optional[pd.DataFrame]:
+    duplicates = _get_duplicates(index, seen)
+    if duplicates is None:
+        return report
+    return pd.concat([duplicates, report])
+
+
+def _concat_reports(reports: list[pd.DataFrame]) -> Optional[pd.DataFrame]:
+    """Concatenate chunk reports, None if there are none
+
+    Schema-level failure cases without index, e.g., a missing column or an
+    invalid data type, are reported once rather than once per chunk.
+    """
+    if not reports:
+        return None
+    report = pd.concat(reports, ignore_index=True)
+    repeated = report[report['index'].isna()].astype(str).duplicated()
+    if repeated.any():
+        report = report.drop(repeated.index[repeated]).reset_index(drop=True)
+    return report
+
+
+_WORKER_SCHEMA: Optional[DataFrameSchema] = None
+
+
+def _init_worker(schema: DataFrameSchema) -> None:
+    global _WORKER_SCHEMA
+    _WORKER_SCHEMA = schema
+
+
+def _validate_partition(
+        partition: pd.DataFrame,
+        deduplicate_wide: bool
+) -> Optional[pd.DataFrame]:
+    report = _get_failure_cases(partition, _WORKER_SCHEMA)
+    if report is not None and deduplicate_wide:
+        report = _deduplicate_wide_errors(report, _WORKER_SCHEMA)
+    return report
+
+
+def _get_duplicates(index: pd.Index, seen: dict) -> Optional[pd.DataFrame]:
+    """Return uniqueness failure cases of index values seen before
+
+    `seen` maps index values seen in previous chunks to whether they have
+    already been reported, and is updated with the values of `index`.
+    Failure cases follow the format of pandera's 'field_uniqueness' check.
+    """
+    duplicates = []
+    for value in index:
+        if value in seen:
+            if not seen[value]:
+                # Also report the first occurrence
+                duplicates.append(value)
+                seen[value] = True
+            duplicates.append(value)
+        else:
+            seen[value] = False
+    if duplicates:
+        return pd.DataFrame({
+            'schema_context': 'Index',
+            'column': index.name,
+            'check': 'field_uniqueness',
+            'check_number': None,
+            'failure_case': duplicates,
+            'index': duplicates,
+        })
+
+
+def _is_string_dtype(dtype) -> bool:
+    # pandas string data type on pandas 3, numpy `str_` on pandas 2
+    return dtype is not None and pd.api.types.is_string_dtype(dtype.type)
+
+
+def _compact_string_dtype(dtype) -> Optional[pd.StringDtype]:
+    """Return the Arrow string data type accepted for `dtype`, if any"""
+    if isinstance(dtype.type, pd.StringDtype) \
+            and dtype.type.storage == 'pyarrow':
+        return dtype.type
+    try:
+        # Arrow strings with NaN as missing value, as 'str' on pandas 3
+        return pd.StringDtype('pyarrow_numpy')
+    except (ImportError, ValueError):
+        # Without pyarrow, or pyarrow strings with NA on pandas 3
+        return None
+
+
+def _to_compact_strings(
+        values: Union[pd.Series, pd.Index],
+        dtype
+) -> Union[pd.Series, pd.Index]:
+    target = _compact_string_dtype(dtype)
+    if target is None or values.dtype == target:
+        return values
+    return values.astype(target)
@@ -1,10 +1,59 @@
-from .data_loader import load_UNSD_areas, load_GAUL_code
+"""UNSD M49 areas and GAUL codes reference data
 
-areas = load_UNSD_areas()
+Reference data is loaded on first attribute access, from the binary snapshot
+maintained by `data_loader.load_reference_snapshot`.
+"""
+from .data_loader import reference_snapshot, reference_index, \
+    load_UNSD_areas, load_GAUL_hierarchy, gaul_hierarchy_file
 
-ISO3_LIST = areas['ISO-alpha3 Code'].tolist()
-COUNTRY_LIST = areas['Country or Area'].tolist()
-REGION_LIST = areas['Region Name'].tolist()
-SUBREGION_LIST = areas['Sub-region Name'].tolist()
-ADM1_GAUL_LIST = load_GAUL_code(1)
-ADM2_GAUL_LIST = load_GAUL_code(2)
\ No newline at end of file
+_SNAPSHOT_LISTS = {
+    'ISO3_LIST': 'iso3',
+    'COUNTRY_LIST': 'country',
+    'REGION_LIST': 'region',
+    'SUBREGION_LIST': 'subregion',
+    'ADM1_GAUL_LIST': 'adm1_gaul',
+    'ADM2_GAUL_LIST': 'adm2_gaul',
+}
+
+# Hashed unique values, for membership tests of distinct values
+_SNAPSHOT_INDEXES = {
+    'ISO3_INDEX': 'iso3',
+    'COUNTRY_INDEX': 'country',
+    'REGION_INDEX': 'region',
+    'SUBREGION_INDEX': 'subregion',
+}
+
+# Sorted unique codes, for vectorized membership tests
+_SNAPSHOT_ARRAYS = {
+    'ADM1_GAUL_CODES': 'adm1_gaul_sorted',
+    'ADM2_GAUL_CODES': 'adm2_gaul_sorted',
+}
+
+
+def _load(name: str):
+    if name in _SNAPSHOT_LISTS:
+        return reference_snapshot()[_SNAPSHOT_LISTS[name]].tolist()
+    elif name in _SNAPSHOT_INDEXES:
+        return reference_index(reference_snapshot()[_SNAPSHOT_INDEXES[name]])
+    elif name in _SNAPSHOT_ARRAYS:
+        return reference_snapshot()[_SNAPSHOT_ARRAYS[name]]
+    elif name == 'areas':
+        return load_UNSD_areas()
+    elif name == 'GAUL_HIERARCHY':
+        # GAUL (level, code) -> name, parent and country lookup, if available
+        file = gaul_hierarchy_file()
+        return None if file is None else load_GAUL_hierarchy(file)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __getattr__(name: str):
+    value = _load(name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(
+        [*globals(), *_SNAPSHOT_LISTS, *_SNAPSHOT_INDEXES, *_SNAPSHOT_ARRAYS,
+         'areas', 'GAUL_HIERARCHY']
+    )
@@ -1,9 +1,51 @@
-from .data_loader import load_classification
+"""Disaster classification reference data
 
-classification = load_classification()
+Reference data is loaded on first attribute access, from the binary snapshot
+maintained by `data_loader.load_reference_snapshot`.
+"""
+import numpy as np
 
-KEY_LIST = classification['classif_key'].unique()
-GROUP_LIST = classification['group'].unique()
-SUBGROUP_LIST = classification['subgroup'].unique()
-TYPE_LIST = classification['type'].unique()
-SUBTYPE_LIST = classification['subtype'].unique()
+from .data_loader import reference_snapshot, reference_index, \
+    load_classification
+
+_SNAPSHOT_LISTS = {
+    'KEY_LIST': 'classif_key',
+    'GROUP_LIST': 'group',
+    'SUBGROUP_LIST': 'subgroup',
+    'TYPE_LIST': 'type',
+    'SUBTYPE_LIST': 'subtype',
+}
+
+# Hashed unique values, for membership tests of distinct values
+_SNAPSHOT_INDEXES = {
+    'KEY_INDEX': 'classif_key',
+    'GROUP_INDEX': 'group',
+    'SUBGROUP_INDEX': 'subgroup',
+    'TYPE_INDEX': 'type',
+    'SUBTYPE_INDEX': 'subtype',
+}
+
+
+def _load(name: str):
+    if name in _SNAPSHOT_LISTS:
+        values = reference_snapshot()[_SNAPSHOT_LISTS[name]]
+        # Unique values in order of appearance
+        _, first = np.unique(values, return_index=True)
+        return values[np.sort(first)]
+    elif name in _SNAPSHOT_INDEXES:
+        return reference_index(reference_snapshot()[_SNAPSHOT_INDEXES[name]])
+    elif name == 'classification':
+        return load_classification()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __getattr__(name: str):
+    value = _load(name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(
+        [*globals(), *_SNAPSHOT_LISTS, *_SNAPSHOT_INDEXES, 'classification']
+    )
@@ -1,6 +1,12 @@
+import hashlib
+import os
+import tempfile
+import zipfile
+from functools import lru_cache
 from pathlib import Path
-from typing import Literal
+from typing import Literal, Optional
 
+import numpy as np
 import pandas as pd
 import toml
 
@@ -21,6 +27,22 @@ GAUL_ADM2_FILE = Path(
     f"{Path(__file__).parent}/gaul_adm2_code.txt"
 )
 
+# Sources of the reference snapshot, see load_reference_snapshot
+REFERENCE_FILES: dict[str, Path] = {
+    'classification': CLASSIFICATION_FILE,
+    'areas': AREAS_FILE,
+    'gaul_adm1': GAUL_ADM1_FILE,
+    'gaul_adm2': GAUL_ADM2_FILE,
+}
+
+# Optional, not distributed with EM-TEST, see gaul_hierarchy_file
+GAUL_HIERARCHY_FILE = Path(
+    f"{Path(__file__).parent}/gaul_hierarchy.csv"
+)
+
+# Environment variable holding the path of the GAUL hierarchy file
+GAUL_HIERARCHY_ENV = 'EMTEST_GAUL_HIERARCHY'
+
 
 def load_classification(file: Path = CLASSIFICATION_FILE):
     """Load classification tree from toml file and return it as a dataframe
@@ -53,13 +75,18 @@ def load_classification(file: Path = CLASSIFICATION_FILE):
     return df
 
 
-def load_GAUL_code(level: Literal[1, 2]) -> list:
+def load_GAUL_code(
+        level: Literal[1, 2],
+        file: Optional[Path] = None
+) -> list:
     """Load and return a list of GAUL Admin. 1 or Admin. 2 codes
 
     Parameters
     ----------
     level : int
         Administrative level. Either 1 or 2
+    file : str, optional
+        file path to txt file, defaults to the file of the given level
 
     Example
     -------
@@ -69,9 +96,9 @@ def load_GAUL_code(level: Literal[1, 2]) -> list:
     ['1232', '2112', '2119', '1357', '1066']
 
     """
-    if level == 1:
+    if file is None and level == 1:
         file = GAUL_ADM1_FILE
-    elif level == 2:
+    elif file is None and level == 2:
         file = GAUL_ADM2_FILE
     with open(file, 'r', encoding='utf-8') as file:
         code_list = [int(line.strip()) for line in file]
@@ -79,6 +106,71 @@ def load_GAUL_code(level: Literal[1, 2]) -> list:
     return code_list
 
 
+def gaul_hierarchy_file() -> Optional[Path]:
+    """Return the path of the GAUL hierarchy file, None if there is none
+
+    The path is read from the `EMTEST_GAUL_HIERARCHY` environment variable,
+    and defaults to 'gaul_hierarchy.csv' in this directory if it exists.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the environment variable names a missing file.
+    """
+    path = os.environ.get(GAUL_HIERARCHY_ENV)
+    if path:
+        path = Path(path)
+        if not path.is_file():
+            raise FileNotFoundError(
+                f"{GAUL_HIERARCHY_ENV} file not found: {path}"
+            )
+        return path
+    return GAUL_HIERARCHY_FILE if GAUL_HIERARCHY_FILE.exists() else None
+
+
+def load_GAUL_hierarchy(file: Optional[Path] = None) -> pd.DataFrame:
+    """Load the GAUL hierarchy lookup table from csv file
+
+    The csv file is semicolon-separated with one row per GAUL unit and the
+    columns 'level' (1 or 2), 'code', 'name', 'adm1_code' (parent Admin. 1
+    code of Admin. 2 units, empty for Admin. 1 units) and 'ISO' (ISO3 code of
+    the country). The returned table is indexed by (level, code).
+
+    Parameters
+    ----------
+    file : str, optional
+        file path to csv file, defaults to `gaul_hierarchy_file()`
+
+    Returns
+    -------
+    pd.DataFrame
+
+    Example
+    -------
+
+    >>> df = load_GAUL_hierarchy('gaul_hierarchy.csv')
+    >>> df.loc[(2, 25577)]
+    name          Ljubljana
+    adm1_code         25573
+    ISO                 SVN
+    Name: (2, 25577), dtype: object
+
+    """
+    if file is None:
+        file = gaul_hierarchy_file()
+        if file is None:
+            raise FileNotFoundError(
+                f"no GAUL hierarchy file, set {GAUL_HIERARCHY_ENV}"
+            )
+    df = pd.read_csv(
+        file,
+        sep=';',
+        dtype={'level': 'int64', 'code': 'int64', 'name': str,
+               'adm1_code': 'Int64', 'ISO': str}
+    )
+    return df.set_index(['level', 'code']).sort_index()
+
+
 def load_UNSD_areas(file: Path = AREAS_FILE):
     """Load unsd area codes from csv file and return it as a dataframe
 
@@ -121,6 +213,130 @@ def load_UNSD_areas(file: Path = AREAS_FILE):
     return df
 
 
+def reference_checksum(files: dict[str, Path] = REFERENCE_FILES) -> str:
+    """Return a checksum of the content of the reference source files"""
+    digest = hashlib.blake2b(digest_size=16)
+    for name, file in sorted(files.items()):
+        digest.update(name.encode('utf-8'))
+        digest.update(Path(file).read_bytes())
+    return digest.hexdigest()
+
+
+def build_reference_arrays(
+        files: dict[str, Path] = REFERENCE_FILES
+) -> dict[str, np.ndarray]:
+    """Parse the reference source files into a dictionary of arrays
+
+    String arrays hold the non-null values of the reference columns, in file
+    order. GAUL codes are stored both in file order and as sorted unique
+    arrays for vectorized membership tests.
+    """
+    areas = load_UNSD_areas(files['areas'])
+    classification = load_classification(files['classification'])
+
+    def strings(values: pd.Series) -> np.ndarray:
+        return np.asarray(values.dropna().tolist(), dtype=str)
+
+    arrays = {
+        'iso3': strings(areas['ISO-alpha3 Code']),
+        'country': strings(areas['Country or Area']),
+        'region': strings(areas['Region Name']),
+        'subregion': strings(areas['Sub-region Name']),
+    }
+    for column in ['classif_key', 'group', 'subgroup', 'type', 'subtype']:
+        arrays[column] = strings(classification[column])
+    for level in (1, 2):
+        codes = np.asarray(
+            load_GAUL_code(level, files[f'gaul_adm{level}']), dtype=np.int64
+        )
+        arrays[f'adm{level}_gaul'] = codes
+        arrays[f'adm{level}_gaul_sorted'] = np.unique(codes)
+    return arrays
+
+
+def default_cache_dir() -> Path:
+    """Return the EM-TEST cache directory
+
+    Set the EMTEST_CACHE_DIR environment variable to override the default,
+    $XDG_CACHE_HOME/emtest or ~/.cache/emtest.
+    """
+    if 'EMTEST_CACHE_DIR' in os.environ:
+        return Path(os.environ['EMTEST_CACHE_DIR'])
+    cache_home = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(cache_home) / 'emtest'
+
+
+def load_reference_snapshot(
+        cache_dir: Optional[Path] = None,
+        files: dict[str, Path] = REFERENCE_FILES
+) -> dict[str, np.ndarray]:
+    """Load reference arrays from a binary snapshot, rebuilding it if needed
+
+    The snapshot is an uncompressed .npz file named after the checksum of the
+    source files, so that editing any of them triggers a rebuild on the next
+    call. Stale snapshots are removed. If the cache directory is not
+    writable, the arrays are built from the source files without caching.
+
+    Parameters
+    ----------
+    cache_dir : str, optional
+        directory of the snapshot, defaults to `default_cache_dir()`
+    files : dict
+        reference source files, keyed as in REFERENCE_FILES
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        see `build_reference_arrays`
+    """
+    cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+    snapshot = cache_dir / f"reference_{reference_checksum(files)}.npz"
+    try:
+        with np.load(snapshot, allow_pickle=False) as npz:
+            return {key: npz[key] for key in npz.files}
+    except (OSError, ValueError, EOFError, zipfile.BadZipFile):
+        # Missing, truncated or corrupt snapshot
+        pass
+
+    arrays = build_reference_arrays(files)
+    tmp = None
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # Atomic write, as several worker processes may rebuild concurrently
+        with tempfile.NamedTemporaryFile(
+                dir=cache_dir, suffix='.npz', delete=False
+        ) as tmp:
+            np.savez(tmp, **arrays)
+        os.replace(tmp.name, snapshot)
+        for stale in cache_dir.glob('reference_*.npz'):
+            if stale != snapshot:
+                stale.unlink(missing_ok=True)
+    except OSError:
+        pass
+    finally:
+        # Left behind if the write failed
+        if tmp is not None:
+            Path(tmp.name).unlink(missing_ok=True)
+    return arrays
+
+
+def reference_index(values: np.ndarray) -> pd.Index:
+    """Return the unique reference values as an Index with a built hash table
+
+    Membership of many values, e.g., the distinct values of a column, is
+    then tested with `Index.get_indexer` without hashing the reference again.
+    """
+    index = pd.Index(pd.unique(values))
+    index.get_indexer(index[:1])
+    return index
+
+
+@lru_cache(maxsize=1)
+def reference_snapshot() -> dict[str, np.ndarray]:
+    """Return the reference arrays, loaded once per process"""
+    return load_reference_snapshot()
+
+
 if __name__ == '__main__':
     import doctest
 
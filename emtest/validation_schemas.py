@@ -13,14 +13,17 @@ from pandera.pandas import Check, Column, DataFrameSchema, Index, Timestamp
 from pandera.typing import Series
 
 from .custom_checks import (
-    is_valid_json,
-    has_valid_GAUL_codes,
-    validate_external_id,
+    check_json_strings,
+    check_GAUL_codes,
+    check_external_ids,
     validate_iso3_code,
     check_both_lat_lon_coordinates,
-    check_disno,
+    check_GAUL_hierarchy,
+    check_disno_index,
     check_disno_vs_start_year,
+    check_disno_vs_iso,
     check_start_end_consistency,
+    check_calendar_date,
     check_coldwave_magnitude,
     check_earthquake_magnitude,
     check_heatwave_magnitude,
@@ -30,25 +33,23 @@ from .custom_checks import (
     check_subtype, check_iso3_code, check_magnitude_unit, check_region,
     check_day, check_month
 )
-from .validation_data.areas import (
-    COUNTRY_LIST,
-    ISO3_LIST,
-    REGION_LIST,
-    SUBREGION_LIST
-)
-from .validation_data.classification import (
-    KEY_LIST,
-    GROUP_LIST,
-    SUBGROUP_LIST,
-    TYPE_LIST,
-    SUBTYPE_LIST
-)
-from .validation_data.magnitude import MAG_UNIT_LIST
+from .validation_data import areas
 
 CURRENT_DATE = datetime.now()
 CURRENT_YEAR = datetime.now().year
 EMDAT_START_DATE = datetime(1988, 1, 1)
 
+# The GAUL hierarchy lookup table is optional (see data_loader.py)
+GAUL_HIERARCHY_CHECKS = [] if areas.GAUL_HIERARCHY is None else [
+    Check(
+        partial(check_GAUL_hierarchy, hierarchy=areas.GAUL_HIERARCHY),
+        name="check_GAUL_hierarchy",
+        description="Test whether admin units belong to the country and "
+                    "have the GAUL name",
+        error="Admin units inconsistent with GAUL hierarchy"
+    )
+]
+
 emdat_schema = DataFrameSchema(
     {
         "Historic": Column(
@@ -128,8 +129,8 @@ emdat_schema = DataFrameSchema(
             checks=[
                 Check(
                     # See custom_checks.py
-                    validate_external_id,
-                    element_wise=True,
+                    check_external_ids,
+                    name="check_external_ids",
                     error="Invalid external ID",
                     description="Validate values using regular expressions"
                 )
@@ -507,16 +508,18 @@ emdat_schema = DataFrameSchema(
             checks=[
                 # See custom_checks.py
                 Check(
-                    is_valid_json,
+                    check_json_strings,
+                    name="check_json_strings",
                     description="Test whether value is a json string",
                     error="Invalid JSON string",
-                    element_wise=True
                 ),
                 Check(
-                    has_valid_GAUL_codes,
+                    check_GAUL_codes,
+                    name="check_GAUL_codes",
                     description="Test whether value contains valid GAUL codes",
                     error="Invalid GAUL codes",
-                    element_wise=True
+                    # Shares parsed Admin Units with wide checks
+                    ignore_na=False
                 )
             ],
             nullable=True
@@ -526,10 +529,10 @@ emdat_schema = DataFrameSchema(
             checks=[
                 # See custom_checks.py
                 Check(
-                    is_valid_json,
+                    check_json_strings,
+                    name="check_json_strings",
                     description="Test whether value is a json string",
                     error="Invalid JSON string",
-                    element_wise=True
                 ),
             ],
             nullable=True
@@ -564,6 +567,7 @@ emdat_schema = DataFrameSchema(
     checks=[
         Check(
             check_both_lat_lon_coordinates,
+            name="check_both_lat_lon_coordinates",
             description="Test whether latitude and longitude coordinates are "
                         "either both defined or undefined",
             error="Missing latitude or longitude coordinates"
@@ -588,41 +592,67 @@ emdat_schema = DataFrameSchema(
         ),
         Check(
             partial(check_start_end_consistency, resolution='month'),
+            name="check_start_end_month_consistency",
             description="Test whether start date is prior or equal to end date "
                         "at the month resolution",
             error="Start date inconsistency at the month resolution"
         ),
         Check(
             partial(check_start_end_consistency, resolution='day'),
+            name="check_start_end_day_consistency",
             description="Test whether start date is prior or equal to end date "
                         "at the day resolution",
             error="Start date inconsistency at the day resolution"
         ),
+        Check(
+            partial(check_calendar_date, start_or_end='Start'),
+            name="check_start_calendar_date",
+            description="Test whether Start Day exists in the start month "
+                        "and year",
+            error="Invalid start date"
+        ),
+        Check(
+            partial(check_calendar_date, start_or_end='End'),
+            name="check_end_calendar_date",
+            description="Test whether End Day exists in the end month and "
+                        "year",
+            error="Invalid end date"
+        ),
+        Check(
+            check_disno_vs_iso,
+            name="check_disno_vs_iso",
+            description="Test whether the ISO code is the same as in DisNo",
+            error="ISO differs from DisNo ISO"
+        ),
         Check(
             check_coldwave_magnitude,
+            name="check_coldwave_magnitude",
             description="Test whether coldwave magnitude is in realistic "
                         "range (<= 10°C)",
             error="Invalid coldwave magnitude"
         ),
         Check(
             check_earthquake_magnitude,
+            name="check_earthquake_magnitude",
             description="Test whether earthquake magnitude is in realistic "
                         "range (3 to 10)",
             error="Invalid earthquake magnitude"
         ),
         Check(
             check_heatwave_magnitude,
+            name="check_heatwave_magnitude",
             description="Test whether heatwave magnitude is in realistic "
                         "range (>= 25°C)",
             error="Invalid heatwave magnitude"
         ),
         Check(
             check_other_magnitude,
+            name="check_other_magnitude",
             description="Test whether disaster different from earthquake, cold "
                         " and heat waves have magnitude above zero",
             error="Invalid magnitude"
         ),
-
+        *GAUL_HIERARCHY_CHECKS,
     ],
     # Check the index
     index=Index(
@@ -630,7 +660,7 @@ emdat_schema = DataFrameSchema(
         name="DisNo.",
         checks=[
             Check(
-                check_disno,
+                check_disno_index,
                 name="check_disno",
                 description="Validate value using regular expression.",
                 error="Invalid DisNo. Pattern"
@@ -1,3 +1,5 @@
+from pathlib import Path
+
 import pytest
 import pandas as pd
 
@@ -60,3 +62,32 @@ def valid_df(valid_emdat_row):
     df.index = ["2024-0001-BEL"]
     df.index.name = "DisNo."
     return df
+
+@pytest.fixture(scope="session")
+def fake_emdat_file():
+    """Provides the path of the fake EM-DAT test file."""
+    return Path(__file__).parent.parent / "data" / "fake_emdat_test.xlsx"
+
+@pytest.fixture
+def fake_emdat(fake_emdat_file):
+    """Provides the fake EM-DAT test data, which contains errors."""
+    return pd.read_excel(
+        fake_emdat_file,
+        index_col="DisNo.",
+        parse_dates=["Entry Date", "Last Update"]
+    )
+
+@pytest.fixture
+def gaul_hierarchy_file(tmp_path):
+    """Provides a small GAUL hierarchy lookup table file."""
+    file = tmp_path / "gaul_hierarchy.csv"
+    file.write_text(
+        "level;code;name;adm1_code;ISO\n"
+        "1;2041;Jalisco;;MEX\n"
+        "1;2047;Nayarit;;MEX\n"
+        "2;20488;Rosamorada;2047;MEX\n"
+        "1;25573;Ljubljana;;SVN\n"
+        "2;25577;Ljubljana;25573;SVN\n",
+        encoding="utf-8"
+    )
+    return file
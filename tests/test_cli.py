@@ -0,0 +1,71 @@
+import shutil
+import warnings
+
+import pandas as pd
+import pytest
+
+from emtest.cli import expand_paths, main
+
+
+@pytest.fixture(autouse=True)
+def ignore_schema_warnings():
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        yield
+
+
+@pytest.fixture
+def emdat_files(fake_emdat_file, tmp_path):
+    files = []
+    for name in ("a.xlsx", "b.xlsx"):
+        files.append(tmp_path / name)
+        shutil.copy(fake_emdat_file, files[-1])
+    return files
+
+
+def test_expand_paths(emdat_files, tmp_path):
+    (tmp_path / "~$a.xlsx").touch()
+    assert expand_paths([str(tmp_path)]) == emdat_files
+    assert expand_paths([str(tmp_path / "*.xlsx"), str(emdat_files[0])]) \
+        == emdat_files
+
+
+@pytest.mark.parametrize("extension", ["csv", "jsonl", "parquet"])
+def test_main(emdat_files, tmp_path, extension):
+    output = tmp_path / f"report.{extension}"
+    status = main([str(tmp_path / "*.xlsx"), "-o", str(output), "-j", "2"])
+    assert status == 1
+    if extension == "csv":
+        report = pd.read_csv(output)
+    elif extension == "jsonl":
+        report = pd.read_json(output, lines=True)
+    else:
+        report = pd.read_parquet(output)
+    assert report["file"].unique().tolist() == list(map(str, emdat_files))
+    counts = report["file"].value_counts()
+    assert counts.iloc[0] == counts.iloc[1]
+
+
+def test_main_exit_status(valid_df, emdat_files, tmp_path, capsys):
+    valid = tmp_path / "valid.xlsx"
+    valid_df.to_excel(valid)
+    assert main([str(valid)]) == 0
+    assert "valid.xlsx: valid" in capsys.readouterr().out
+    assert main([str(tmp_path / "missing.xlsx")]) == 2
+    assert main([str(emdat_files[0]), "--summary", "-j", "1"]) == 1
+    with pytest.raises(SystemExit):
+        main([str(valid), "-o", str(tmp_path / "report.txt")])
+    for flags in (["--summary", "--max-failures", "5"],
+                  ["--summary", "-j", "2"], ["--max-failures", "5", "-j", "2"]):
+        with pytest.raises(SystemExit):
+            main([str(valid), *flags])
+
+
+def test_main_cache(emdat_files, tmp_path):
+    pytest.importorskip("pyarrow")
+    before = sorted(tmp_path.iterdir())
+    assert main([str(tmp_path), "-j", "1"]) == 1
+    # A default run leaves the input directory unchanged
+    assert sorted(tmp_path.iterdir()) == before
+    assert main([str(tmp_path), "-j", "1", "--cache"]) == 1
+    assert len(list(tmp_path.glob("*.arrow"))) == len(emdat_files)
@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+
+from emtest.compatibility import (
+    ColumnSketch,
+    compare_emdat_files,
+    diff_sketches,
+    sketch_emdat,
+)
+from emtest.readers import read_emdat_excel_chunks
+
+
+def test_column_sketch():
+    sketch = ColumnSketch("Country", pd.Index(["Belgium", "France"]),
+                          max_distinct=3)
+    sketch.update(pd.Series(["Belgium", None, "Atlantis", "Atlantis"]))
+    sketch.update(pd.Series(["France", "Mu"]))
+    row = sketch.to_dict()
+    assert row["rows"] == 6 and row["null_rate"] == 1 / 6
+    assert (row["min"], row["max"]) == ("Atlantis", "Mu")
+    assert row["unknown_rows"] == 3
+    assert row["unknown_values"] == ["Atlantis", "Mu"]
+    # Distinct values are estimated beyond `max_distinct`
+    assert row["distinct"] == 4 and not row["distinct_exact"]
+
+
+def test_column_sketch_estimate():
+    sketch = ColumnSketch("Total Deaths", max_distinct=10)
+    for start in range(0, 100_000, 25_000):
+        sketch.update(pd.Series(np.arange(start, start + 25_000) * 1.))
+    assert abs(sketch.distinct - 100_000) < 5_000
+    assert (sketch.min, sketch.max) == (0, 99_999)
+
+
+def test_sketch_emdat(fake_emdat_file, fake_emdat):
+    chunks = read_emdat_excel_chunks(fake_emdat_file, chunk_size=7)
+    sketch = sketch_emdat(chunks).to_frame().set_index("column")
+    assert sketch.index[0] == "DisNo."
+    assert (sketch["rows"] == len(fake_emdat)).all()
+    full = sketch_emdat(fake_emdat_file).to_frame().set_index("column")
+    pd.testing.assert_frame_equal(sketch, full)
+    assert "wrong_iso" in sketch.loc["ISO", "unknown_values"]
+    assert pd.isna(sketch.loc["Event Name", "unknown_rows"])
+    assert sketch.loc["Start Year", "distinct"] \
+        == fake_emdat["Start Year"].nunique()
+
+
+def test_diff_sketches(valid_df):
+    other = valid_df.assign(Country="Atlantis", Magnitude=8.)
+    other = other.drop(columns="River Basin")
+    diff = diff_sketches({
+        "2023": sketch_emdat(valid_df), "2024": sketch_emdat(other),
+        "2025": sketch_emdat(other),
+    })
+    assert set(diff["release"]) == {"2024"}
+    changes = diff.set_index(["column", "property"])
+    assert changes.loc[("River Basin", "present"), "value"] == False  # noqa
+    assert changes.loc[("Country", "unknown_values"), "value"] == ["Atlantis"]
+    assert changes.loc[("Country", "added_values"), "value"] == ["Atlantis"]
+    assert changes.loc[("Magnitude", "max"), "previous_value"] == 7.
+
+
+def test_compare_emdat_files(fake_emdat_file):
+    diff = compare_emdat_files([fake_emdat_file, fake_emdat_file])
+    assert diff.empty
@@ -1,11 +1,31 @@
 import pytest
 import pandas as pd
+from emtest.derived import data_of, derived_cache, lookup
+from emtest.validation_data.data_loader import load_GAUL_hierarchy
 from emtest.custom_checks import (
     is_valid_json, 
     _is_valid_GAUL_code, 
+    has_valid_GAUL_codes,
+    check_GAUL_codes,
+    check_GAUL_hierarchy,
+    explode_admin_units,
     check_disno,
+    check_disno_index,
     check_yes_no,
-    check_disno_vs_start_year
+    check_disno_vs_start_year,
+    check_start_end_consistency,
+    check_calendar_date,
+    check_external_ids,
+    count_external_ids,
+    check_disno_vs_iso,
+    check_iso3_code,
+    distinct_values,
+    element_wise_on_distinct,
+    isin_reference,
+    parse_disno,
+    validate_iso3_code,
+    validate_external_id,
+    _convert_to_date,
 )
 
 def test_is_valid_json():
@@ -20,12 +40,78 @@ def test_is_valid_gaul_code():
     assert _is_valid_GAUL_code(1232, level=1) is True # Based on example in data_loader
     assert _is_valid_GAUL_code(999999, level=1) is False
 
+def test_explode_admin_units():
+    s = pd.Series([
+        '[{"adm1_code":2041,"adm1_name":"Jalisco"},'
+        '{"adm2_code":20488,"adm2_name":"Rosamorada"}]',
+        'wrong_json',
+        '[]',
+    ], index=["2022-0698-MEX", "1999-0673-IND", "2024-0001-BEL"])
+    units = explode_admin_units(s)
+    assert units['row'].tolist() == [0, 0, 1]
+    assert units['DisNo.'].tolist() == [
+        "2022-0698-MEX", "2022-0698-MEX", "1999-0673-IND"
+    ]
+    assert units['level'].tolist()[:2] == [1, 2]
+    assert units['code'].tolist()[:2] == [2041, 20488]
+    assert units['name'].tolist()[:2] == ["Jalisco", "Rosamorada"]
+    assert units['code'].isna().tolist() == [False, False, True]
+
+def test_check_gaul_codes():
+    s = pd.Series([
+        '[{"adm1_code":1232,"adm1_name":"A"}]',
+        '[{"adm1_code":999999,"adm1_name":"B"}]',
+        '[{"adm2_code":154569,"adm2_name":"C"}]',
+        '[{"adm2_code":1232,"adm2_name":"D"}]',
+        'wrong_json',
+        '[]',
+        '[{"adm1_code":1232,"adm1_name":"A"}]',
+    ], index=["2024-0001-BEL"] * 6 + ["2024-0002-BEL"])
+    expected = [has_valid_GAUL_codes(x) for x in s]
+    assert check_GAUL_codes(s).tolist() == expected
+    assert expected == [True, False, True, False, False, True, True]
+    # Units that cannot be read fail instead of raising
+    assert not check_GAUL_codes(pd.Series(['{"adm1_code":1232}'])).any()
+
+def test_check_gaul_hierarchy(gaul_hierarchy_file):
+    hierarchy = load_GAUL_hierarchy(gaul_hierarchy_file)
+    assert hierarchy.loc[(2, 20488), 'ISO'] == "MEX"
+    df = pd.DataFrame({
+        "ISO": ["MEX", "SVN", "MEX", "MEX", "SVN", "MEX", "MEX"],
+        "Admin Units": [
+            '[{"adm1_code":2047,"adm1_name":"Nayarit"},'
+            '{"adm2_code":20488,"adm2_name":"ROSAMORADA"}]',
+            '[{"adm1_code":2041,"adm1_name":"Jalisco"}]',  # wrong country
+            '[{"adm1_code":2047,"adm1_name":"Sinaloa"}]',  # wrong name
+            None,
+            '[{"adm2_code":25577,"adm2_name":"Ljubljana"}]',
+            '[{"adm1_code":1,"adm1_name":"Unknown"}]',  # left to GAUL check
+            # Admin. 2 unit of another Admin. 1 unit of the country
+            '[{"adm1_code":2041,"adm1_name":"Jalisco"},'
+            '{"adm2_code":20488,"adm2_name":"Rosamorada"}]',
+        ]
+    })
+    result = check_GAUL_hierarchy(df, hierarchy)
+    assert result.tolist() == [True, False, False, True, True, True, False]
+
 def test_check_disno():
     s = pd.Series(["2024-0001-BEL", "1900-9999-USA"])
     assert check_disno(s).all() == True
     
     s_invalid = pd.Series(["2024-001-BEL"]) # Missing one digit in sequential
     assert check_disno(s_invalid).all() == False
+    assert check_disno(pd.Series(["2024-0001-BEL", None, "2024-0001-bel"])) \
+        .tolist() == [True, False, False]
+
+def test_check_disno_uses_parsed_disno():
+    index = pd.Index(["2024-0001-BEL", "2024-001-BEL"], name="DisNo.")
+    with derived_cache():
+        # Index checks get the index as a Series indexed by itself
+        result = check_disno_index(index.to_series())
+        # The parsed index is shared with the other DisNo. checks
+        assert lookup('disno', data_of(index)) is not None
+    assert result.tolist() == [True, False]
+    assert result.index.equals(index)
 
 def test_check_yes_no():
     assert check_yes_no(pd.Series(["Yes", "No"])).all() == True
@@ -42,3 +128,128 @@ def test_check_disno_vs_start_year():
     result = check_disno_vs_start_year(df["Start Year"])
     assert result.iloc[0] == True
     assert result.iloc[1] == False
+
+def test_check_start_end_consistency():
+    df = pd.DataFrame({
+        "Start Year": [2024, 2024, 2024, 2024, 2023],
+        "Start Month": [3.0, 3.0, None, 2.0, 12.0],
+        "Start Day": [20.0, 10.0, None, 30.0, 31.0],
+        "End Year": [2024, 2024, 2023, 2024, 2024],
+        "End Month": [3.0, 4.0, 1.0, 1.0, 1.0],
+        "End Day": [10.0, 1.0, 1.0, 1.0, 1.0],
+    })
+    assert check_start_end_consistency(df, "year").tolist() == [
+        True, True, False, True, True
+    ]
+    assert check_start_end_consistency(df, "month").tolist() == [
+        True, True, True, False, True
+    ]
+    # February 30 is not a date, so the day resolution is not compared
+    assert check_start_end_consistency(df, "day").tolist() == [
+        False, True, True, True, True
+    ]
+    dates = _convert_to_date(df, "Start", "day")
+    assert dates.iloc[0] == pd.Timestamp("2024-03-20")
+    assert dates.iloc[2:4].isna().all()
+
+def test_check_calendar_date():
+    df = pd.DataFrame({
+        "Start Year": [2024, 2023, 2000, 1900, 2024, 2024],
+        "Start Month": [2.0, 2.0, 2.0, 2.0, 4.0, None],
+        "Start Day": [29.0, 29.0, 29.0, 29.0, 31.0, None],
+    })
+    assert check_calendar_date(df, "Start").tolist() == [
+        True, False, True, False, False, True
+    ]
+
+def test_check_external_ids():
+    s = pd.Series([
+        "GLIDE:FL-2019-000052",
+        "DFO:4384|GLIDE:FL-2019-000009|HANZE:12",
+        "USGS:us7000abcd",
+        "wrong_id",
+        "wrong_id|DFO:4384",
+        "GLIDE:FL-19-000052",
+        "",
+        None,
+    ], index=["2019-0275-SRB"] * 7 + ["2019-0276-SRB"])
+    expected = [validate_external_id(x) for x in s.fillna(float("nan"))]
+    assert check_external_ids(s).tolist() == expected
+    assert expected == [True, True, True, False, True, False, False, True]
+    counts = count_external_ids(s)
+    assert counts.columns.tolist() == ["GLIDE", "USGS", "DFO", "HANZE"]
+    assert counts.iloc[1].tolist() == [1, 0, 1, 1]
+    assert counts.sum().tolist() == [2, 1, 2, 1]
+
+def test_parse_disno():
+    parts = parse_disno(pd.Index(["2019-0275-SRB", "2019-275-SRB", "wrong"]))
+    assert parts["year"].tolist()[:2] == [2019, 2019]
+    assert parts["sequence"].tolist()[0] == 275
+    assert parts["ISO"].tolist()[0] == "SRB"
+    assert parts.iloc[1:].drop(columns="year").isna().all().all()
+    assert pd.isna(parts["year"].iloc[2])
+
+def test_check_disno_vs_iso():
+    df = pd.DataFrame(
+        {"ISO": ["BEL", "FRA", "BEL"]},
+        index=["2024-0001-BEL", "2024-0001-BEL", "wrong_disno"]
+    )
+    assert check_disno_vs_iso(df).tolist() == [True, False, True]
+
+def test_derived_cache():
+    s = pd.Series(['[{"adm1_code":1232,"adm1_name":"A"}]'])
+    assert explode_admin_units(s) is not explode_admin_units(s)
+    with derived_cache():
+        units = explode_admin_units(s)
+        assert explode_admin_units(s) is units
+        assert explode_admin_units(s.copy()) is not units
+        with derived_cache():
+            assert explode_admin_units(s) is units
+    assert explode_admin_units(s) is not units
+
+
+def test_isin_reference():
+    reference = pd.Index(['BEL', 'FRA'])
+    values = pd.Series(['BEL', 'XXX', None, 'FRA', 'BEL'], index=list('abcde'))
+    expected = values.isin(reference)
+    for s in (values, values.astype('category')):
+        pd.testing.assert_series_equal(isin_reference(s, reference), expected)
+    with derived_cache():
+        pd.testing.assert_series_equal(
+            isin_reference(values, reference), expected
+        )
+        # Distinct values are computed once and shared with other checks
+        codes, uniques = lookup('distinct', data_of(values))
+        assert uniques.tolist() == ['BEL', 'XXX', 'FRA']
+
+
+def test_iso_checks_share_distinct_values():
+    iso = pd.Series(['BEL', 'BEL', 'bel', 'XXX', 'FRA'])
+    with derived_cache():
+        assert validate_iso3_code(iso).tolist() == [
+            True, True, False, True, True
+        ]
+        codes, uniques = distinct_values(iso)
+        assert uniques.tolist() == ['BEL', 'bel', 'XXX', 'FRA']
+        assert distinct_values(iso)[0] is codes
+        assert check_iso3_code(iso).tolist() == [
+            True, True, False, False, True
+        ]
+
+
+def test_element_wise_on_distinct():
+    calls = []
+
+    def is_short(value):
+        calls.append(value)
+        return isinstance(value, str) and len(value) < 3
+
+    check = element_wise_on_distinct(is_short, maxsize=2)
+    values = pd.Series(['a', 'abcd', 'a', None, 'a'], index=list('vwxyz'))
+    expected = values.map(is_short)
+    calls.clear()
+    pd.testing.assert_series_equal(check(values), expected)
+    assert calls.count('a') == 1
+    check(values)
+    assert check.cache_info().hits == 2
+    assert check.cache_info().currsize == 2
@@ -0,0 +1,36 @@
+import subprocess
+import sys
+
+# Building emdat_schema at import time used to take ~600 ms
+IMPORT_TIME_BUDGET_US = 50_000
+
+
+def _run_python(code: str, *options: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *options, "-c", code],
+        capture_output=True, text=True, check=True
+    )
+
+
+def test_import_time_budget():
+    """Test that `import emtest` stays within its import-time budget."""
+    stderr = _run_python("import emtest", "-X", "importtime").stderr
+    cumulative_us = [
+        int(line.split("|")[1])
+        for line in stderr.splitlines()
+        if line.startswith("import time:") and
+        line.split("|")[2].strip() == "emtest"
+    ]
+    assert len(cumulative_us) == 1
+    assert cumulative_us[0] < IMPORT_TIME_BUDGET_US
+
+
+def test_import_is_lazy():
+    """Test that pandera and the schema are only loaded on first access."""
+    stdout = _run_python(
+        "import sys, emtest\n"
+        "print('pandera' in sys.modules)\n"
+        "emtest.emdat_schema\n"
+        "print('pandera' in sys.modules)\n"
+    ).stdout
+    assert stdout.split() == ["False", "True"]
@@ -0,0 +1,120 @@
+import warnings
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from pandera import Check, Column
+
+from emtest import emdat_schema, incremental
+from emtest.incremental import (
+    get_incremental_validation_report,
+    schema_fingerprint,
+)
+from emtest.utils import get_validation_report, set_warnings_to_errors
+
+REPORT_COLUMNS = [
+    "schema_context", "column", "check", "failure_case", "index"
+]
+
+
+def sort_report(report: pd.DataFrame) -> pd.DataFrame:
+    return (
+        report[REPORT_COLUMNS].astype(str)
+        .sort_values(REPORT_COLUMNS).reset_index(drop=True)
+    )
+
+
+@pytest.fixture(autouse=True)
+def ignore_schema_warnings():
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        yield
+
+
+def test_incremental_validation_report(fake_emdat, tmp_path, monkeypatch):
+    pytest.importorskip("pyarrow")
+    state_file = tmp_path / "state.parquet"
+    first = get_incremental_validation_report(
+        fake_emdat, emdat_schema, state_file
+    )
+    full = get_validation_report(fake_emdat, emdat_schema)
+    assert sort_report(first).equals(sort_report(full))
+
+    updated = fake_emdat.iloc[5:].copy()
+    updated.loc[updated.index[0], "ISO"] = "XXX"
+    updated.loc[updated.index[0], "Last Update"] = pd.Timestamp("2024-01-01")
+    updated = pd.concat([updated, fake_emdat.iloc[:1]])
+
+    validated = []
+    get_failure_cases = incremental._get_failure_cases
+
+    def count_rows(df, schema):
+        validated.append(len(df))
+        return get_failure_cases(df, schema)
+
+    monkeypatch.setattr(incremental, "_get_failure_cases", count_rows)
+    second = get_incremental_validation_report(
+        updated, emdat_schema, state_file
+    )
+    assert validated == [1]
+    full = get_validation_report(updated, emdat_schema)
+    assert sort_report(second).equals(sort_report(full))
+    assert "XXX" in second["failure_case"].tolist()
+    # Failure cases keep their types between runs
+    kept = second[second["column"] == "Last Update"]["failure_case"]
+    assert len(kept) > 0 and all(isinstance(value, pd.Timestamp) for value in kept)
+
+
+def test_incremental_validation_state(valid_df, tmp_path):
+    pytest.importorskip("pyarrow")
+    state_file = tmp_path / "state.parquet"
+    get_incremental_validation_report(valid_df, emdat_schema, state_file)
+    assert pd.read_parquet(state_file)["index"].tolist() == \
+        valid_df.index.tolist()
+    fingerprint = (tmp_path / "state.parquet.json").read_text()
+    assert schema_fingerprint(emdat_schema) in fingerprint
+    # A corrupt state is rebuilt by a full validation
+    state_file.write_bytes(b"corrupt")
+    assert incremental._load_state(
+        state_file, schema_fingerprint(emdat_schema)
+    ) is None
+    get_incremental_validation_report(valid_df, emdat_schema, state_file)
+    assert incremental._load_state(
+        state_file, schema_fingerprint(emdat_schema)
+    ) is not None
+
+
+def test_incremental_validation_report_duplicates(valid_df, tmp_path):
+    state_file = tmp_path / "state.parquet"
+    assert get_incremental_validation_report(
+        valid_df, emdat_schema, state_file
+    ) is None
+    report = get_incremental_validation_report(
+        pd.concat([valid_df, valid_df]), emdat_schema, state_file
+    )
+    assert report["check"].tolist() == ["field_uniqueness"] * 2
+
+
+def test_schema_fingerprint():
+    assert schema_fingerprint(emdat_schema) == schema_fingerprint(emdat_schema)
+    assert schema_fingerprint(emdat_schema) != schema_fingerprint(
+        set_warnings_to_errors(emdat_schema)
+    )
+    assert schema_fingerprint(emdat_schema) != schema_fingerprint(
+        emdat_schema, add_warnings=True
+    )
+
+
+def test_schema_fingerprint_check_source(monkeypatch):
+    check = Check(lambda s: s.notna(), name="check_disno")
+    schema = emdat_schema.add_columns({"Extra": Column(checks=check)})
+    fingerprint = schema_fingerprint(schema)
+    # Changing the code of a check without renaming it changes the fingerprint
+    assert Path(__file__) in incremental._source_files([check])
+    read_bytes = Path.read_bytes
+    monkeypatch.setattr(
+        Path, "read_bytes",
+        lambda path: read_bytes(path) + b"#" if path == Path(__file__)
+        else read_bytes(path)
+    )
+    assert schema_fingerprint(schema) != fingerprint
@@ -0,0 +1,102 @@
+import warnings
+
+import pandas as pd
+import pytest
+
+from pandera import Check, Column, DataFrameSchema
+
+from emtest import emdat_schema
+from emtest.profiling import CheckProfiler, count_checks, instrument_checks
+from emtest.utils import get_validation_report
+
+REPORT_COLUMNS = [
+    "schema_context", "column", "check", "failure_case", "index"
+]
+
+
+def sort_report(report: pd.DataFrame) -> pd.DataFrame:
+    return (
+        report[REPORT_COLUMNS].astype(str)
+        .sort_values(REPORT_COLUMNS).reset_index(drop=True)
+    )
+
+
+@pytest.fixture(autouse=True)
+def ignore_schema_warnings():
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        yield
+
+
+@pytest.mark.parametrize("n_threads", [None, 4])
+def test_profiled_validation_report(fake_emdat, n_threads):
+    events = []
+    profiler = CheckProfiler(callback=events.append, trace_memory=True)
+    profiled = get_validation_report(
+        fake_emdat, emdat_schema, add_warnings=True, n_threads=n_threads,
+        profiler=profiler
+    )
+    report = get_validation_report(fake_emdat, emdat_schema,
+                                   add_warnings=True)
+    assert sort_report(profiled).equals(sort_report(report))
+
+    total = count_checks(emdat_schema)
+    assert len(events) == total
+    assert sorted(e.completed for e in events) == list(range(1, total + 1))
+    assert all(e.total == total for e in events)
+
+    profile = profiler.to_frame()
+    assert len(profile) == total
+    assert (profile["calls"] == 1).all()
+    assert (profile["wall_time"] > 0).all()
+    assert (profile["peak_memory"] >= 0).all()
+    range_check = profile.loc[("Column", "Latitude")]
+    assert range_check["rows"].iloc[0] == len(fake_emdat)
+    assert range_check["failures"].iloc[0] == (
+        (report["schema_context"] == "Column")
+        & (report["column"] == "Latitude")
+    ).sum()
+
+
+def test_profiled_builtin_and_element_wise_checks():
+    schema = DataFrameSchema({
+        "a": Column(float, checks=[
+            Check.in_range(0, 10),
+            Check(lambda x: x != 5, element_wise=True, name="not_five"),
+        ]),
+    })
+    df = pd.DataFrame({"a": [1., 5., 20.]})
+    profiler = CheckProfiler()
+    get_validation_report(df, schema, profiler=profiler)
+    profile = profiler.to_frame().droplevel(["schema_context", "column",
+                                             "error"])
+    assert profile.loc["in_range", "failures"] == 1
+    assert profile.loc["not_five", "failures"] == 1
+    assert (profile["rows"] == 3).all()
+
+
+def test_instrument_checks():
+    instrumented = instrument_checks(emdat_schema)
+    for name, column in emdat_schema.columns.items():
+        for check, profiled in zip(column.checks,
+                                   instrumented.columns[name].checks):
+            # New checks with the same options, the schema is unchanged
+            assert type(check) is Check and profiled is not check
+            assert isinstance(profiled, Check)
+            assert (profiled.name, profiled.error, profiled.statistics,
+                    profiled.element_wise, profiled.raise_warning) == \
+                (check.name, check.error, check.statistics,
+                 check.element_wise, check.raise_warning)
+
+
+def test_profiler_inactive(fake_emdat):
+    profiler = CheckProfiler()
+    get_validation_report(fake_emdat, emdat_schema, profiler=profiler)
+    n_events = len(profiler.events)
+    # The instrumented schema is reused, without reporting to the profiler
+    get_validation_report(fake_emdat, emdat_schema)
+    assert len(profiler.events) == n_events
+    assert profiler.to_frame()["peak_memory"].isna().all()
+    with pytest.raises(ValueError):
+        get_validation_report(fake_emdat, emdat_schema, n_workers=2,
+                              profiler=profiler)
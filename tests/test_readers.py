@@ -0,0 +1,70 @@
+import shutil
+import warnings
+
+import pandas as pd
+import pytest
+
+from emtest import emdat_schema
+from emtest.readers import (
+    has_trusted_types,
+    read_emdat,
+    read_emdat_excel_chunks,
+)
+from emtest.utils import get_streaming_validation_report, get_validation_report
+
+
+def test_read_emdat_excel_chunks(fake_emdat_file, fake_emdat):
+    chunks = list(read_emdat_excel_chunks(fake_emdat_file, chunk_size=30))
+    assert [len(chunk) for chunk in chunks] == [30, 30, 30, 10]
+    df = pd.concat(chunks)
+    assert df.index.name == "DisNo."
+    assert df.columns.tolist() == fake_emdat.columns.tolist()
+    assert df["Entry Date"].dtype.kind == "M"
+    assert df["Start Year"].dtype.kind == "i"
+    pd.testing.assert_frame_equal(
+        df, fake_emdat, check_dtype=False, check_index_type=False
+    )
+
+
+def test_streaming_report_from_excel_chunks(fake_emdat_file, fake_emdat):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        expected = get_validation_report(fake_emdat, emdat_schema)
+        report = get_streaming_validation_report(
+            read_emdat_excel_chunks(fake_emdat_file, chunk_size=30),
+            emdat_schema
+        )
+    columns = ["column", "check", "index"]
+    assert sorted(map(tuple, report[columns].astype(str).values)) == \
+        sorted(map(tuple, expected[columns].astype(str).values))
+
+
+def test_read_emdat_trusted_types(fake_emdat_file, fake_emdat):
+    df = read_emdat(fake_emdat_file, cache=False)
+    assert has_trusted_types(df)
+    assert has_trusted_types(df.iloc[:10])
+    assert not has_trusted_types(fake_emdat)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        trusted = get_validation_report(df, emdat_schema)
+        coerced = get_validation_report(df, emdat_schema, trusted_types=False)
+    pd.testing.assert_frame_equal(trusted, coerced)
+    assert emdat_schema.coerce
+
+
+def test_read_emdat_cache(fake_emdat_file, tmp_path):
+    pytest.importorskip("pyarrow")
+    source = tmp_path / "emdat.xlsx"
+    shutil.copy(fake_emdat_file, source)
+    df = read_emdat(source)
+    cache_files = list(tmp_path.glob("emdat.xlsx.*.arrow"))
+    assert len(cache_files) == 1
+    cached = read_emdat(source)
+    pd.testing.assert_frame_equal(cached, df)
+    assert has_trusted_types(cached)
+    # Editing the source replaces the cache
+    df.iloc[:5].to_excel(source)
+    assert len(read_emdat(source)) == 5
+    new_cache_files = list(tmp_path.glob("emdat.xlsx.*.arrow"))
+    assert len(new_cache_files) == 1
+    assert new_cache_files != cache_files
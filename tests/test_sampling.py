@@ -0,0 +1,83 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from emtest import emdat_schema
+from emtest.sampling import (
+    estimate_failure_rates,
+    passes_gate,
+    stratified_sample,
+    wilson_interval,
+)
+from emtest.synthetic import generate_emdat
+from emtest.utils import get_validation_report
+
+
+@pytest.fixture(autouse=True)
+def ignore_schema_warnings():
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        yield
+
+
+def test_stratified_sample():
+    df = generate_emdat(2000, seed=0)
+    positions, weights = stratified_sample(df, 0.1, seed=0)
+    assert (np.diff(positions) > 0).all()
+    strata = df.groupby(["Disaster Type", "Start Year"]).size()
+    sampled = df.iloc[positions].groupby(["Disaster Type", "Start Year"])
+    # Every stratum is sampled and weights sum to its size
+    assert len(sampled) == len(strata)
+    totals = pd.Series(weights).groupby(
+        pd.MultiIndex.from_frame(
+            df.iloc[positions][["Disaster Type", "Start Year"]]
+        )
+    ).sum()
+    assert np.allclose(totals.sort_index(), strata.sort_index())
+    assert np.array_equal(
+        positions, stratified_sample(df, 0.1, seed=0)[0]
+    )
+    all_rows, all_weights = stratified_sample(df, 1.)
+    assert len(all_rows) == len(df) and (all_weights == 1).all()
+    with pytest.raises(ValueError):
+        stratified_sample(df, 0.)
+
+
+def test_estimate_failure_rates():
+    df = generate_emdat(4000, error_rates={"check_month": 0.1}, seed=0)
+    estimates = estimate_failure_rates(df, emdat_schema, 0.25, seed=0)
+    month = estimates.set_index(["column", "check"]).loc[
+        ("Start Month", "Invalid Start Month value")
+    ]
+    report = get_validation_report(df, emdat_schema)
+    actual = report[report["column"] == "Start Month"]["index"].nunique() \
+        / len(df)
+    assert month["ci_low"] <= actual <= month["ci_high"]
+    assert estimates.iloc[0]["failure_rate"] > 0
+    # Checks without failures are listed with a zero failure rate
+    valid = estimates[estimates["failing_rows"] == 0]
+    assert len(valid) > 0 and (valid["failure_rate"] == 0).all()
+    assert not passes_gate(estimates, 0.01)
+    assert passes_gate(estimates, 0.5)
+    sampled = get_validation_report(
+        df, emdat_schema, sample_fraction=0.25
+    )
+    assert sampled.columns.equals(estimates.columns)
+
+
+def test_estimate_failure_rates_missing_column():
+    df = generate_emdat(500, seed=0).drop(columns="Country")
+    estimates = estimate_failure_rates(df, emdat_schema, 0.1, seed=0)
+    missing = estimates[estimates["check"] == "column_in_dataframe"]
+    assert (missing["failure_rate"] == 1).all()
+    assert not passes_gate(estimates)
+
+
+def test_wilson_interval():
+    low, high = wilson_interval(0., 100)
+    assert low == 0 and 0 < high < 0.05
+    low, high = wilson_interval(0.5, 100)
+    assert low < 0.5 < high
+    assert wilson_interval(0.5, 0) == (0., 1.)
@@ -0,0 +1,75 @@
+import warnings
+
+import pandas as pd
+import pytest
+
+from emtest import emdat_schema
+from emtest.summary import ReportSummary
+from emtest.utils import get_summary_report, get_validation_report
+
+KEYS = ["schema_context", "column", "check"]
+
+
+@pytest.fixture(autouse=True)
+def ignore_schema_warnings():
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        yield
+
+
+def test_summary_report(fake_emdat):
+    full = get_validation_report(fake_emdat, emdat_schema, add_warnings=True)
+    summary = get_summary_report(
+        fake_emdat, emdat_schema, add_warnings=True, max_samples=2,
+        chunk_size=7
+    )
+    counts = full.groupby(KEYS, dropna=False).agg(
+        failure_cases=("index", "size"), failing_rows=("index", "nunique")
+    )
+    summary = summary.set_index(KEYS)
+    assert summary.index.sort_values().equals(counts.index.sort_values())
+    pd.testing.assert_frame_equal(
+        summary[["failure_cases", "failing_rows"]].loc[counts.index], counts
+    )
+    for key, row in summary.iterrows():
+        cases = full[(full[KEYS] == key).all(axis=1)]
+        assert 1 <= len(row["sample_index"]) <= 2
+        assert set(row["sample_index"]) <= set(cases["index"])
+        assert len(row["sample_failure_cases"]) <= 2
+    report = get_validation_report(
+        fake_emdat, emdat_schema, add_warnings=True, summary=True
+    )
+    assert report.columns.tolist() == [*KEYS, *summary.columns]
+    assert report["failure_cases"].sum() == len(full)
+
+
+def test_summary_report_schema_level(valid_df):
+    df = pd.concat([valid_df] * 3).drop(columns="Country")
+    summary = get_summary_report(df, emdat_schema, chunk_size=1)
+    missing = summary[summary["check"] == "column_in_dataframe"]
+    assert missing["failure_cases"].tolist() == [1]
+    duplicates = summary[summary["check"] == "field_uniqueness"]
+    assert duplicates["failure_cases"].tolist() == [3]
+    assert duplicates["sample_index"].tolist() == [["2024-0001-BEL"]]
+    assert get_summary_report(valid_df, emdat_schema) is None
+
+
+def test_report_summary_samples():
+    summary = ReportSummary(max_samples=2)
+    report = pd.DataFrame({
+        "schema_context": "Column", "column": "Country",
+        "check": "Countries not in reference list",
+        "failure_case": ["Atlantis", "Atlantis", None, "Mu"],
+        "index": ["2024-0001-BEL", "2024-0002-BEL", "2024-0003-BEL",
+                  "2024-0004-BEL"],
+    })
+    summary.update(report)
+    summary.update(report)
+    frame = summary.to_frame()
+    assert frame["failure_cases"].tolist() == [8]
+    assert frame["sample_failure_cases"].tolist() == [["Atlantis", None]]
+    assert frame["sample_index"].tolist() == [
+        ["2024-0001-BEL", "2024-0002-BEL"]
+    ]
+    with pytest.raises(ValueError):
+        ReportSummary(max_samples=-1)
@@ -0,0 +1,53 @@
+import warnings
+
+import pandas as pd
+import pytest
+
+from emtest import emdat_schema
+from emtest.synthetic import INJECTED_CHECKS, generate_emdat
+from emtest.utils import get_validation_report
+
+
+@pytest.fixture(autouse=True)
+def ignore_schema_warnings():
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        yield
+
+
+def check_errors(name: str) -> set:
+    """Return the report labels of the checks named `name`"""
+    if name == "field_uniqueness":
+        return {name}
+    components = [emdat_schema.index, *emdat_schema.columns.values()]
+    checks = [c for comp in components for c in comp.checks]
+    return {
+        check.error or check.name
+        for check in [*checks, *emdat_schema.checks] if check.name == name
+    }
+
+
+def test_generate_emdat():
+    df = generate_emdat(2000, seed=0)
+    assert list(df.columns) == list(emdat_schema.columns)
+    assert df.index.name == "DisNo."
+    assert df.index.is_unique
+    assert get_validation_report(df, emdat_schema, add_warnings=True) is None
+    pd.testing.assert_frame_equal(df, generate_emdat(2000, seed=0))
+
+
+@pytest.mark.parametrize("name", list(INJECTED_CHECKS))
+def test_generate_emdat_errors(name):
+    df = generate_emdat(300, error_rates={name: 0.1}, seed=0)
+    report = get_validation_report(df, emdat_schema, add_warnings=True)
+    assert report is not None
+    assert check_errors(name) <= set(report["check"])
+
+
+def test_generate_emdat_error_rates():
+    with pytest.raises(ValueError):
+        generate_emdat(10, error_rates={"unknown_check": 0.1})
+    with pytest.raises(ValueError):
+        generate_emdat(10, error_rates={"check_country": 1.5})
+    df = generate_emdat(1000, error_rates={"check_country": 1.}, seed=0)
+    assert (df["Country"] == "Atlantis").all()
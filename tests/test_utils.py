@@ -0,0 +1,268 @@
+import copy
+import warnings
+
+import pandas as pd
+import pytest
+
+from emtest import emdat_schema, utils
+from emtest.readers import get_schema_dtypes
+from emtest.utils import (
+    COMPLETE_ATTR,
+    compact_emdat,
+    get_fail_fast_validation_report,
+    get_parallel_validation_report,
+    get_streaming_validation_report,
+    get_validation_report,
+    memory_report,
+    rechunk,
+    schema_variant,
+    without_coercion,
+)
+
+REPORT_COLUMNS = [
+    "schema_context", "column", "check", "failure_case", "index"
+]
+
+
+def sort_report(report: pd.DataFrame) -> pd.DataFrame:
+    return (
+        report[REPORT_COLUMNS].astype(str)
+        .sort_values(REPORT_COLUMNS).reset_index(drop=True)
+    )
+
+
+@pytest.fixture(autouse=True)
+def ignore_schema_warnings():
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        yield
+
+
+def test_validation_report(valid_df, fake_emdat):
+    assert get_validation_report(valid_df, emdat_schema) is None
+    report = get_validation_report(fake_emdat, emdat_schema, add_warnings=True)
+    assert "Invalid GAUL codes" in report["check"].tolist()
+    assert "Start year differs from DisNo year" in report["check"].tolist()
+    # Wide check failures are only reported for relevant columns
+    lat_lon = report[
+        report["check"] == "Missing latitude or longitude coordinates"
+    ]
+    assert set(lat_lon["column"]) <= {"Latitude", "Longitude"}
+
+
+def test_deduplicate_wide_errors_by_check_name(fake_emdat):
+    schema = copy.deepcopy(emdat_schema)
+    schema.checks[0].error = "Lat/lon mismatch"
+    full = get_validation_report(fake_emdat, schema, deduplicate_wide=False)
+    report = get_validation_report(fake_emdat, schema)
+    lat_lon = report[report["check"] == "Lat/lon mismatch"]
+    assert len(lat_lon) > 0
+    assert set(lat_lon["column"]) <= {"Latitude", "Longitude"}
+    # Failure cases of other checks are kept
+    other = full["schema_context"] != "DataFrameSchema"
+    assert other.sum() == (report["schema_context"] != "DataFrameSchema").sum()
+
+
+def test_schema_variant(fake_emdat):
+    assert schema_variant(emdat_schema) is emdat_schema
+    variant = schema_variant(emdat_schema, add_warnings=True)
+    assert schema_variant(emdat_schema, add_warnings=True) is variant
+    assert not any(
+        check.raise_warning
+        for column in variant.columns.values() for check in column.checks
+    )
+    assert any(
+        check.raise_warning
+        for column in emdat_schema.columns.values() for check in column.checks
+    )
+    trusted = schema_variant(
+        emdat_schema, trusted_types=True, unique_index=False, strict=False
+    )
+    assert not trusted.coerce and not trusted.index.unique
+    assert not trusted.strict
+    assert emdat_schema.coerce and emdat_schema.index.unique
+    assert emdat_schema.strict
+    # Overriding `strict` leaves the schema and its cached variants unchanged
+    filtering = schema_variant(emdat_schema, strict="filter")
+    assert filtering.strict == "filter"
+    assert emdat_schema.strict is True and variant.strict is True
+
+    selected = schema_variant(
+        emdat_schema, checks=["check_disno_vs_iso", "check_iso3_code"]
+    )
+    report = get_validation_report(fake_emdat, selected, add_warnings=True)
+    assert set(report["check"]) == {
+        "ISO differs from DisNo ISO", "ISO3 code not in reference list"
+    }
+
+
+def test_without_coercion(fake_emdat):
+    schema = without_coercion(emdat_schema)
+    assert not schema.coerce
+    # The copy does not share its state with the schema
+    assert schema.__dict__ is not emdat_schema.__dict__
+    assert emdat_schema.coerce
+    get_validation_report(fake_emdat, emdat_schema, trusted_types=True)
+    assert emdat_schema.coerce
+    assert get_validation_report(fake_emdat, emdat_schema) is not None
+
+
+def test_rechunk(fake_emdat):
+    assert [len(c) for c in rechunk(fake_emdat, chunk_size=30)] == [
+        30, 30, 30, 10
+    ]
+    row_bytes = fake_emdat.memory_usage(deep=True).sum() / len(fake_emdat)
+    chunks = list(rechunk([fake_emdat], memory_budget=int(row_bytes * 25)))
+    assert all(len(c) <= 25 for c in chunks)
+    assert sum(len(c) for c in chunks) == len(fake_emdat)
+
+
+def test_streaming_validation_report(fake_emdat):
+    full = get_validation_report(fake_emdat, emdat_schema, add_warnings=True)
+    streamed = get_streaming_validation_report(
+        rechunk(fake_emdat, chunk_size=7), emdat_schema, add_warnings=True
+    )
+    assert sort_report(streamed).equals(sort_report(full))
+
+
+def test_streaming_validation_report_uniqueness(valid_df):
+    other = valid_df.rename(index=lambda disno: "2024-0002-BEL")
+    chunks = [valid_df, valid_df.copy(), other]
+    report = get_streaming_validation_report(chunks, emdat_schema)
+    assert report["check"].tolist() == ["field_uniqueness"] * 2
+    assert report["index"].tolist() == ["2024-0001-BEL"] * 2
+    full = get_validation_report(pd.concat(chunks), emdat_schema)
+    assert sort_report(report).equals(sort_report(full))
+
+
+def test_parallel_validation_report(fake_emdat):
+    full = get_validation_report(fake_emdat, emdat_schema, add_warnings=True)
+    parallel = get_validation_report(
+        fake_emdat, emdat_schema, add_warnings=True, n_workers=2
+    )
+    assert sort_report(parallel).equals(sort_report(full))
+
+
+def test_parallel_validation_report_uniqueness(valid_df):
+    other = valid_df.rename(index=lambda disno: "2024-0002-BEL")
+    df = pd.concat([valid_df, other, valid_df, valid_df])
+    report = get_parallel_validation_report(
+        df, emdat_schema, n_workers=2, partitions_per_worker=2
+    )
+    assert report["check"].tolist() == ["field_uniqueness"] * 3
+    assert report["index"].tolist() == ["2024-0001-BEL"] * 3
+    assert get_parallel_validation_report(
+        valid_df, emdat_schema, n_workers=2
+    ) is None
+    # Schema-level failure cases are reported once
+    missing = get_parallel_validation_report(
+        df.drop(columns="Country"), emdat_schema, n_workers=2
+    )
+    assert (missing["check"] == "column_in_dataframe").sum() == 1
+
+
+def test_threaded_validation_report(fake_emdat):
+    for df in (fake_emdat, fake_emdat.drop(columns="Country")):
+        for kwargs in ({"add_warnings": True}, {"deduplicate_wide": False}):
+            sequential = get_validation_report(df, emdat_schema, **kwargs)
+            threaded = get_validation_report(
+                df, emdat_schema, n_threads=4, **kwargs
+            )
+            assert sort_report(threaded).equals(sort_report(sequential))
+
+
+def test_fail_fast_validation_report(fake_emdat):
+    full = get_validation_report(fake_emdat, emdat_schema, add_warnings=True)
+    report = get_validation_report(
+        fake_emdat, emdat_schema, add_warnings=True, max_failures=2
+    )
+    rows = report[["check", "index"]].dropna().drop_duplicates()
+    assert rows["check"].value_counts().max() <= 2
+    assert set(report["check"]) == set(full["check"])
+    # Failure cases are those of the full report
+    merged = sort_report(report).merge(sort_report(full), how="left",
+                                       indicator=True)
+    assert (merged["_merge"] == "both").all()
+    # Chunks of a single row still find every failing check
+    chunked = get_fail_fast_validation_report(
+        fake_emdat, emdat_schema, 1, add_warnings=True, first_chunk_size=1
+    )
+    assert set(chunked["check"]) == set(full["check"])
+    with pytest.raises(ValueError):
+        get_validation_report(fake_emdat, emdat_schema, max_failures=0)
+
+
+def test_fail_fast_validation_report_stop_early(fake_emdat, valid_df,
+                                                 monkeypatch):
+    full = get_fail_fast_validation_report(
+        fake_emdat, emdat_schema, 1, first_chunk_size=1
+    )
+    assert full.attrs[COMPLETE_ATTR]
+    validated = []
+    get_failure_cases = utils._get_failure_cases
+
+    def count_rows(df, schema):
+        validated.append(len(df))
+        return get_failure_cases(df, schema)
+
+    monkeypatch.setattr(utils, "_get_failure_cases", count_rows)
+    report = get_fail_fast_validation_report(
+        fake_emdat, emdat_schema, 1, first_chunk_size=1, stop_early=True
+    )
+    # Stopped once the checks failing on the first rows were exhausted
+    assert not report.attrs[COMPLETE_ATTR]
+    assert sum(validated) < len(fake_emdat)
+    assert set(report["check"]) <= set(full["check"])
+    assert get_fail_fast_validation_report(
+        valid_df, emdat_schema, 1, stop_early=True
+    ) is None
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"sample_fraction": 0.5, "max_failures": 5},
+    {"summary": True, "max_failures": 5},
+    {"summary": True, "n_workers": 2},
+    {"max_failures": 5, "n_threads": 2},
+])
+def test_validation_report_conflicting_options(fake_emdat, kwargs):
+    with pytest.raises(ValueError, match="cannot be combined"):
+        get_validation_report(fake_emdat, emdat_schema, **kwargs)
+
+
+def test_fail_fast_validation_report_uniqueness(valid_df):
+    other = valid_df.rename(index=lambda disno: "2024-0002-BEL")
+    df = pd.concat([valid_df, valid_df, other, valid_df, other])
+    report = get_fail_fast_validation_report(
+        df, emdat_schema, 1, first_chunk_size=1
+    )
+    # Duplicates across chunks, of the first duplicated DisNo. only
+    assert set(report["check"]) == {"field_uniqueness"}
+    assert set(report["index"]) == {"2024-0001-BEL"}
+    assert get_fail_fast_validation_report(
+        valid_df, emdat_schema, 1
+    ) is None
+
+
+def test_compact_emdat(fake_emdat):
+    pytest.importorskip("pyarrow")
+    dtypes = get_schema_dtypes()
+    objects = fake_emdat.astype({
+        c: object for c in fake_emdat.columns
+        if pd.api.types.is_string_dtype(dtypes[c].type)
+    })
+    objects.index = objects.index.astype(object)
+    compact = compact_emdat(objects)
+    assert isinstance(compact["Country"].dtype, pd.StringDtype)
+    assert compact["Country"].dtype.storage.startswith("pyarrow")
+    assert compact["Country"].dtype == compact.index.dtype
+    assert compact["Total Deaths"].dtype == objects["Total Deaths"].dtype
+    pd.testing.assert_frame_equal(compact, objects, check_dtype=False,
+                                  check_index_type=False)
+    pd.testing.assert_frame_equal(
+        sort_report(get_validation_report(compact, emdat_schema)),
+        sort_report(get_validation_report(objects, emdat_schema)),
+    )
+    report = memory_report(compact)
+    assert report.index[0] in ["Index", *compact.columns]
+    assert report["share"].sum() == pytest.approx(1)
+    assert report["bytes"].sum() < 0.6 * memory_report(objects)["bytes"].sum()
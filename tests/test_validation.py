@@ -34,6 +34,13 @@ def test_invalid_disno_index(valid_df):
         with pytest.raises(pa.errors.SchemaError, match="Invalid DisNo. Pattern"):
             emdat_schema.validate(valid_df)
 
+def test_disno_iso_mismatch(valid_df):
+    """Test that an ISO code different from the DisNo. suffix fails."""
+    valid_df.loc[valid_df.index[0], "ISO"] = "FRA"
+    valid_df.loc[valid_df.index[0], "Country"] = "France"
+    with pytest.raises(pa.errors.SchemaError, match="ISO differs from DisNo ISO"):
+        emdat_schema.validate(valid_df)
+
 def test_magnitude_range_checks(valid_df):
     """Test magnitude range checks for specific disaster types."""
     # Earthquake magnitude should be between 3 and 10
@@ -93,6 +100,14 @@ def test_date_consistency_cross_year_no_false_positive(valid_df):
     valid_df.loc[valid_df.index[0], "End Month"] = 3.0
     emdat_schema.validate(valid_df)
 
+def test_invalid_calendar_date(valid_df):
+    """Test that a day that does not exist in its month fails."""
+    valid_df.loc[valid_df.index[0], "Start Month"] = 2.0
+    valid_df.loc[valid_df.index[0], "Start Day"] = 30.0
+    valid_df.loc[valid_df.index[0], "End Month"] = 3.0
+    with pytest.raises(pa.errors.SchemaError, match="Invalid start date"):
+        emdat_schema.validate(valid_df)
+
 def test_lat_lon_consistency(valid_df):
     """Test that having only one of Latitude/Longitude fails."""
     valid_df.loc[valid_df.index[0], "Latitude"] = 50.0
@@ -105,3 +120,11 @@ def test_json_admin_units(valid_df):
     valid_df.loc[valid_df.index[0], "Admin Units"] = "Not a JSON"
     with pytest.raises(pa.errors.SchemaError, match="Invalid JSON string"):
         emdat_schema.validate(valid_df)
+
+def test_invalid_gaul_codes(valid_df):
+    """Test that an unknown GAUL code in Admin Units fails."""
+    valid_df.loc[valid_df.index[0], "Admin Units"] = (
+        '[{"adm2_code":198888,"adm2_name":"Honolulu"}]'
+    )
+    with pytest.raises(pa.errors.SchemaError, match="Invalid GAUL codes"):
+        emdat_schema.validate(valid_df)
@@ -0,0 +1,105 @@
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from emtest.validation_data import areas, classification, data_loader
+from emtest.validation_data.data_loader import (
+    GAUL_HIERARCHY_ENV,
+    REFERENCE_FILES,
+    load_GAUL_hierarchy,
+    load_reference_snapshot,
+)
+
+
+def test_lazy_reference_lists():
+    assert "BEL" in areas.ISO3_LIST
+    assert "Belgium" in areas.COUNTRY_LIST
+    assert 1232 in areas.ADM1_GAUL_LIST
+    assert np.all(np.diff(areas.ADM2_GAUL_CODES) > 0)
+    assert "nat-bio-epi-vir" in classification.KEY_LIST
+    assert len(classification.GROUP_LIST) == len(set(classification.GROUP_LIST))
+    with pytest.raises(AttributeError):
+        areas.NOT_A_REFERENCE_LIST
+
+
+def test_reference_snapshot_rebuilt_on_change(tmp_path, monkeypatch):
+    files = {}
+    for name, file in REFERENCE_FILES.items():
+        files[name] = tmp_path / file.name
+        shutil.copy(file, files[name])
+    cache_dir = tmp_path / "cache"
+
+    arrays = load_reference_snapshot(cache_dir, files)
+    snapshots = list(cache_dir.glob("reference_*.npz"))
+    assert len(snapshots) == 1
+
+    # Reloading an up-to-date snapshot does not parse the source files
+    def fail(files):
+        raise AssertionError("snapshot should not be rebuilt")
+
+    monkeypatch.setattr(data_loader, "build_reference_arrays", fail)
+    reloaded = load_reference_snapshot(cache_dir, files)
+    assert reloaded.keys() == arrays.keys()
+    for key in arrays:
+        np.testing.assert_array_equal(reloaded[key], arrays[key])
+    monkeypatch.undo()
+
+    # Editing a source file triggers a rebuild and removes the stale snapshot
+    with open(files["gaul_adm1"], "a", encoding="utf-8") as f:
+        f.write("999999\n")
+    rebuilt = load_reference_snapshot(cache_dir, files)
+    assert 999999 in rebuilt["adm1_gaul_sorted"]
+    assert list(cache_dir.glob("reference_*.npz")) != snapshots
+    assert len(list(cache_dir.glob("reference_*.npz"))) == 1
+
+
+def test_reference_snapshot_corrupt(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    arrays = load_reference_snapshot(cache_dir)
+    snapshot, = cache_dir.glob("reference_*.npz")
+    # A truncated snapshot is rebuilt
+    snapshot.write_bytes(snapshot.read_bytes()[:100])
+    rebuilt = load_reference_snapshot(cache_dir)
+    np.testing.assert_array_equal(rebuilt["iso3"], arrays["iso3"])
+    snapshot.unlink()
+
+    # A failed write leaves no temporary file behind
+    def fail(file, **arrays):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(np, "savez", fail)
+    assert load_reference_snapshot(cache_dir).keys() == arrays.keys()
+    assert list(cache_dir.iterdir()) == []
+
+
+def test_gaul_hierarchy_file(gaul_hierarchy_file, tmp_path, monkeypatch):
+    monkeypatch.setenv(GAUL_HIERARCHY_ENV, str(gaul_hierarchy_file))
+    assert data_loader.gaul_hierarchy_file() == gaul_hierarchy_file
+    assert len(load_GAUL_hierarchy()) == 5
+    monkeypatch.setenv(GAUL_HIERARCHY_ENV, str(tmp_path / "missing.csv"))
+    with pytest.raises(FileNotFoundError):
+        data_loader.gaul_hierarchy_file()
+
+
+def test_gaul_hierarchy_check_enabled(gaul_hierarchy_file):
+    # The schema is built on import, in a fresh interpreter
+    script = (
+        "from emtest import emdat_schema\n"
+        "names = [check.name for check in emdat_schema.checks]\n"
+        "print('check_GAUL_hierarchy' in names)\n"
+    )
+    env = {**os.environ, GAUL_HIERARCHY_ENV: str(gaul_hierarchy_file)}
+    root = str(Path(__file__).parent.parent)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [root, env.get("PYTHONPATH")])
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], env=env, capture_output=True,
+        text=True, check=True
+    )
+    assert result.stdout.strip() == "True"